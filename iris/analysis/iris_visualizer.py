@@ -9,10 +9,13 @@ from typing import Dict, List, Any
 from pathlib import Path
 import json
 
+import numpy as np
+
 try:
     import matplotlib
     matplotlib.use('Agg')  # Backend non-interactif
     import matplotlib.pyplot as plt
+    from matplotlib.figure import Figure
     MATPLOTLIB_AVAILABLE = True
 except ImportError:
     MATPLOTLIB_AVAILABLE = False
@@ -96,6 +99,60 @@ class IRISVisualizer:
 
         print(f"  ✓ Graphique sauvegardé: {output_path}")
 
+    def plot_shock_comparison(self, results: Dict[str, Dict[str, List]],
+                              shock_time: int = 500) -> None:
+        """
+        Compare θ et le Gini de plusieurs scénarios sur un même graphique.
+
+        La figure est construite sans pyplot (Figure objet) : pas d'état
+        global partagé, l'appel peut donc tourner dans un thread de fond.
+
+        Args:
+            results: Historiques par nom de scénario
+            shock_time: Moment du choc (ligne verticale)
+        """
+        if not MATPLOTLIB_AVAILABLE:
+            print("⚠ matplotlib non disponible - graphiques désactivés")
+            return
+
+        fig = Figure(figsize=(14, 10))
+        axes = fig.subplots(2, 1, sharex=True)
+        fig.suptitle('Comparaison des scénarios IRIS', fontsize=16, fontweight='bold')
+
+        for name, history in results.items():
+            if 'thermometer' not in history:
+                continue
+            time = history.get('time', range(len(history['thermometer'])))
+            axes[0].plot(time, history['thermometer'], label=name, linewidth=1.2)
+            if 'gini_coefficient' in history:
+                axes[1].plot(time, history['gini_coefficient'], label=name, linewidth=1.2)
+
+        # Subplot 1: Thermomètre θ
+        ax = axes[0]
+        ax.axhline(y=1.0, color='r', linestyle='--', linewidth=1, label='Cible (θ=1)')
+        ax.axvline(x=shock_time, color='gray', linestyle=':', linewidth=1, label='Choc')
+        ax.set_ylabel('θ')
+        ax.set_title('Thermomètre θ = D/V_on')
+        ax.legend(fontsize=8)
+        ax.grid(True, alpha=0.3)
+
+        # Subplot 2: Gini
+        ax = axes[1]
+        ax.axvline(x=shock_time, color='gray', linestyle=':', linewidth=1)
+        ax.set_xlabel('Temps (mois)')
+        ax.set_ylabel('Coefficient de Gini')
+        ax.set_title('Inégalité de richesse (Gini)')
+        ax.legend(fontsize=8)
+        ax.grid(True, alpha=0.3)
+
+        fig.tight_layout()
+
+        # Sauvegarde
+        output_path = self.output_dir / "shock_comparison.png"
+        fig.savefig(output_path, dpi=150, bbox_inches='tight')
+
+        print(f"  ✓ Graphique sauvegardé: {output_path}")
+
     def export_data(self, history: Dict[str, List], filename: str = "data") -> None:
         """
         Exporte les données en JSON.
@@ -118,3 +175,26 @@ class IRISVisualizer:
             json.dump(cleaned_history, f, indent=2)
 
         print(f"  ✓ Données exportées: {output_path}")
+
+    def export_data_npz(self, history: Dict[str, List], filename: str = "data") -> None:
+        """
+        Exporte les séries numériques dans une seule archive .npz compressée.
+
+        Un fichier (zlib) au lieu d'un JSON indenté : relecture directe avec
+        np.load. Les séries non numériques sont ignorées (voir export_data).
+
+        Args:
+            history: Historique de la simulation
+            filename: Nom du fichier (sans extension)
+        """
+        output_path = self.output_dir / f"{filename}.npz"
+
+        arrays = {}
+        for key, value in history.items():
+            array = np.asarray(value)
+            if array.dtype != object:
+                arrays[key] = array
+
+        np.savez_compressed(output_path, **arrays)
+
+        print(f"  ✓ Données exportées: {output_path}")
@@ -85,7 +85,7 @@ from .iris_validation import (
     MonteCarloResults,
     SensitivityResults,
 )
-from .iris_scenarios import ScenarioRunner
+from .iris_scenarios import ScenarioRunner, ScenarioResult
 
 __all__ = [
     # Main model
@@ -129,6 +129,7 @@ __all__ = [
     'MonteCarloResults',
     'SensitivityResults',
     'ScenarioRunner',
+    'ScenarioResult',
 ]
 
 __version__ = '2.0.0'
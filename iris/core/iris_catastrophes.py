@@ -22,7 +22,7 @@ Echelles :
 """
 
 import numpy as np
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Tuple
 from enum import Enum
 from dataclasses import dataclass
 
@@ -102,7 +102,8 @@ class CatastropheManager:
                  enable_economic: bool = True,
                  enable_political: bool = True,
                  enable_technological: bool = True,
-                 base_frequency: float = 0.05):
+                 base_frequency: float = 0.05,
+                 rng: Optional[np.random.Generator] = None):
         """
         Initialise le gestionnaire de catastrophes
 
@@ -112,12 +113,14 @@ class CatastropheManager:
             enable_political: Active les catastrophes politiques
             enable_technological: Active les catastrophes technologiques
             base_frequency: Probabilite de base d'une catastrophe par an (5% par defaut)
+            rng: Générateur aléatoire NumPy (si None, utilise default_rng)
         """
         self.enable_natural = enable_natural
         self.enable_economic = enable_economic
         self.enable_political = enable_political
         self.enable_technological = enable_technological
         self.base_frequency = base_frequency
+        self.rng = rng if rng is not None else np.random.default_rng()
 
         # Historique des catastrophes
         self.history: List[CatastropheEvent] = []
@@ -138,7 +141,7 @@ class CatastropheManager:
             True si une catastrophe doit se produire
         """
         # Tire un nombre d'evenements selon Poisson
-        n_events = np.random.poisson(self.base_frequency)
+        n_events = self.rng.poisson(self.base_frequency)
         return n_events > 0
 
     def generate_catastrophe(self, year: int) -> CatastropheEvent:
@@ -186,25 +189,25 @@ class CatastropheManager:
             ])
 
         # Tire un type au hasard
-        catastrophe_type = np.random.choice(available_types)
+        catastrophe_type = self.rng.choice(available_types)
 
         # Tire une echelle (plus probable d'etre locale)
         scale_probs = [0.6, 0.3, 0.1]  # Locale, Regionale, Globale
-        scale = np.random.choice(list(CatastropheScale), p=scale_probs)
+        scale = self.rng.choice(list(CatastropheScale), p=scale_probs)
 
         # Calcule le pourcentage d'agents affectes selon l'echelle
         if scale == CatastropheScale.LOCAL:
-            affected_agents = np.random.uniform(0.10, 0.20)
+            affected_agents = self.rng.uniform(0.10, 0.20)
         elif scale == CatastropheScale.REGIONAL:
-            affected_agents = np.random.uniform(0.30, 0.50)
+            affected_agents = self.rng.uniform(0.30, 0.50)
         else:  # GLOBAL
-            affected_agents = np.random.uniform(0.80, 1.00)
+            affected_agents = self.rng.uniform(0.80, 1.00)
 
         # Magnitude aleatoire (distribution beta pour favoriser les catastrophes moderees)
-        magnitude = np.random.beta(2, 5)  # Moyenne ~0.3, concentre sur valeurs moderees
+        magnitude = self.rng.beta(2, 5)  # Moyenne ~0.3, concentre sur valeurs moderees
 
         # Duree (la plupart durent 1 an, parfois plus)
-        duration = np.random.choice([1, 1, 1, 2, 3], p=[0.6, 0.2, 0.1, 0.05, 0.05])
+        duration = self.rng.choice([1, 1, 1, 2, 3], p=[0.6, 0.2, 0.1, 0.05, 0.05])
 
         event = CatastropheEvent(
             catastrophe_type=catastrophe_type,
@@ -251,7 +254,7 @@ class CatastropheManager:
         # Selection des agents affectes
         agent_ids = list(agents.keys())
         n_affected = int(len(agent_ids) * event.affected_agents)
-        affected_ids = np.random.choice(agent_ids, size=n_affected, replace=False)
+        affected_ids = self.rng.choice(agent_ids, size=n_affected, replace=False)
 
         # Application des effets selon le type
         if event.catastrophe_type in [CatastropheType.EARTHQUAKE,
@@ -268,13 +271,13 @@ class CatastropheManager:
                 impacts['wealth_loss'] += wealth_loss
 
                 # Destruction d'actifs
-                if agent.assets and np.random.random() < event.magnitude:
-                    destroyed_asset = np.random.choice(agent.assets)
+                if agent.assets and self.rng.random() < event.magnitude:
+                    destroyed_asset = self.rng.choice(agent.assets)
                     agent.remove_asset(destroyed_asset.id)
                     impacts['asset_destruction'] += 1
 
                 # Mortalite accrue (seulement si ages disponible)
-                if ages and agent_id in ages and ages[agent_id] > 50 and np.random.random() < event.magnitude * 0.1:
+                if ages and agent_id in ages and ages[agent_id] > 50 and self.rng.random() < event.magnitude * 0.1:
                     impacts['deaths'] += 1
 
         elif event.catastrophe_type == CatastropheType.PANDEMIC:
@@ -286,7 +289,7 @@ class CatastropheManager:
                 if ages and agent_id in ages:
                     age = ages[agent_id]
                     death_risk = event.magnitude * 0.2 * (1 + age / 100)
-                    if np.random.random() < death_risk:
+                    if self.rng.random() < death_risk:
                         impacts['deaths'] += 1
 
                 # Perte economique (baisse production)
@@ -332,7 +335,7 @@ class CatastropheManager:
                 impacts['wealth_loss'] += wealth_loss
 
                 # Mortalite
-                if np.random.random() < event.magnitude * 0.15:
+                if self.rng.random() < event.magnitude * 0.15:
                     impacts['deaths'] += 1
 
                 # Perturbation production
@@ -350,8 +353,8 @@ class CatastropheManager:
                 agent = agents[agent_id]
 
                 # Destruction aleatoire d'actifs (corruption donnees)
-                if agent.assets and np.random.random() < event.magnitude * 0.5:
-                    destroyed_asset = np.random.choice(agent.assets)
+                if agent.assets and self.rng.random() < event.magnitude * 0.5:
+                    destroyed_asset = self.rng.choice(agent.assets)
                     agent.remove_asset(destroyed_asset.id)
                     impacts['asset_destruction'] += 1
 
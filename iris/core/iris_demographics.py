@@ -17,7 +17,7 @@ Mécanismes démographiques :
 """
 
 import numpy as np
-from typing import Dict, List
+from typing import Dict, List, Optional
 from .iris_types import Agent, Asset, AssetType
 
 
@@ -40,7 +40,8 @@ class Demographics:
                  retirement_age: int = 65,
                  wealth_influence: bool = True,
                  max_population: int = 10000,
-                 consumption_D_per_year: float = 0.25):
+                 consumption_D_per_year: float = 0.25,
+                 rng: Optional[np.random.Generator] = None):
         """
         Initialise le module démographique
 
@@ -53,6 +54,7 @@ class Demographics:
             wealth_influence: Si True, la richesse influence natalité/mortalité
             max_population: Population maximale (0 = illimité, >0 = plafond activé, défaut: 10000)
             consumption_D_per_year: Quantité de D de consommation par an et par personne
+            rng: Générateur aléatoire NumPy (si None, utilise default_rng)
         """
         self.life_expectancy = life_expectancy
         self.birth_rate = birth_rate
@@ -61,6 +63,7 @@ class Demographics:
         self.retirement_age = retirement_age
         self.wealth_influence = wealth_influence
         self.max_population = max_population
+        self.rng = rng if rng is not None else np.random.default_rng()
 
         # NEW : quantité de D de consommation générée par an et par personne
         self.consumption_D_per_year = float(consumption_D_per_year)
@@ -90,7 +93,7 @@ class Demographics:
         for agent_id in agents.keys():
             # Distribution triangulaire : population plus âgée pour âge moyen proche de 38 ans
             # Mode à 51 ans (au lieu de 30) pour vieillir la population
-            age = int(np.random.triangular(0, 51, self.life_expectancy))
+            age = int(self.rng.triangular(0, 51, self.life_expectancy))
             ages[agent_id] = age
 
         return ages
@@ -237,7 +240,7 @@ class Demographics:
             p_death = max(0.0, min(1.0, p_death))
 
             # Tirage aléatoire
-            if np.random.random() < p_death:
+            if self.rng.random() < p_death:
                 deceased.append(agent_id)
                 self.total_deaths += 1
 
@@ -273,16 +276,16 @@ class Demographics:
 
         # S'il y a des héritiers potentiels
         if potential_heirs:
-            heir_id = np.random.choice(potential_heirs)
+            heir_id = self.rng.choice(potential_heirs)
         else:
             # Sinon, héritier aléatoire
-            heir_id = np.random.choice([aid for aid in agents.keys() if aid != deceased_id])
+            heir_id = self.rng.choice([aid for aid in agents.keys() if aid != deceased_id])
 
         # Transfert du patrimoine
         heir = agents[heir_id]
         heir.V_balance += deceased.V_balance
         heir.U_balance += deceased.U_balance
-        heir.assets.extend(deceased.assets)
+        heir.inherit_assets(deceased.assets)
 
         return heir_id
 
@@ -359,7 +362,7 @@ class Demographics:
         max_births = int(len(reproductive_agents) * 0.1)
         expected_births = min(expected_births, max_births)
 
-        actual_births = np.random.poisson(expected_births) if expected_births > 0 else 0
+        actual_births = self.rng.poisson(expected_births) if expected_births > 0 else 0
 
         # Contrôle de population : limiter aux places disponibles
         if self.max_population > 0:
@@ -375,7 +378,7 @@ class Demographics:
             if not reproductive_agents:
                 break
 
-            parent_id = np.random.choice(reproductive_agents)
+            parent_id = self.rng.choice(reproductive_agents)
             parent = agents[parent_id]
 
             # Crée le nouvel agent
@@ -400,14 +403,14 @@ class Demographics:
 
             # Le nouvel agent peut aussi créer de petits actifs
             # (simule l'entrée dans la vie active)
-            n_initial_assets = np.random.poisson(1.5)  # Quelques actifs au départ
+            n_initial_assets = self.rng.poisson(1.5)  # Quelques actifs au départ
 
             for j in range(n_initial_assets):
-                asset_type = np.random.choice(list(AssetType))
+                asset_type = AssetType(self.rng.choice(list(AssetType)))
                 # CORRECTION: Petites valeurs VRAIMENT petites pour un jeune
                 # Ancien: lognormal(8, 1.0) ≈ exp(8) = 3000 (trop élevé!)
                 # Nouveau: lognormal(1.5, 0.8) ≈ exp(1.5) = 4.5 (cohérent avec économie)
-                real_value = np.random.lognormal(1.5, 0.8)  # Beaucoup plus petit que la moyenne
+                real_value = self.rng.lognormal(1.5, 0.8)  # Beaucoup plus petit que la moyenne
 
                 asset = Asset(
                     id=f"asset_{new_id}_{j}",
@@ -492,13 +495,13 @@ class Demographics:
         Args:
             population: Instance de VectorizedPopulation
             current_year: Année courante de la simulation
-            rng: Générateur aléatoire NumPy (si None, utilise default_rng)
+            rng: Générateur aléatoire NumPy (si None, celui du module)
 
         Returns:
             Tuple (nb_births, nb_deaths) pour les statistiques
         """
         if rng is None:
-            rng = np.random.default_rng()
+            rng = self.rng
 
         # === VIEILLISSEMENT ===
         # Utilise la méthode optimisée age_one_year()
@@ -140,7 +140,8 @@ class EntrepriseManager:
                  taux_creation: float = 0.05,
                  taux_faillite_base: float = 0.03,
                  seuil_rentabilite_base: float = 100.0,
-                 cycles_avant_faillite: int = 12):
+                 cycles_avant_faillite: int = 12,
+                 rng: Optional[np.random.Generator] = None):
         """
         Initialise le gestionnaire
 
@@ -150,12 +151,14 @@ class EntrepriseManager:
             taux_faillite_base: Taux de faillite de base (3% par défaut)
             seuil_rentabilite_base: V minimum à générer par cycle
             cycles_avant_faillite: Cycles de déficit avant faillite (12 = 1 an)
+            rng: Générateur aléatoire NumPy (si None, utilise default_rng)
         """
         self.registre = registre
         self.taux_creation = taux_creation
         self.taux_faillite_base = taux_faillite_base
         self.seuil_rentabilite_base = seuil_rentabilite_base
         self.cycles_avant_faillite = cycles_avant_faillite
+        self.rng = rng if rng is not None else np.random.default_rng()
 
         # Métriques par entreprise
         self.metriques: Dict[str, EntrepriseMetrics] = {}
@@ -354,7 +357,7 @@ class EntrepriseManager:
         taux_ajuste = self.taux_creation * facteur_conditions
 
         # Nombre de créations potentielles (Poisson)
-        n_creations = np.random.poisson(len(agents) * taux_ajuste)
+        n_creations = self.rng.poisson(len(agents) * taux_ajuste)
 
         # Limite : max 10% de nouveaux entrants par cycle
         n_creations = min(n_creations, int(len(agents) * 0.1))
@@ -364,7 +367,7 @@ class EntrepriseManager:
             if not agents:
                 break
 
-            agent_id = np.random.choice(list(agents.keys()))
+            agent_id = self.rng.choice(list(agents.keys()))
             agent = agents[agent_id]
 
             # Vérifie que l'agent a assez de richesse
@@ -375,10 +378,10 @@ class EntrepriseManager:
                 continue  # Agent trop pauvre
 
             # Capital initial : entre 10% et 30% de la richesse de l'agent
-            V_initial = richesse * np.random.uniform(0.10, 0.30)
+            V_initial = richesse * self.rng.uniform(0.10, 0.30)
 
             # Type d'entreprise aléatoire
-            business_type = np.random.choice(list(BusinessType))
+            business_type = self.rng.choice(list(BusinessType))
 
             # Crée l'entreprise
             business_id = self.create_entreprise(
@@ -171,14 +171,20 @@ Références théoriques :
 Voir aussi : MAPPING_THEORY_CODE.md pour le mapping complet détaillé
 """
 
+import os
+import shutil
+import tempfile
+import weakref
+
 import numpy as np
 from dataclasses import dataclass, field
-from typing import Dict, List, Tuple, Optional
+from typing import Callable, Dict, List, Tuple, Optional
 from enum import Enum
 
 # Import types partagés
 from .iris_types import Agent, Asset, AssetType, DebtComponent
 from .iris_rad import RADState
+from iris.utils.math_helpers import gini_sorted
 
 # Import modules IRIS étendus
 from .iris_oracle import Oracle, FluxType, NFTMetadata
@@ -220,6 +226,65 @@ class IRISEconomy:
     4. Conservation des flux avec dissipation mesurée
     """
 
+    # Séries de l'historique stockées en tampons quand steps_hint est fourni
+    # (float64 en mémoire, float32 sur disque avec history_backend='memmap')
+    PREALLOCATED_HISTORY_KEYS = ('total_V', 'total_U', 'total_D',
+                                 'thermometer', 'indicator', 'kappa', 'eta',
+                                 'gini_coefficient', 'circulation_rate')
+
+    # Configurations nommées des scénarios (voir from_preset)
+    PRESETS: Dict[str, Dict[str, object]] = {
+        # Paramètres par défaut, RU 1 % (scénarios de base et de choc)
+        'baseline': dict(gold_factor=1.0, universal_income_rate=0.01),
+        # Idem, couche C1 gelée (témoin sans régulation des chocs)
+        'baseline_no_regulation': dict(gold_factor=1.0, universal_income_rate=0.01,
+                                       freeze_regulation=True),
+        # Régulation pure : V, U, D, θ, κ, η, RU seuls
+        'regulation_only': dict(gold_factor=1.0, universal_income_rate=0.01,
+                                enable_demographics=False, enable_catastrophes=False,
+                                enable_price_discovery=False, enable_dynamic_business=False,
+                                enable_business_combustion=False, enable_chambre_relance=False),
+        # Tous les modules sauf catastrophes, RU 2 %
+        'stable': dict(gold_factor=1.0, universal_income_rate=0.02,
+                       enable_demographics=True, enable_catastrophes=False,
+                       enable_price_discovery=True, enable_dynamic_business=True,
+                       enable_business_combustion=True, enable_chambre_relance=True),
+        # Tous les modules, catastrophes comprises
+        'high_volatility': dict(gold_factor=1.0, universal_income_rate=0.02,
+                                enable_demographics=True, enable_catastrophes=True,
+                                enable_price_discovery=True, enable_dynamic_business=True,
+                                enable_business_combustion=True, enable_chambre_relance=True),
+        # Comme 'stable', couche C1 gelée (κ, η fixes)
+        'no_regulation': dict(gold_factor=1.0, universal_income_rate=0.02,
+                              enable_demographics=True, enable_catastrophes=False,
+                              enable_price_discovery=True, enable_dynamic_business=True,
+                              enable_business_combustion=True, enable_chambre_relance=True,
+                              freeze_regulation=True),
+        # Scénarios thermodynamiques (sous-chauffe, équilibre, surchauffe)
+        'thermodynamic': dict(enable_demographics=True, enable_catastrophes=False,
+                              enable_business_combustion=True, enable_dynamic_business=True,
+                              enable_chambre_relance=True),
+    }
+
+    @classmethod
+    def from_preset(cls, name: str, **kwargs) -> 'IRISEconomy':
+        """
+        Construit une économie à partir d'une configuration de PRESETS
+
+        Args:
+            name: Nom de la configuration
+            **kwargs: Arguments du constructeur (initial_agents, seed, ...) ;
+                      ils remplacent ceux de la configuration
+
+        Returns:
+            Nouvelle économie IRIS
+        """
+        try:
+            preset = cls.PRESETS[name]
+        except KeyError:
+            raise ValueError(f"Configuration inconnue : {name} (attendu : {', '.join(cls.PRESETS)})") from None
+        return cls(**{**preset, **kwargs})
+
     def __init__(self,
                  initial_agents: int = 100,
                  gold_factor: float = 1.0,
@@ -239,7 +304,12 @@ class IRISEconomy:
                  conservation_rate: float = 0.0,  # ρ : taux de conservation RU (0 ≤ ρ ≤ 0.3)
                  w_S: float = 0.5,  # Poids du Stipulat dans la combustion
                  w_U: float = 0.5,  # Poids de U dans la combustion
-                 seed: Optional[int] = None):
+                 seed: Optional[int] = None,
+                 freeze_regulation: bool = False,
+                 steps_hint: Optional[int] = None,
+                 history_backend: str = 'dict',
+                 history_dir: Optional[str] = None,
+                 rng: Optional[np.random.Generator] = None):
         """
         Initialise l'économie IRIS (version 2.1 unifiée)
 
@@ -269,11 +339,30 @@ class IRISEconomy:
             w_S: Poids du Stipulat (S) dans la combustion S+U→V (défaut 0.5)
             w_U: Poids de U dans la combustion S+U→V (défaut 0.5, w_S + w_U = 1)
             seed: Graine aléatoire pour reproductibilité (None = aléatoire)
+            freeze_regulation: Gèle la couche C1 du RAD (κ et η fixes), pour
+                               les scénarios témoins sans régulation
+            steps_hint: Nombre de pas prévu ; si fourni, les séries principales
+                        (totaux V/U/D, θ, I, κ, η, Gini, circulation)
+                        sont préallouées en float64
+            history_backend: 'dict' (mémoire) ou 'memmap' (séries principales
+                             écrites en float32 dans des fichiers .dat,
+                             nécessite steps_hint)
+            history_dir: Répertoire des fichiers memmap (défaut : temporaire)
+            rng: Générateur partagé par l'économie et ses sous-systèmes
+                 (démographie, catastrophes, prix, entreprises) ; par défaut
+                 default_rng(seed). L'état global np.random n'est pas utilisé.
         """
-        # Graine aléatoire si fournie
+        # Configuration du constructeur, rejouée par reset()
+        self._init_config = {k: v for k, v in locals().items() if k != 'self'}
+
+        if history_backend not in ('dict', 'memmap'):
+            raise ValueError(f"history_backend inconnu : {history_backend} (attendu : 'dict' ou 'memmap')")
+        if history_backend == 'memmap' and not steps_hint:
+            raise ValueError("history_backend='memmap' nécessite steps_hint")
+
+        # Générateur unique (graine si fournie), transmis aux sous-systèmes
         self.seed = seed
-        if seed is not None:
-            np.random.seed(seed)
+        self.rng = rng if rng is not None else np.random.default_rng(seed)
 
         # Mode de population
         # IMPORTANT: Mode vectorisé désactivé (expérimental et non fiabilisé)
@@ -285,11 +374,14 @@ class IRISEconomy:
             )
         self.mode_population = "object"
 
+        # Soldes V/U des agents : toute écriture hors de step() (ou des
+        # méthodes qui appellent _invalidate_metrics()) doit être suivie de
+        # _invalidate_metrics(), sinon θ et Gini en cache restent périmés
         self.agents: Dict[str, Agent] = {}
         self.assets: Dict[str, Asset] = {}
         self.population = None  # VectorizedPopulation si mode vectorisé
 
-        self.rad = RADState()
+        self.rad = RADState(freeze_regulation=freeze_regulation)
         self.gold_factor = gold_factor
         self.universal_income_rate = universal_income_rate
 
@@ -340,16 +432,16 @@ class IRISEconomy:
         # Si démographie activée, initialise le module
         if enable_demographics:
             from .iris_demographics import Demographics
-            self.demographics = Demographics(max_population=max_population)
+            self.demographics = Demographics(max_population=max_population, rng=self.rng)
 
         # Si catastrophes activées, initialise le gestionnaire
         if enable_catastrophes:
             from .iris_catastrophes import CatastropheManager
-            self.catastrophe_manager = CatastropheManager()
+            self.catastrophe_manager = CatastropheManager(rng=self.rng)
 
         # Si prix explicites activés, initialise le gestionnaire
         if enable_price_discovery:
-            self.price_manager = PriceManager(epsilon=1e-6, max_step_change=0.05)
+            self.price_manager = PriceManager(epsilon=1e-6, max_step_change=0.05, rng=self.rng)
 
             # Enregistre quelques biens par défaut avec poids
             # Poids basés sur importance dans panier consommation
@@ -364,7 +456,8 @@ class IRISEconomy:
             self.entreprise_manager = EntrepriseManager(
                 registre=self.registre_entreprises,
                 taux_creation=taux_creation_entreprises,
-                taux_faillite_base=taux_faillite_entreprises
+                taux_faillite_base=taux_faillite_entreprises,
+                rng=self.rng
             )
 
         # Métriques de suivi
@@ -400,6 +493,46 @@ class IRISEconomy:
             'faillites_entreprises': []  # Faillites d'entreprises (si enable_dynamic_business)
         }
 
+        # Cache des métriques du dernier instantané (θ, Gini), rempli par
+        # _snapshot_state() en fin de pas. Clé (time, D) seulement : une
+        # modification des soldes V/U des agents ou de V_on à temps et D
+        # constants n'est PAS détectée. Invariant : toute opération qui touche
+        # ces soldes hors de step() appelle _invalidate_metrics() (c'est le cas
+        # de transaction, convert_V_to_U, reconvert_U_to_V,
+        # distribute_universal_income et inject_shock)
+        self._metrics_cache = {'time': -1, 'D': None, 'theta': None, 'gini': None}
+
+        # Séries principales préallouées (steps_hint) : history[k] est alors une
+        # vue sur la partie remplie du tampon, agrandi par doublement si besoin
+        # (sur reset(), les tampons mémoire du run précédent sont réutilisés)
+        previous_buffers = self.__dict__.get('_history_buffers')
+        self._history_len = 0
+        self._history_buffers: Optional[Dict[str, np.ndarray]] = None
+        self.history_backend = history_backend
+        self.history_dir = history_dir
+        # Dossier temporaire créé par le modèle lui-même : supprimé avec
+        # l'instance (ou par close()) ; un history_dir fourni n'est jamais supprimé
+        self._owns_history_dir = history_backend == 'memmap' and history_dir is None
+        self._history_finalizer: Optional[weakref.finalize] = None
+        if history_backend == 'memmap':
+            if self._owns_history_dir:
+                self.history_dir = tempfile.mkdtemp(prefix="iris_history_")
+                self._history_finalizer = weakref.finalize(
+                    self, shutil.rmtree, self.history_dir, ignore_errors=True)
+            os.makedirs(self.history_dir, exist_ok=True)
+        if steps_hint and history_backend == 'dict' and previous_buffers is not None \
+                and all(previous_buffers[key].size >= steps_hint
+                        for key in self.PREALLOCATED_HISTORY_KEYS):
+            self._history_buffers = previous_buffers
+        elif steps_hint:
+            self._history_buffers = {
+                key: self._allocate_history_buffer(key, steps_hint)
+                for key in self.PREALLOCATED_HISTORY_KEYS
+            }
+        if self._history_buffers is not None:
+            for key, buf in self._history_buffers.items():
+                self.history[key] = buf[:0]
+
         # Paramètres revenu universel contraint
         self.last_RU_per_agent = 0.0  # Dernier RU distribué par agent
         self.alpha_RU = 0.1  # Contrainte variation max (10%)
@@ -455,19 +588,20 @@ class IRISEconomy:
 
             # Distribution log-normale des richesses (réaliste)
             # La plupart des agents ont peu d'actifs, quelques-uns en ont beaucoup
-            n_assets = np.random.poisson(2) + 1  # 1 à ~5 actifs (moyenne 3)
+            n_assets = self.rng.poisson(2) + 1  # 1 à ~5 actifs (moyenne 3)
 
             for j in range(n_assets):
                 # Type d'actif aléatoire (immobilier, mobilier, entreprise, etc.)
-                asset_type = np.random.choice(list(AssetType))
+                # (choice renvoie un entier NumPy : on reconstruit le membre)
+                asset_type = AssetType(self.rng.choice(list(AssetType)))
 
                 # Valeur réelle log-normale : e^(10 ± 1.5)
                 # Produit une distribution réaliste : beaucoup de petits actifs, peu de grands
-                real_value = np.random.lognormal(10, 1.5)
+                real_value = self.rng.lognormal(10, 1.5)
 
                 # ÉMISSION CADASTRALE VIA L'ORACLE
                 # L'Oracle garantit : unicité NFT, calcul V₀ correct, équilibre V₀=D₀
-                auth_factor = np.random.uniform(0.9, 1.0)
+                auth_factor = self.rng.uniform(0.9, 1.0)
                 success, nft_metadata, msg = self.oracle.emit_asset(
                     asset_id=f"asset_{i}_{j}",
                     asset_type=asset_type.value,
@@ -535,9 +669,8 @@ class IRISEconomy:
                     asset.D_initial *= scale
 
             # Ajuster aussi le RAD pour maintenir l'équilibre V = D
-            self.rad.D_materielle *= scale
-            self.rad.D_services *= scale
-            self.rad.D_contractuelle *= scale
+            self.rad.scale_D(scale, (DebtComponent.MATERIELLE, DebtComponent.SERVICES,
+                                     DebtComponent.CONTRACTUELLE))
 
             print(f"INFO: Richesse renormalisée - {total_V_current:.2f} → {target_total_V:.2f} V (facteur: {scale:.4f})")
 
@@ -569,14 +702,11 @@ class IRISEconomy:
         """
         from .iris_population_vectorized import VectorizedPopulation
 
-        # Création du générateur aléatoire avec seed si fourni
-        rng = np.random.default_rng(self.seed)
-
         # Création de la population vectorisée avec distribution initiale
         self.population = VectorizedPopulation.from_initial_distribution(
             n_agents=n_agents,
             total_V=self.initial_total_wealth_V,
-            rng=rng,
+            rng=self.rng,
             target_mean_age=36.0  # Âge moyen cible de la population
         )
 
@@ -605,16 +735,16 @@ class IRISEconomy:
             if not self.agents:
                 break
 
-            agent_id = np.random.choice(list(self.agents.keys()))
+            agent_id = self.rng.choice(list(self.agents.keys()))
             agent = self.agents[agent_id]
 
             # Capital initial : 20-40% de la richesse de l'agent
             richesse = agent.V_balance + agent.U_balance
-            V_initial = richesse * np.random.uniform(0.20, 0.40)
+            V_initial = richesse * self.rng.uniform(0.20, 0.40)
 
 
             # Type d'entreprise aléatoire
-            business_type = np.random.choice(list(BusinessType))
+            business_type = self.rng.choice(list(BusinessType))
 
             # Crée l'entreprise
             business_id = self.entreprise_manager.create_entreprise(
@@ -761,6 +891,16 @@ class IRISEconomy:
 
         return eta_smoothed
 
+    @property
+    def population_size(self) -> int:
+        """
+        Nombre d'agents vivants
+
+        self.agents est un dict dont naissances et décès tiennent la taille
+        à jour : len() est en O(1), sans compteur séparé à synchroniser.
+        """
+        return len(self.agents)
+
     def thermometer(self) -> float:
         """
         Calcul du thermomètre global : θ = D / V_on
@@ -790,6 +930,11 @@ class IRISEconomy:
         Returns:
             Ratio D/V_on (devrait être proche de 1 en équilibre)
         """
+        # Valeur déjà calculée par _snapshot_state() pour cet état
+        cache = self._metrics_cache
+        if cache['time'] == self.time and cache['D'] == self.rad.total_D():
+            return cache['theta']
+
         # Calcule V_on (valeur vivante en circulation, excluant immobilisations)
         V_on = self.get_V_on()
 
@@ -820,6 +965,33 @@ class IRISEconomy:
         """
         return self.thermometer() - 1.0
 
+    def agent_columns(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Soldes des agents en colonnes (V, U), dans l'ordre de self.agents
+
+        Les objets Agent restent la référence (démographie, entreprises et
+        catastrophes les modifient directement) ; cette vue « structure de
+        tableaux » est extraite en un passage par colonne pour que les
+        agrégats (Gini, sommes, moyennes) se fassent en NumPy.
+
+        Returns:
+            (V, U) : ndarray float64 de taille len(self.agents)
+        """
+        agents = self.agents.values()
+        n = len(self.agents)
+        V = np.fromiter((agent.V_balance for agent in agents), dtype=np.float64, count=n)
+        U = np.fromiter((agent.U_balance for agent in agents), dtype=np.float64, count=n)
+        return V, U
+
+    def total_wealth_array(self) -> np.ndarray:
+        """
+        Richesse totale (V + U) de chaque agent, en un seul ndarray
+
+        Équivalent vectorisé de [agent.total_wealth() for agent in agents].
+        """
+        V, U = self.agent_columns()
+        return V + U
+
     def gini_coefficient(self) -> float:
         """
         Calcul du coefficient de Gini pour mesurer les inégalités
@@ -839,28 +1011,53 @@ class IRISEconomy:
         Returns:
             Coefficient entre 0 (égalité parfaite) et 1 (inégalité maximale)
         """
+        # Valeur déjà calculée par _snapshot_state() pour cet état
+        cache = self._metrics_cache
+        if cache['time'] == self.time and cache['D'] == self.rad.total_D():
+            return cache['gini']
+
         # Mode de population
-        if self.mode_population == "object":
-            # Récupère toutes les richesses (V + U) de chaque agent
-            wealths = np.array([agent.total_wealth() for agent in self.agents.values()])
-        else:  # vectorized
+        if self.mode_population != "object":  # vectorized
             # Utilise la méthode optimisée de VectorizedPopulation
             return self.population.gini_coefficient()
 
+        return self._gini_of(self.total_wealth_array())
+
+    @staticmethod
+    def _gini_of(wealths: np.ndarray) -> float:
+        """
+        Coefficient de Gini d'un vecteur de richesses (non trié)
+
+        Forme triée d'Allison (1978) : O(N log N) pour le tri, puis une
+        seule passe (gini_sorted, compilé par Numba s'il est installé),
+        sans matrice N×N des écarts |w_i - w_j|.
+        Le tableau reçu est trié sur place.
+
+        Args:
+            wealths: Richesses individuelles (V + U), tableau temporaire
+
+        Returns:
+            Coefficient entre 0 et 1 (0.0 si la richesse totale est nulle)
+        """
         # Trie par richesse croissante (nécessaire pour le calcul de Gini)
-        wealths = np.sort(wealths)
-        n = len(wealths)
+        wealths.sort()
 
         # Cas limite : richesse totale nulle
-        if wealths.sum() < 1e-6:
+        total = wealths.sum()
+        if total < 1e-6:
             return 0.0
 
-        # Calcul du coefficient de Gini
-        # cumsum[- 1] = somme totale des richesses
-        cumsum = np.cumsum(wealths)
-
         # Formule de Gini :  2 × Σ(rang × richesse) / (n × total) - (n+1)/n
-        return (2 * np.sum((np.arange(1, n+1)) * wealths)) / (n * cumsum[-1]) - (n + 1) / n
+        return float(gini_sorted(wealths))
+
+    def _invalidate_metrics(self) -> None:
+        """
+        Invalide le cache θ/Gini après une opération qui modifie l'état
+
+        À appeler après toute écriture de V_balance/U_balance ou de V_on
+        faite entre deux pas : la clé du cache (time, D) ne la voit pas.
+        """
+        self._metrics_cache['time'] = -1
 
     def circulation_rate(self) -> float:
         """
@@ -919,6 +1116,8 @@ class IRISEconomy:
         Returns:
             True si la conversion a réussi, False si l'agent n'a pas assez de V
         """
+        self._invalidate_metrics()
+
         # Vérifie que l'agent existe et a assez de V
         agent = self.agents.get(agent_id)
         if not agent or agent.V_balance < amount:
@@ -978,6 +1177,8 @@ class IRISEconomy:
         Returns:
             True si la transaction a réussi, False sinon
         """
+        self._invalidate_metrics()
+
         # Vérifie que les deux agents existent
         from_agent = self.agents.get(from_id)
         to_agent = self.agents.get(to_id)
@@ -1050,6 +1251,8 @@ class IRISEconomy:
         vivantes (salaires CE) et le RU total. Cette symétrie peut être vérifiée
         en post-traitement mais n'est pas forcée dans cette version du simulateur.
         """
+        self._invalidate_metrics()
+
         if len(self.agents) == 0:
             return
 
@@ -1297,6 +1500,8 @@ class IRISEconomy:
         Returns:
             True si la conversion a réussi
         """
+        self._invalidate_metrics()
+
         agent = self.agents.get(agent_id)
         if not agent or agent.U_balance < amount:
             return False
@@ -1372,10 +1577,16 @@ class IRISEconomy:
             if not agent_ids:  # Sécurité : arrête si plus d'agents
                 return
 
+            # Les tirages d'agents sont faits par blocs (self.rng.integers),
+            # sans l'aller-retour Python -> NumPy à chaque transaction.
+            # La liste des agents ne change pas pendant cette phase.
+            n_agents = len(agent_ids)
+            n_conversions = max(1, n_transactions // 10)  # Beaucoup moins de conversions
+
             # 1. Conversions V -> U aléatoires (agents activent leur patrimoine)
             # CORRECTION : Réduit la fréquence et le montant pour éviter vidange de V
-            for _ in range(max(1, n_transactions // 10)):  # Beaucoup moins de conversions
-                agent_id = np.random.choice(agent_ids)
+            for idx in self.rng.integers(0, n_agents, size=n_conversions).tolist():
+                agent_id = agent_ids[idx]
                 agent = self.agents[agent_id]
 
                 # Seulement si l'agent a besoin de liquidité (U faible)
@@ -1385,8 +1596,8 @@ class IRISEconomy:
                     self.convert_V_to_U(agent_id, convert_amount)
 
             # 2. Reconversions U -> V (épargne/investissement)
-            for _ in range(max(1, n_transactions // 10)):
-                agent_id = np.random.choice(agent_ids)
+            for idx in self.rng.integers(0, n_agents, size=n_conversions).tolist():
+                agent_id = agent_ids[idx]
                 agent = self.agents[agent_id]
 
                 # Épargne si l'agent a beaucoup de liquidité
@@ -1395,17 +1606,25 @@ class IRISEconomy:
                     self.reconvert_U_to_V(agent_id, save_amount)
 
             # 3. Transactions U entre agents
-            for _ in range(n_transactions):
-                agent_ids = list(self.agents.keys())
-                if len(agent_ids) < 2:
-                    break
-                from_id = np.random.choice(agent_ids)
-                to_id = np.random.choice(agent_ids)
-                if from_id != to_id:
-                    from_agent = self.agents[from_id]
-                    if from_agent.U_balance > 1.0:  # Seuil minimum
-                        amount = min(from_agent.U_balance * 0.1, from_agent.U_balance * 0.5)
-                        self.transaction(from_id, to_id, amount)
+            # Transfert inline (même règle que transaction()) : les agents sont
+            # résolus une fois par pas et le cache des métriques n'est invalidé
+            # qu'une fois pour tout le lot. Les transferts restent séquentiels,
+            # chacun dépendant du solde U laissé par les précédents.
+            if n_agents >= 2:
+                agent_list = list(self.agents.values())
+                pairs = self.rng.integers(0, n_agents, size=(n_transactions, 2)).tolist()
+                transferred = False
+                for from_idx, to_idx in pairs:
+                    if from_idx != to_idx:
+                        from_agent = agent_list[from_idx]
+                        balance = from_agent.U_balance
+                        if balance > 1.0:  # Seuil minimum
+                            amount = balance * 0.1  # min(10 %, 50 %) du solde
+                            from_agent.U_balance = balance - amount
+                            agent_list[to_idx].U_balance += amount
+                            transferred = True
+                if transferred:
+                    self._invalidate_metrics()
 
             # 4. Distribution du revenu universel (tous les 12 steps = 1 fois/an)
             if self.time % STEPS_PER_YEAR == 0:
@@ -1443,9 +1662,8 @@ class IRISEconomy:
 
             # 3. Transactions U entre agents (vectorisé via random_transfers_U)
             # Utilise la méthode optimisée de VectorizedPopulation
-            rng = np.random.default_rng(self.seed + self.time if self.seed is not None else None)
             self.population.random_transfers_U(
-                rng=rng,
+                rng=self.rng,
                 n_transfers=n_transactions * 10,
                 max_fraction=0.1
             )
@@ -1591,11 +1809,7 @@ class IRISEconomy:
                     ratio_CR = max(0.0, (total_D_before_CR - reduction_amount) / total_D_before_CR)
 
                     # Application proportionnelle sur TOUTES les composantes de D
-                    self.rad.D_materielle *= ratio_CR
-                    self.rad.D_services *= ratio_CR
-                    self.rad.D_contractuelle *= ratio_CR
-                    self.rad.D_engagement *= ratio_CR
-                    self.rad.D_regulatrice *= ratio_CR
+                    self.rad.scale_D(ratio_CR)
 
         # 5. Régulation automatique
         self._C2_activated, self._C3_activated = self.regulate()
@@ -1613,11 +1827,7 @@ class IRISEconomy:
             ratio = (total_D_before - amort) / total_D_before
 
             # Application proportionnelle sur toutes les composantes de D
-            self.rad.D_materielle *= ratio
-            self.rad.D_services *= ratio
-            self.rad.D_contractuelle *= ratio
-            self.rad.D_engagement *= ratio
-            self.rad.D_regulatrice *= ratio
+            self.rad.scale_D(ratio)
 
         # 6. Démographie : décès et naissances (tous les 12 steps = 1 fois/an)
         if self.enable_demographics and self.time % STEPS_PER_YEAR == 0:
@@ -1745,9 +1955,8 @@ class IRISEconomy:
             elif self.mode_population == "vectorized":
                 # === MODE VECTORISÉ : traitement par arrays NumPy ===
                 # Toute la démographie (vieillissement, morts, naissances) en une seule passe
-                rng = np.random.default_rng(self.seed if hasattr(self, 'seed') else None)
                 self._births_this_step, self._deaths_this_step = self.demographics.process_vectorized(
-                    self.population, self.time, rng
+                    self.population, self.time, self.rng
                 )
 
                 # En mode vectorisé, pas de D_lifetime détaillé (approximation)
@@ -1798,8 +2007,8 @@ class IRISEconomy:
 
         for _ in range(n_transactions):
             # Sélectionne acheteur et vendeur
-            buyer_id = np.random.choice(agent_ids)
-            seller_id = np.random.choice(agent_ids)
+            buyer_id = self.rng.choice(agent_ids)
+            seller_id = self.rng.choice(agent_ids)
 
             if buyer_id == seller_id:
                 continue
@@ -1808,10 +2017,10 @@ class IRISEconomy:
             seller = self.agents[seller_id]
 
             # Type de bien échangé
-            good_type = np.random.choice(list(GoodType))
+            good_type = self.rng.choice(list(GoodType))
 
             # Quantité aléatoire
-            quantite = np.random.uniform(0.5, 5.0)
+            quantite = self.rng.uniform(0.5, 5.0)
 
             # Prix actuel
             prix = self.price_manager.get_prix(good_type)
@@ -1840,7 +2049,7 @@ class IRISEconomy:
         for _ in range(max(1, n_transactions // 10)):
             if not agent_ids:
                 break
-            agent_id = np.random.choice(agent_ids)
+            agent_id = self.rng.choice(agent_ids)
             agent = self.agents[agent_id]
 
             if agent.V_balance > 0 and agent.U_balance < agent.V_balance * 0.1:
@@ -1851,7 +2060,7 @@ class IRISEconomy:
         for _ in range(max(1, n_transactions // 10)):
             if not agent_ids:
                 break
-            agent_id = np.random.choice(agent_ids)
+            agent_id = self.rng.choice(agent_ids)
             agent = self.agents[agent_id]
 
             if agent.U_balance > agent.V_balance * 0.2:
@@ -1862,8 +2071,8 @@ class IRISEconomy:
         for _ in range(n_transactions):
             if len(agent_ids) < 2:
                 break
-            from_id = np.random.choice(agent_ids)
-            to_id = np.random.choice(agent_ids)
+            from_id = self.rng.choice(agent_ids)
+            to_id = self.rng.choice(agent_ids)
             if from_id != to_id:
                 from_agent = self.agents[from_id]
                 if from_agent.U_balance > 1.0:
@@ -1891,16 +2100,33 @@ class IRISEconomy:
         # Time (actuel, avant incrément)
         self.history['time'].append(self.time)
 
-        # Métriques économiques fondamentales
-        self.history['total_V'].append(sum(a.V_balance for a in self.agents.values()))
-        self.history['total_U'].append(sum(a.U_balance for a in self.agents.values()))
-        self.history['total_D'].append(self.rad.total_D())
-        self.history['thermometer'].append(self.thermometer())
-        self.history['indicator'].append(self.indicator())
-        self.history['kappa'].append(self.rad.kappa)
-        self.history['eta'].append(self.rad.eta)
-        self.history['gini_coefficient'].append(self.gini_coefficient())
-        self.history['circulation_rate'].append(self.circulation_rate())
+        # Métriques économiques fondamentales : une extraction des soldes
+        # (V, U) sert aux totaux et au Gini
+        V, U = self.agent_columns()
+        D = self.rad.total_D()
+        theta = self.thermometer()
+        if self.mode_population == "object":
+            gini = self._gini_of(V + U)
+        else:
+            gini = self.gini_coefficient()
+        self._metrics_cache = {'time': self.time, 'D': D,
+                               'theta': theta, 'gini': gini}
+        metrics = {
+            'total_V': float(V.sum()),
+            'total_U': float(U.sum()),
+            'total_D': D,
+            'thermometer': theta,
+            'indicator': theta - 1.0,
+            'kappa': self.rad.kappa,
+            'eta': self.rad.eta,
+            'gini_coefficient': gini,
+            'circulation_rate': self.circulation_rate(),
+        }
+        if self._history_buffers is None:
+            for key, value in metrics.items():
+                self.history[key].append(value)
+        else:
+            self._record_buffered(metrics)
 
         # Métriques démographiques
         self.history['population'].append(len(self.agents))
@@ -1952,23 +2178,208 @@ class IRISEconomy:
             self.history['creations_entreprises'].append(0)
             self.history['faillites_entreprises'].append(0)
 
-    def simulate(self, steps: int = 1000, n_transactions: int = 10) -> None:
+    def _record_buffered(self, metrics: Dict[str, float]) -> None:
+        """
+        Écrit un pas dans les tampons préalloués (steps_hint)
+
+        Si la simulation dépasse steps_hint, le tampon est doublé ;
+        history[k] est remplacé par la vue sur les valeurs écrites.
+
+        Args:
+            metrics: Valeurs du pas courant pour PREALLOCATED_HISTORY_KEYS
+        """
+        n = self._history_len
+        for key, value in metrics.items():
+            buf = self._history_buffers[key]
+            if n == buf.size:
+                buf = self._grow_history_buffer(buf)
+                self._history_buffers[key] = buf
+            buf[n] = value
+            self.history[key] = buf[:n + 1]
+        self._history_len = n + 1
+
+    def _allocate_history_buffer(self, key: str, size: int) -> np.ndarray:
+        """
+        Alloue le tampon d'une série principale selon history_backend
+
+        Args:
+            key: Nom de la série (nom du fichier .dat en mode memmap)
+            size: Capacité initiale (en pas)
+
+        Returns:
+            ndarray float64 ou np.memmap float32
+        """
+        if self.history_backend == 'memmap':
+            path = os.path.join(self.history_dir, f"{key}.dat")
+            return np.memmap(path, dtype=np.float32, mode='w+', shape=(size,))
+        return np.empty(size, dtype=np.float64)
+
+    @staticmethod
+    def _grow_history_buffer(buf: np.ndarray) -> np.ndarray:
+        """
+        Double la capacité d'un tampon d'historique plein
+
+        En mode memmap, le fichier est agrandi puis re-projeté en mémoire.
+        """
+        new_size = max(1, 2 * buf.size)
+        if isinstance(buf, np.memmap):
+            buf.flush()
+            with open(buf.filename, 'r+b') as f:
+                f.truncate(new_size * buf.itemsize)
+            return np.memmap(buf.filename, dtype=buf.dtype, mode='r+', shape=(new_size,))
+        return np.concatenate([buf, np.empty(new_size - buf.size, dtype=buf.dtype)])
+
+    def close(self) -> None:
+        """
+        Supprime le dossier memmap temporaire créé par le modèle
+
+        Sans effet si history_dir a été fourni ou en mode 'dict'. Appelé
+        automatiquement à la destruction de l'instance ; les séries memmap
+        ne doivent plus être utilisées ensuite (les copier avant si besoin).
+        """
+        finalizer = self.__dict__.get('_history_finalizer')
+        if finalizer is not None:
+            finalizer()
+
+    def __getstate__(self) -> Dict:
+        """État picklable (le finaliseur du dossier temporaire reste à la source)"""
+        state = self.__dict__.copy()
+        state.pop('_history_finalizer', None)
+        return state
+
+    def __setstate__(self, state: Dict) -> None:
+        """
+        Restaure une économie dépicklée (instantané de ScenarioRunner)
+
+        En mode memmap, les tampons dépicklés ne sont plus adossés à un
+        fichier : ils sont recopiés dans un nouveau dossier voisin de
+        l'original, pour que la copie n'écrase pas les séries de la source.
+        Ce dossier suit le statut de celui de la source : temporaire (supprimé
+        à la destruction de la copie) si le modèle l'avait créé, conservé si
+        history_dir avait été fourni (ex. output_dir/history de ScenarioRunner).
+        """
+        self.__dict__.update(state)
+        self._history_finalizer = None
+        if self.history_backend != 'memmap' or self._history_buffers is None:
+            return
+        parent = os.path.dirname(os.path.abspath(self.history_dir))
+        self.history_dir = tempfile.mkdtemp(prefix="iris_history_", dir=parent)
+        if self.__dict__.get('_owns_history_dir', False):
+            self._history_finalizer = weakref.finalize(
+                self, shutil.rmtree, self.history_dir, ignore_errors=True)
+        n = self._history_len
+        for key, old in self._history_buffers.items():
+            buf = self._allocate_history_buffer(key, old.size)
+            buf[:n] = old[:n]
+            self._history_buffers[key] = buf
+            self.history[key] = buf[:n]
+
+    def reset(self, seed: Optional[int] = None) -> None:
+        """
+        Réinitialise l'économie en place pour un nouveau run
+
+        Rejoue le constructeur avec la même configuration et un générateur
+        neuf default_rng(seed) : la trajectoire est identique à celle d'un
+        IRISEconomy(..., seed=seed) neuf. Les tampons d'historique
+        préalloués (steps_hint, backend 'dict') sont réutilisés au lieu
+        d'être réalloués, ce qui profite aux balayages qui enchaînent
+        les runs sur une même instance (l'historique du run précédent est
+        alors écrasé : le copier avant reset() s'il doit être conservé).
+
+        En mode memmap sans history_dir, le dossier temporaire du run
+        précédent est supprimé (close()) avant d'en créer un nouveau.
+
+        Args:
+            seed: Graine du nouveau run (None = graine de la configuration)
+        """
+        config = dict(self._init_config)
+        if seed is not None:
+            config['seed'] = seed
+        config['rng'] = None
+        self.close()
+        self.__init__(**config)
+
+    def fast_run(self, steps: int, n_transactions: int = 10) -> None:
+        """
+        Enchaîne `steps` pas sans affichage ni calendrier de chocs
+
+        Boucle minimale (méthode step liée une fois) pour les phases que
+        les scénarios pilotent eux-mêmes ; simulate() reste l'entrée
+        complète (chocs, progression).
+
+        Args:
+            steps: Nombre de pas
+            n_transactions: Transactions par pas
+        """
+        step = self.step
+        for _ in range(steps):
+            step(n_transactions)
+
+    @classmethod
+    def make_stepper(cls, n_transactions: int = 10):
+        """
+        Construit un pilote de simulation à nombre de transactions figé
+
+        n_transactions est lié une fois pour toutes (évaluation partielle) :
+        les scénarios qui enchaînent des phases à transactions constantes
+        appellent drive(economy, n_pas) au lieu de répéter step(n) pas à pas.
+
+        Args:
+            n_transactions: Transactions par pas (constante)
+
+        Returns:
+            Fonction drive(economy, n_steps=1)
+        """
+        def drive(economy: 'IRISEconomy', n_steps: int = 1) -> None:
+            economy.fast_run(n_steps, n_transactions)
+
+        drive.n_transactions = n_transactions
+        return drive
+
+    def simulate(self, steps: int = 1000, n_transactions: int = 10,
+                 shock_schedule: Optional[List[Tuple[int, str, float]]] = None,
+                 log_every: int = 100,
+                 log_callback: Optional[Callable[['IRISEconomy', int, int], None]] = None) -> None:
         """
         Exécute la simulation sur plusieurs pas de temps
 
+        Les chocs du calendrier sont injectés (inject_shock) dès que
+        self.time atteint leur date, avant le pas suivant : un choc à t=500
+        s'applique après 500 pas, comme dans les scénarios de choc.
+
         Args:
             steps: Nombre de pas de simulation
             n_transactions: Transactions par pas
+            shock_schedule: Chocs [(t, type, magnitude)] en temps absolu
+            log_every: Période d'affichage de la progression (0 = muet)
+            log_callback: Affichage personnalisé f(economy, i, steps),
+                          appelé à la place de la ligne par défaut
         """
         print(f"\nDémarrage de la simulation IRIS ({steps} pas)...")
 
-        for i in range(steps):
-            self.step(n_transactions)
+        pending = sorted(shock_schedule or [], key=lambda shock: shock[0])
+        k = 0
+        step = self.step
+        # Prochain pas affiché (compteur plutôt qu'un modulo à chaque pas)
+        next_log = log_every if log_every else steps + 1
 
-            if (i + 1) % 100 == 0:
-                theta = self.thermometer()
-                indicator = self.indicator()
-                gini = self.gini_coefficient()
+        for i in range(steps):
+            while k < len(pending) and pending[k][0] <= self.time:
+                _, shock_type, magnitude = pending[k]
+                self.inject_shock(shock_type, magnitude)
+                k += 1
+
+            step(n_transactions)
+
+            if i + 1 == next_log:
+                next_log += log_every
+                if log_callback is not None:
+                    log_callback(self, i + 1, steps)
+                    continue
+                # Valeurs déjà capturées par _snapshot_state() : pas de recalcul
+                theta = self.history['thermometer'][-1]
+                indicator = self.history['indicator'][-1]
+                gini = self.history['gini_coefficient'][-1]
                 print(f"  Pas {i+1}/{steps} - θ={theta:.4f}, I={indicator:.4f}, Gini={gini:.4f}")
 
         print("OK: Simulation terminée\n")
@@ -1981,6 +2392,8 @@ class IRISEconomy:
             shock_type: Type de choc ('wealth_loss', 'demand_surge', 'supply_shock')
             magnitude: Intensité du choc (0-1)
         """
+        self._invalidate_metrics()
+
         print(f"\nATTENTION: Injection d'un choc : {shock_type} (magnitude={magnitude:.2f})")
 
         if shock_type == 'wealth_loss':
@@ -64,16 +64,19 @@ class PriceManager:
     - inflation(prev_mean_price) : taux d'inflation
     """
 
-    def __init__(self, epsilon: float = 1e-6, max_step_change: float = 0.05):
+    def __init__(self, epsilon: float = 1e-6, max_step_change: float = 0.05,
+                 rng: Optional[np.random.Generator] = None):
         """
         Initialise le gestionnaire de prix
 
         Args:
             epsilon: Valeur minimale pour éviter prix ≤ 0
             max_step_change: Variation maximale de log(P) par step (5% par défaut)
+            rng: Générateur aléatoire NumPy (si None, utilise default_rng)
         """
         self.epsilon = epsilon
         self.max_step_change = max_step_change
+        self.rng = rng if rng is not None else np.random.default_rng()
 
         # Stockage en log-prices
         self.log_prices: Dict[str, float] = {}  # good_id -> log(P)
@@ -133,7 +136,7 @@ class PriceManager:
             drift = drift_coeff * (theta - 1.0)
 
             # Bruit borné (variation aléatoire)
-            noise = np.random.uniform(-noise_amplitude, noise_amplitude)
+            noise = self.rng.uniform(-noise_amplitude, noise_amplitude)
 
             # Choc externe
             # (ex: catastrophe → shock < 0, relance → shock > 0)
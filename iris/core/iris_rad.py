@@ -30,11 +30,12 @@ Date: 2025
 """
 
 from dataclasses import dataclass, field
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Sequence
 import logging
 import numpy as np
 
 from iris.utils import safe_divide, validate_non_negative
+from .iris_types import DebtComponent
 
 logger = logging.getLogger(__name__)
 
@@ -135,6 +136,9 @@ class RADState:
     kappa_history: List[float] = field(default_factory=list)
     eta_history: List[float] = field(default_factory=list)
 
+    # Gel complet de C1 : κ et η ne sont plus recalculés du tout
+    freeze_regulation: bool = False
+
     def total_D(self) -> float:
         """
         Calcule la dette thermométrique totale D.
@@ -152,6 +156,29 @@ class RADState:
             self.D_regulatrice
         )
 
+    def scale_D(self, factor: float,
+                components: Optional[Sequence[DebtComponent]] = None) -> None:
+        """
+        Multiplie des composantes de D par un même facteur.
+
+        Regroupe les ajustements proportionnels (amortissement δ_m, Chambre
+        de Relance, renormalisation, chocs de scénario) en un seul appel.
+
+        Args:
+            factor: Facteur multiplicatif
+            components: Composantes à ajuster (défaut : les cinq)
+        """
+        if components is None:
+            self.D_materielle *= factor
+            self.D_services *= factor
+            self.D_contractuelle *= factor
+            self.D_engagement *= factor
+            self.D_regulatrice *= factor
+            return
+        for component in components:
+            name = f"D_{component.name.lower()}"
+            setattr(self, name, getattr(self, name) * factor)
+
     def add_D_materielle(self, amount: float) -> None:
         """
         Ajoute de la dette matérielle (cristallisation U→V).
@@ -392,14 +419,15 @@ class RADState:
             nu_eff: Vitesse de circulation actuelle
             tau_eng: Taux d'engagement actuel
         """
+        if self.freeze_regulation:
+            return
+
         # Calcul de la variation Δκ (tri-capteur)
         delta_kappa = self.compute_delta_kappa(r_t, nu_eff, tau_eng)
 
-        # Application de la variation
-        self.kappa += delta_kappa
-
-        # Application des bornes strictes [0.5, 2.0]
-        self.kappa = float(np.clip(self.kappa, self.kappa_min, self.kappa_max))
+        # Application de la variation, bornes strictes [0.5, 2.0]
+        self.kappa = float(np.clip(self.kappa + delta_kappa,
+                                   self.kappa_min, self.kappa_max))
 
         # Enregistrement historique
         self.kappa_history.append(self.kappa)
@@ -418,6 +446,9 @@ class RADState:
             nu_eff: Vitesse de circulation actuelle
             tau_eng: Taux d'engagement actuel
         """
+        if self.freeze_regulation:
+            return
+
         # Calcul de la variation Δη (tri-capteur)
         delta_eta = self.compute_delta_eta(r_t, nu_eff, tau_eng)
 
@@ -460,6 +491,10 @@ class RADState:
             nu_eff: Vélocité effective (approximée par U/V_on)
             tau_eng: Taux d'engagement (approximé par D_engagement/D_total)
         """
+        # Régulation gelée : aucun calcul, κ et η restent à leur valeur
+        if self.freeze_regulation:
+            return
+
         # Indicateur centré I = θ - 1
         I = theta - 1.0
 
@@ -502,13 +537,9 @@ class RADState:
         delta_kappa = np.clip(delta_kappa, -self.max_delta_kappa, self.max_delta_kappa)
         delta_eta = np.clip(delta_eta, -self.max_delta_eta, self.max_delta_eta)
 
-        # Applique les variations
-        self.kappa += delta_kappa
-        self.eta += delta_eta
-
-        # Applique les bornes [0.5, 2.0] (THÉORIE §3.1.2)
-        self.kappa = float(np.clip(self.kappa, self.kappa_min, self.kappa_max))
-        self.eta = float(np.clip(self.eta, self.eta_min, self.eta_max))
+        # Applique les variations et les bornes [0.5, 2.0] (THÉORIE §3.1.2)
+        self.kappa = float(np.clip(self.kappa + delta_kappa, self.kappa_min, self.kappa_max))
+        self.eta = float(np.clip(self.eta + delta_eta, self.eta_min, self.eta_max))
 
         # Mise à jour des capteurs
         self.r_t = theta
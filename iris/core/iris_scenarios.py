@@ -19,28 +19,257 @@ Scénarios implémentés :
 8. Baseline Stable (équilibre stable avec paramètres par défaut)
 9. Crisis High Volatility (stress test avec volatilité élevée)
 10. No Regulation (système sans RAD, η=κ=1 fixes)
+
+Exécution groupée :
+- run_all() répartit les scénarios indépendants sur plusieurs processus
+- run_sweep() balaie la magnitude d'un type de choc, un processus par point
+
+IRISEconomy.step() fait évoluer des objets (Agent, Asset, comptes
+d'entreprise) et non des tableaux à forme fixe : le regroupement de
+scénarios se fait donc au niveau des processus, pas d'un noyau vectorisé
+commun à tous les scénarios.
 """
 
+import logging
+import multiprocessing
+import os
+import pickle
+import sys
+import tempfile
+import zlib
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Dict, List, NamedTuple, Optional, Sequence, Tuple
+
 import numpy as np
-from typing import Dict, List
 from .iris_model import IRISEconomy
+from .iris_types import DebtComponent
 from ..analysis.iris_visualizer import IRISVisualizer
 
+try:
+    from joblib import Parallel, delayed
+    JOBLIB_AVAILABLE = True
+except ImportError:
+    JOBLIB_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+
+class ScenarioResult(NamedTuple):
+    """Séries principales d'un scénario, converties en ndarray"""
+    name: str
+    thermometer: np.ndarray
+    indicator: np.ndarray
+    gini_coefficient: np.ndarray
+    gini_final: float
+    n_steps: int
+
+
+# Précision des séries pour les rapports et graphiques (θ, I, Gini) :
+# float32 suffit et divise par deux la bande passante des réductions
+REPORT_DTYPE = np.float32
+
+
+# Composantes de D touchées par les chocs thermodynamiques (sous/surchauffe)
+_SHOCKED_D_COMPONENTS = (DebtComponent.MATERIELLE, DebtComponent.CONTRACTUELLE,
+                         DebtComponent.SERVICES)
+
+# Pilotes spécialisés : scénarios de choc (20 transactions par pas) et
+# scénarios thermodynamiques (10 transactions par pas)
+_drive_20 = IRISEconomy.make_stepper(n_transactions=20)
+_drive_10 = IRISEconomy.make_stepper(n_transactions=10)
+
+# Symboles d'affichage des séries d'historique
+_FIELD_LABELS = {
+    'thermometer': 'θ',
+    'indicator': 'I',
+    'kappa': 'κ',
+    'eta': 'η',
+    'gini_coefficient': 'Gini',
+}
+
+
+def _summarize(arr: np.ndarray, target: float = 1.0) -> Tuple[float, float, float]:
+    """
+    Moyenne, écart-type et écart max à `target` d'une série, en une passe
+
+    Un seul tableau d'écarts (arr - target) sert aux trois statistiques :
+    somme, produit scalaire puis max de |écart| sur place, accumulés en
+    float64 (la série peut être en float32).
+
+    Returns:
+        (moyenne, écart-type, max |arr - target|) ; zéros si la série est vide
+    """
+    n = arr.size
+    if n == 0:
+        return 0.0, 0.0, 0.0
+    dev = np.subtract(arr, target, dtype=np.float64)
+    dev_mean = dev.sum() / n
+    var = max(0.0, np.dot(dev, dev) / n - dev_mean * dev_mean)
+    np.abs(dev, out=dev)
+    return float(target + dev_mean), float(np.sqrt(var)), float(dev.max())
+
+
+def _log_decades(economy: IRISEconomy, start: int, n_steps: int) -> None:
+    """
+    Bilan décennal (θ, κ, η tous les 120 pas) d'une phase déjà simulée
+
+    Les valeurs sont relues dans l'historique à partir de l'indice `start`
+    et émises en un seul message : aucune E/S dans la boucle de simulation.
+    """
+    if not logger.isEnabledFor(logging.INFO):
+        return
+    hist = economy.history
+    rows = slice(start + 119, start + n_steps, 120)
+    lines = [f"  +{(k + 1) * 10} ans : θ={theta:.4f}, κ={kappa:.4f}, η={eta:.4f}"
+             for k, (theta, kappa, eta) in enumerate(zip(hist['thermometer'][rows],
+                                                          hist['kappa'][rows],
+                                                          hist['eta'][rows]))]
+    if lines:
+        logger.info("\n".join(lines))
+
+
+def _log_fields(*keys: str, total: Optional[int] = None):
+    """
+    Callback de progression pour IRISEconomy.simulate()
+
+    Affiche les dernières valeurs des séries `keys`, lues dans l'historique
+    (aucun recalcul sur les agents). `total` remplace le nombre de pas de
+    l'appel à simulate() quand le scénario est exécuté en plusieurs phases.
+    """
+    def log(economy: IRISEconomy, i: int, steps: int) -> None:
+        if not logger.isEnabledFor(logging.INFO):
+            return
+        hist = economy.history
+        values = ", ".join(f"{_FIELD_LABELS.get(k, k)}={hist[k][-1]:.4f}" for k in keys)
+        logger.info("  Pas %s/%s - %s", economy.time, total or steps, values)
+    return log
+
+
+# Scénarios à choc unique (ScenarioRunner._run_shock) : titre, séries
+# suivies, clé de résultat et bilan final par type de choc
+_SHOCK_SPECS = {
+    'wealth_loss': {
+        'title': lambda m: f"SCÉNARIO 2 : CHOC DE RICHESSE - Perte de {m*100:.0f}% du patrimoine",
+        'label': "choc de richesse",
+        'phase': "récupération",
+        'monitor': ('thermometer', 'indicator'),
+        'result_key': lambda m: f'wealth_loss_{int(m*100)}',
+        'finals': (
+            ("Thermomètre final", lambda e: e.thermometer()),
+            ("Indicateur final", lambda e: e.indicator()),
+        ),
+        'recovery': True,
+    },
+    'demand_surge': {
+        'title': lambda m: f"SCÉNARIO 3 : CHOC DE DEMANDE - Conversion massive {m*100:.0f}% V→U",
+        'label': "choc de demande",
+        'phase': "régulation",
+        'monitor': ('thermometer', 'kappa'),
+        'result_key': lambda m: f'demand_surge_{int(m*100)}',
+        'finals': (
+            ("Thermomètre final", lambda e: e.thermometer()),
+            ("Coefficient κ final", lambda e: e.rad.kappa),
+            ("Taux de circulation U/V", lambda e: e.circulation_rate()),
+        ),
+    },
+    'supply_shock': {
+        'title': lambda m: f"SCÉNARIO 4 : CHOC D'OFFRE - Réduction du rendement η (magnitude {m:.1f})",
+        'label': "choc d'offre",
+        'phase': "adaptation",
+        'monitor': ('thermometer', 'eta'),
+        'result_key': lambda m: f'supply_shock_{int(m*10)}',
+        'pre_shock': 'eta',
+        'finals': (
+            ("Thermomètre final", lambda e: e.thermometer()),
+            ("η final", lambda e: e.history['eta'][-1]),
+        ),
+    },
+}
+
+
+def _sweep_seed(shock_type: str, magnitude: float) -> int:
+    """Graine déterministe dérivée de (type de choc, magnitude)"""
+    return zlib.crc32(f"{shock_type}:{magnitude!r}".encode())
+
+
+def _run_one_shock(n_agents: int, shock_type: str, magnitude: float,
+                   steps: int, shock_time: int) -> Tuple[str, Dict]:
+    """
+    Exécute un point de balayage dans un processus isolé
+
+    Fonction de module (et non méthode) pour rester picklable.
+
+    Returns:
+        Tuple (nom du scénario, historique)
+    """
+    kwargs = dict(shock_type=shock_type, magnitude=magnitude,
+                  steps=steps, shock_time=shock_time)
+    results = _run_one('_run_shock', kwargs, n_agents,
+                       _sweep_seed(shock_type, magnitude))
+    return results[0]
+
+
+# Scénarios indépendants exécutés par ScenarioRunner.run_all()
+_ALL_SCENARIOS = (
+    'run_baseline',
+    'run_wealth_loss_shock',
+    'run_demand_surge_shock',
+    'run_supply_shock',
+    'run_systemic_crisis',
+    'run_comparison_no_regulation',
+    'run_regulation_only',
+    'run_baseline_stable',
+    'run_crisis_high_volatility',
+)
+
+
+def _run_one(method_name: str, kwargs: Dict[str, Any], n_agents: int,
+             seed: Optional[int] = None) -> List[Tuple[str, Dict]]:
+    """
+    Exécute un scénario dans un ScenarioRunner neuf (processus isolé)
+
+    Seul l'historique (dict picklable) est renvoyé, pas l'IRISEconomy.
+
+    Returns:
+        Liste des (nom du scénario, historique) produits par la méthode
+    """
+    # Préfixe le nom du processus : les sorties des workers s'entremêlent
+    logging.basicConfig(level=logging.INFO, format='%(processName)s %(message)s',
+                        stream=sys.stdout)
+    runner = ScenarioRunner(n_agents=n_agents, seed=seed)
+    getattr(runner, method_name)(**kwargs)
+    return list(runner.results.items())
+
 
 class ScenarioRunner:
     """Classe pour exécuter et comparer différents scénarios"""
 
-    def __init__(self, n_agents: int = 100, output_dir: str = "results"):
+    def __init__(self, n_agents: int = 100, output_dir: str = "results",
+                 history_backend: str = 'dict', seed: Optional[int] = None):
         """
         Initialise le gestionnaire de scénarios
 
         Args:
             n_agents: Nombre d'agents dans chaque simulation
             output_dir: Répertoire de sortie
+            history_backend: 'dict' ou 'memmap' (séries principales écrites
+                             sous output_dir/history, un dossier par économie)
+            seed: Graine du générateur partagé (None = aléatoire)
         """
         self.n_agents = n_agents
         self.output_dir = output_dir
+        self.history_backend = history_backend
+        self.rng = np.random.default_rng(seed)
         self.results: Dict[str, Dict] = {}
+        # Conversions liste -> ndarray déjà faites, par (scénario, clé, dtype)
+        self._array_cache: Dict[Tuple[str, str, str], Tuple[list, int, np.ndarray]] = {}
+        # Économies stabilisées picklées, par (shock_time, steps) (_stabilized_economy)
+        self._stabilized: Dict[Tuple[int, int], bytes] = {}
+        # Graphiques rendus en tâche de fond (compare_scenarios)
+        self._plot_executor: Optional[ThreadPoolExecutor] = None
+        self._plot_futures: List[Future] = []
+        # Sans effet si l'application a déjà configuré le logging
+        logging.basicConfig(level=logging.INFO, format='%(message)s', stream=sys.stdout)
 
     def run_baseline(self, steps: int = 1000) -> IRISEconomy:
         """
@@ -52,78 +281,131 @@ class ScenarioRunner:
         Returns:
             Économie IRIS après simulation
         """
-        print("\n" + "="*70)
-        print("SCÉNARIO 1 : BASELINE - Fonctionnement Normal")
-        print("="*70)
-
-        economy = IRISEconomy(
-            initial_agents=self.n_agents,
-            gold_factor=1.0,
-            universal_income_rate=0.01
+        logger.info("\n" + "="*70)
+        logger.info("SCÉNARIO 1 : BASELINE - Fonctionnement Normal")
+        logger.info("="*70)
+
+        economy = IRISEconomy.from_preset(
+            'baseline', initial_agents=self.n_agents,
+            **self._economy_kwargs(steps)
         )
 
         economy.simulate(steps=steps, n_transactions=20)
 
         self.results['baseline'] = economy.history
 
-        print(f"\n📈 Résultats baseline :")
-        print(f"  Thermomètre final : {economy.thermometer():.4f}")
-        print(f"  Indicateur final : {economy.indicator():.4f}")
-        print(f"  Gini final : {economy.gini_coefficient():.4f}")
+        logger.info("\n📈 Résultats baseline :")
+        logger.info("  Thermomètre final : %.4f", economy.thermometer())
+        logger.info("  Indicateur final : %.4f", economy.indicator())
+        logger.info("  Gini final : %.4f", economy.gini_coefficient())
 
         return economy
 
-    def run_wealth_loss_shock(self, steps: int = 1000,
-                              shock_time: int = 500,
-                              magnitude: float = 0.3) -> IRISEconomy:
+    def _run_shock(self, shock_type: str, magnitude: float, steps: int = 1000,
+                   shock_time: int = 500,
+                   monitor: Optional[Sequence[str]] = None) -> IRISEconomy:
         """
-        Scénario de choc de richesse : destruction d'une partie du patrimoine
-        (catastrophe naturelle, guerre, crise financière)
+        Scénario à choc unique, piloté par la table _SHOCK_SPECS
+
+        Construit l'économie, simule `steps` pas avec le choc injecté à
+        shock_time, enregistre l'historique puis affiche le bilan propre au
+        type de choc.
 
         Args:
+            shock_type: 'wealth_loss', 'demand_surge' ou 'supply_shock'
+            magnitude: Intensité du choc
             steps: Durée de la simulation
             shock_time: Moment du choc
-            magnitude: Proportion de richesse détruite (0-1)
+            monitor: Séries affichées pendant la simulation (défaut : table)
 
         Returns:
             Économie IRIS après simulation
         """
-        print("\n" + "="*70)
-        print(f"SCÉNARIO 2 : CHOC DE RICHESSE - Perte de {magnitude*100:.0f}% du patrimoine")
-        print("="*70)
-
-        economy = IRISEconomy(
-            initial_agents=self.n_agents,
-            gold_factor=1.0,
-            universal_income_rate=0.01
-        )
+        spec = _SHOCK_SPECS[shock_type]
 
-        # Phase pré-choc
-        print(f"\nPhase 1 : Stabilisation initiale ({shock_time} pas)...")
-        for _ in range(shock_time):
-            economy.step(n_transactions=20)
+        logger.info("\n" + "="*70)
+        logger.info("%s", spec['title'](magnitude))
+        logger.info("="*70)
 
-        # Injection du choc
-        economy.inject_shock('wealth_loss', magnitude)
+        # Choc unique à shock_time, progression lue dans l'historique
+        log_callback = _log_fields(*(monitor or spec['monitor']), total=steps)
+        economy = self._stabilized_economy(steps, shock_time, log_callback)
+        logger.info("Puis %s post-choc (%s pas)...", spec['phase'], steps - economy.time)
+        schedule = [(shock_time, shock_type, magnitude)]
+        economy.simulate(steps=steps - economy.time, n_transactions=20,
+                         shock_schedule=schedule, log_callback=log_callback)
 
-        # Phase post-choc
-        print(f"\nPhase 2 : Récupération post-choc ({steps - shock_time} pas)...")
-        for _ in range(steps - shock_time):
-            economy.step(n_transactions=20)
-            if (economy.time) % 100 == 0:
-                theta = economy.thermometer()
-                indicator = economy.indicator()
-                print(f"  Pas {economy.time}/{steps} - θ={theta:.4f}, I={indicator:.4f}")
+        pre_key = spec.get('pre_shock')
+        if pre_key and 0 < shock_time <= len(economy.history[pre_key]):
+            label = _FIELD_LABELS.get(pre_key, pre_key)
+            logger.info("  %s avant choc : %.4f", label, economy.history[pre_key][shock_time - 1])
 
-        self.results[f'wealth_loss_{int(magnitude*100)}'] = economy.history
+        self.results[spec['result_key'](magnitude)] = economy.history
 
-        print(f"\n📈 Résultats après choc de richesse :")
-        print(f"  Thermomètre final : {economy.thermometer():.4f}")
-        print(f"  Indicateur final : {economy.indicator():.4f}")
-        print(f"  Temps de récupération : {self._compute_recovery_time(economy.history, shock_time)} pas")
+        logger.info("\n📈 Résultats après %s :", spec['label'])
+        for label, metric in spec['finals']:
+            logger.info("  %s : %.4f", label, metric(economy))
+        if spec.get('recovery'):
+            logger.info("  Temps de récupération : %s pas", self._compute_recovery_time(economy.history, shock_time))
 
         return economy
 
+    def _stabilized_economy(self, steps: int, shock_time: int,
+                            log_callback=None) -> IRISEconomy:
+        """
+        Copie d'une économie stabilisée jusqu'à shock_time
+
+        La phase de stabilisation est identique pour tous les chocs : elle
+        est simulée une seule fois par (shock_time, steps), picklée, puis
+        chaque scénario repart d'une copie (générateur compris, les chocs sont
+        donc comparés sur le même flux aléatoire). steps fait partie de la clé
+        car il fixe la préallocation de l'historique (steps_hint) de la copie.
+        La progression (log_callback) n'est affichée que lors de la simulation
+        effective ; une copie en cache est simplement signalée. En mode
+        memmap, le dossier de l'économie stabilisée garde les shock_time
+        premiers pas, et chaque copie écrit son historique complet dans son
+        propre dossier sous output_dir/history (conservé).
+
+        Args:
+            steps: Durée totale du scénario (préallocation de l'historique)
+            shock_time: Fin de la stabilisation
+            log_callback: Progression pendant la stabilisation
+
+        Returns:
+            Économie neuve au temps min(shock_time, steps)
+        """
+        shock_time = max(0, min(shock_time, steps))
+        key = (shock_time, steps)
+        if key not in self._stabilized:
+            logger.info("\nStabilisation (%s pas)...", shock_time)
+            economy = IRISEconomy.from_preset(
+                'baseline', initial_agents=self.n_agents,
+                **self._economy_kwargs(steps)
+            )
+            economy.simulate(steps=shock_time, n_transactions=20,
+                             log_callback=log_callback)
+            self._stabilized[key] = pickle.dumps(economy, protocol=pickle.HIGHEST_PROTOCOL)
+        else:
+            logger.info("\nÉtat stabilisé (%s pas) réutilisé depuis le cache", shock_time)
+        return pickle.loads(self._stabilized[key])
+
+    def run_wealth_loss_shock(self, steps: int = 1000,
+                              shock_time: int = 500,
+                              magnitude: float = 0.3) -> IRISEconomy:
+        """
+        Scénario de choc de richesse : destruction d'une partie du patrimoine
+        (catastrophe naturelle, guerre, crise financière)
+
+        Args:
+            steps: Durée de la simulation
+            shock_time: Moment du choc
+            magnitude: Proportion de richesse détruite (0-1)
+
+        Returns:
+            Économie IRIS après simulation
+        """
+        return self._run_shock('wealth_loss', magnitude, steps, shock_time)
+
     def run_demand_surge_shock(self, steps: int = 1000,
                                shock_time: int = 500,
                                magnitude: float = 0.5) -> IRISEconomy:
@@ -139,96 +421,24 @@ class ScenarioRunner:
         Returns:
             Économie IRIS après simulation
         """
-        print("\n" + "="*70)
-        print(f"SCÉNARIO 3 : CHOC DE DEMANDE - Conversion massive {magnitude*100:.0f}% V→U")
-        print("="*70)
-
-        economy = IRISEconomy(
-            initial_agents=self.n_agents,
-            gold_factor=1.0,
-            universal_income_rate=0.01
-        )
-
-        # Phase pré-choc
-        print(f"\nPhase 1 : Stabilisation initiale ({shock_time} pas)...")
-        for _ in range(shock_time):
-            economy.step(n_transactions=20)
-
-        # Injection du choc
-        economy.inject_shock('demand_surge', magnitude)
-
-        # Phase post-choc
-        print(f"\nPhase 2 : Régulation post-choc ({steps - shock_time} pas)...")
-        for _ in range(steps - shock_time):
-            economy.step(n_transactions=20)
-            if (economy.time) % 100 == 0:
-                theta = economy.thermometer()
-                kappa = economy.rad.kappa
-                print(f"  Pas {economy.time}/{steps} - θ={theta:.4f}, κ={kappa:.4f}")
-
-        self.results[f'demand_surge_{int(magnitude*100)}'] = economy.history
-
-        print(f"\n📈 Résultats après choc de demande :")
-        print(f"  Thermomètre final : {economy.thermometer():.4f}")
-        print(f"  Coefficient κ final : {economy.rad.kappa:.4f}")
-        print(f"  Taux de circulation U/V : {economy.circulation_rate():.4f}")
-
-        return economy
+        return self._run_shock('demand_surge', magnitude, steps, shock_time)
 
     def run_supply_shock(self, steps: int = 1000,
                         shock_time: int = 500,
                         magnitude: float = 2.0) -> IRISEconomy:
         """
-        Scénario de choc d'offre : augmentation des coûts de transaction
+        Scénario de choc d'offre : réduction temporaire du rendement η
         (crise énergétique, inflation des coûts)
 
         Args:
             steps: Durée de la simulation
             shock_time: Moment du choc
-            magnitude: Multiplicateur du taux de dissipation
+            magnitude: Intensité du choc (η × (1 - magnitude/2), borné à η_min)
 
         Returns:
             Économie IRIS après simulation
         """
-        print("\n" + "="*70)
-        print(f"SCÉNARIO 4 : CHOC D'OFFRE - Augmentation dissipation ×{magnitude:.1f}")
-        print("="*70)
-
-        economy = IRISEconomy(
-            initial_agents=self.n_agents,
-            gold_factor=1.0,
-            universal_income_rate=0.01
-        )
-
-        # Phase pré-choc
-        print(f"\nPhase 1 : Stabilisation initiale ({shock_time} pas)...")
-        for _ in range(shock_time):
-            economy.step(n_transactions=20)
-
-        dissipation_before = economy.rad.dissipation_rate
-
-        # Injection du choc
-        economy.inject_shock('supply_shock', magnitude)
-
-        print(f"  Dissipation avant : {dissipation_before:.4f}")
-        print(f"  Dissipation après : {economy.rad.dissipation_rate:.4f}")
-
-        # Phase post-choc
-        print(f"\nPhase 2 : Adaptation post-choc ({steps - shock_time} pas)...")
-        for _ in range(steps - shock_time):
-            economy.step(n_transactions=20)
-            if (economy.time) % 100 == 0:
-                theta = economy.thermometer()
-                dissip = economy.rad.dissipation_rate
-                print(f"  Pas {economy.time}/{steps} - θ={theta:.4f}, dissipation={dissip:.4f}")
-
-        self.results[f'supply_shock_{int(magnitude*10)}'] = economy.history
-
-        print(f"\n📈 Résultats après choc d'offre :")
-        print(f"  Thermomètre final : {economy.thermometer():.4f}")
-        print(f"  Dissipation finale : {economy.rad.dissipation_rate:.4f}")
-
-        return economy
+        return self._run_shock('supply_shock', magnitude, steps, shock_time)
 
     def run_systemic_crisis(self, steps: int = 1500) -> IRISEconomy:
         """
@@ -240,67 +450,37 @@ class ScenarioRunner:
         Returns:
             Économie IRIS après simulation
         """
-        print("\n" + "="*70)
-        print("SCÉNARIO 5 : CRISE SYSTÉMIQUE - Chocs multiples")
-        print("="*70)
-
-        economy = IRISEconomy(
-            initial_agents=self.n_agents,
-            gold_factor=1.0,
-            universal_income_rate=0.01
+        logger.info("\n" + "="*70)
+        logger.info("SCÉNARIO 5 : CRISE SYSTÉMIQUE - Chocs multiples")
+        logger.info("="*70)
+
+        economy = IRISEconomy.from_preset(
+            'baseline', initial_agents=self.n_agents,
+            **self._economy_kwargs(steps)
         )
 
-        # Phase 1 : Stabilisation
-        phase1 = 300
-        print(f"\nPhase 1 : Stabilisation ({phase1} pas)...")
-        for _ in range(phase1):
-            economy.step(n_transactions=20)
-
-        # Choc 1 : Perte de richesse
-        print(f"\nATTENTION: CHOC 1 - Destruction de patrimoine (t={economy.time})")
-        economy.inject_shock('wealth_loss', 0.25)
-
-        # Phase 2 : Récupération partielle
-        phase2 = 300
-        print(f"\nPhase 2 : Récupération ({phase2} pas)...")
-        for _ in range(phase2):
-            economy.step(n_transactions=20)
-
-        # Choc 2 : Choc de demande
-        print(f"\nATTENTION: CHOC 2 - Panique et conversion massive V→U (t={economy.time})")
-        economy.inject_shock('demand_surge', 0.6)
-
-        # Phase 3 : Régulation
-        phase3 = 400
-        print(f"\nPhase 3 : Régulation ({phase3} pas)...")
-        for _ in range(phase3):
-            economy.step(n_transactions=20)
-            if (economy.time) % 100 == 0:
-                theta = economy.thermometer()
-                indicator = economy.indicator()
-                kappa = economy.rad.kappa
-                print(f"  Pas {economy.time}/{steps} - θ={theta:.4f}, I={indicator:.4f}, κ={kappa:.4f}")
-
-        # Choc 3 : Choc d'offre
-        print(f"\nATTENTION: CHOC 3 - Crise énergétique (t={economy.time})")
-        economy.inject_shock('supply_shock', 2.5)
-
-        # Phase 4 : Stabilisation finale
-        remaining = steps - economy.time
-        print(f"\nPhase 4 : Stabilisation finale ({remaining} pas)...")
-        for _ in range(remaining):
-            economy.step(n_transactions=20)
-            if (economy.time) % 100 == 0:
-                theta = economy.thermometer()
-                indicator = economy.indicator()
-                print(f"  Pas {economy.time}/{steps} - θ={theta:.4f}, I={indicator:.4f}")
+        # Calendrier des chocs (temps absolu) :
+        #   t=300  : destruction de patrimoine
+        #   t=600  : panique et conversion massive V→U
+        #   t=1000 : crise énergétique
+        schedule = [
+            (300, 'wealth_loss', 0.25),
+            (600, 'demand_surge', 0.6),
+            (1000, 'supply_shock', 2.5),
+        ]
+        logger.info("\nChocs programmés : %s", ", ".join(f"{kind} (t={t})" for t, kind, _ in schedule))
+        economy.simulate(steps=steps, n_transactions=20, shock_schedule=schedule,
+                         log_callback=_log_fields('thermometer', 'indicator', 'kappa'))
 
         self.results['systemic_crisis'] = economy.history
 
-        print(f"\n📈 Résultats après crise systémique :")
-        print(f"  Thermomètre final : {economy.thermometer():.4f}")
-        print(f"  Indicateur final : {economy.indicator():.4f}")
-        print(f"  Système stable : {abs(economy.indicator()) < 0.1}")
+        theta_final = economy.thermometer()
+        indicator_final = theta_final - 1.0
+
+        logger.info("\n📈 Résultats après crise systémique :")
+        logger.info("  Thermomètre final : %.4f", theta_final)
+        logger.info("  Indicateur final : %.4f", indicator_final)
+        logger.info("  Système stable : %s", abs(indicator_final) < 0.1)
 
         return economy
 
@@ -321,49 +501,237 @@ class ScenarioRunner:
         Returns:
             Économie IRIS sans régulation
         """
-        print("\n" + "="*70)
-        print("SCÉNARIO 6 : SYSTÈME SANS RÉGULATION (témoin)")
-        print("="*70)
-
-        economy = IRISEconomy(
-            initial_agents=self.n_agents,
-            gold_factor=1.0,
-            universal_income_rate=0.01
+        logger.info("\n" + "="*70)
+        logger.info("SCÉNARIO 6 : SYSTÈME SANS RÉGULATION (témoin)")
+        logger.info("="*70)
+
+        # Régulation C1 gelée dès la construction : κ et η restent fixes
+        economy = IRISEconomy.from_preset(
+            'baseline_no_regulation', initial_agents=self.n_agents,
+            **self._economy_kwargs(steps)
         )
 
-        # Désactive la régulation en fixant kappa
-        original_kappa = economy.rad.kappa
-
-        # Phase pré-choc
-        print(f"\nPhase 1 : Avant choc ({shock_time} pas)...")
-        for _ in range(shock_time):
-            # Pas de régulation : kappa reste fixe
-            economy.step(n_transactions=20)
-            economy.rad.kappa = original_kappa  # Force kappa constant
-
-        # Injection du choc
-        print(f"\nATTENTION: Choc : {shock_type} (magnitude={magnitude})")
-        economy.inject_shock(shock_type, magnitude)
-
-        # Phase post-choc sans régulation
-        print(f"\nPhase 2 : Après choc SANS régulation ({steps - shock_time} pas)...")
-        for _ in range(steps - shock_time):
-            economy.step(n_transactions=20)
-            economy.rad.kappa = original_kappa  # Force kappa constant
-            if (economy.time) % 100 == 0:
-                theta = economy.thermometer()
-                indicator = economy.indicator()
-                print(f"  Pas {economy.time}/{steps} - θ={theta:.4f}, I={indicator:.4f}")
+        # Choc unique à shock_time, sans régulation de κ
+        logger.info("\nAvant choc (%s pas) puis après choc SANS régulation (%s pas)...", shock_time, steps - shock_time)
+        schedule = [(shock_time, shock_type, magnitude)]
+        economy.simulate(steps=steps, n_transactions=20, shock_schedule=schedule,
+                         log_callback=_log_fields('thermometer', 'indicator'))
 
         self.results['no_regulation'] = economy.history
 
-        print(f"\n📈 Résultats sans régulation :")
-        print(f"  Thermomètre final : {economy.thermometer():.4f}")
-        print(f"  Indicateur final : {economy.indicator():.4f}")
-        print(f"  ATTENTION: Déviation importante : {abs(economy.indicator()) > 0.1}")
+        theta_final = economy.thermometer()
+        indicator_final = theta_final - 1.0
+
+        logger.info("\n📈 Résultats sans régulation :")
+        logger.info("  Thermomètre final : %.4f", theta_final)
+        logger.info("  Indicateur final : %.4f", indicator_final)
+        if abs(indicator_final) > 0.1:
+            logger.warning("  ATTENTION: Déviation importante (|I| = %.4f > 0.1)",
+                           abs(indicator_final))
 
         return economy
 
+    def _economy_kwargs(self, steps: int, seed: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Arguments communs (historique, générateur) pour une nouvelle IRISEconomy
+
+        Chaque économie reçoit un Generator dérivé de self.rng : les scénarios
+        sont reproductibles à partir de la seule graine du runner. Une graine
+        `seed` propre au scénario remplace ce générateur dérivé. En mode
+        memmap, chaque économie reçoit son propre dossier afin que les
+        historiques déjà stockés dans self.results restent valides.
+        """
+        kwargs: Dict[str, Any] = {
+            'steps_hint': steps,
+            'history_backend': self.history_backend,
+            'rng': np.random.default_rng(int(self.rng.integers(1 << 63))),
+        }
+        if seed is not None:
+            kwargs['seed'] = seed
+            kwargs['rng'] = np.random.default_rng(seed)
+        if self.history_backend == 'memmap':
+            history_root = os.path.join(self.output_dir, 'history')
+            os.makedirs(history_root, exist_ok=True)
+            kwargs['history_dir'] = tempfile.mkdtemp(dir=history_root)
+        return kwargs
+
+    @staticmethod
+    def _list_to_array(src, dtype=np.float64) -> np.ndarray:
+        """
+        Convertit une série d'historique en ndarray (float64 par défaut)
+
+        np.fromiter fait un seul passage sur la liste (np.array sonde d'abord
+        la forme puis convertit chaque élément). Le résultat est toujours
+        C-contigu, y compris quand la source est une vue découpée.
+
+        Args:
+            src: Série d'historique (liste de scalaires ou ndarray)
+            dtype: Type des éléments du résultat
+
+        Returns:
+            Tableau C-contigu
+        """
+        if isinstance(src, np.ndarray):
+            return np.ascontiguousarray(src, dtype=dtype)
+        return np.fromiter(src, dtype=dtype, count=len(src))
+
+    def _to_array(self, name: str, key: str, dtype=REPORT_DTYPE) -> np.ndarray:
+        """
+        Série `key` du scénario `name` sous forme de ndarray, avec cache
+
+        L'entrée du cache est invalidée si l'historique a été remplacé
+        (nouvelle exécution du scénario) ou a grandi depuis la conversion.
+
+        Args:
+            name: Nom du scénario dans self.results
+            key: Clé de l'historique ('thermometer', 'indicator', ...)
+            dtype: Type des éléments (REPORT_DTYPE par défaut)
+
+        Returns:
+            Tableau C-contigu
+        """
+        src = self.results[name][key]
+        cache_key = (name, key, np.dtype(dtype).str)
+        cached = self._array_cache.get(cache_key)
+        if cached is not None and cached[0] is src and cached[1] == len(src):
+            return cached[2]
+
+        arr = self._list_to_array(src, dtype)
+        self._array_cache[cache_key] = (src, len(src), arr)
+        return arr
+
+    def run_all(self, parallel: bool = True, max_workers: Optional[int] = None,
+                seed: Optional[int] = None,
+                scenarios: Sequence[str] = _ALL_SCENARIOS,
+                scenario_kwargs: Optional[Dict[str, Dict[str, Any]]] = None) -> Dict[str, Dict]:
+        """
+        Exécute tous les scénarios indépendants, en parallèle si demandé
+
+        Chaque scénario construit sa propre IRISEconomy et ne partage aucun
+        état : ils sont répartis sur plusieurs processus (contexte 'spawn',
+        qui évite d'hériter de l'état BLAS/threads du parent).
+
+        Args:
+            parallel: Exécution multi-processus
+            max_workers: Nombre de processus (défaut : os.cpu_count())
+            seed: Graine de base ; chaque scénario reçoit une graine dérivée
+            scenarios: Noms des méthodes run_* à exécuter
+            scenario_kwargs: Arguments par méthode, ex. {'run_baseline': {'steps': 500}}
+
+        Returns:
+            self.results mis à jour
+        """
+        scenario_kwargs = scenario_kwargs or {}
+        tasks = []
+        for name in scenarios:
+            task_seed = None if seed is None else (seed + zlib.crc32(name.encode())) % (2**32)
+            tasks.append((name, scenario_kwargs.get(name, {}), self.n_agents, task_seed))
+
+        if parallel and len(tasks) > 1:
+            ctx = multiprocessing.get_context('spawn')
+            with ProcessPoolExecutor(max_workers=max_workers or os.cpu_count(),
+                                     mp_context=ctx) as executor:
+                outputs = list(executor.map(_run_one, *zip(*tasks)))
+        else:
+            outputs = [_run_one(*task) for task in tasks]
+
+        for results in outputs:
+            self.results.update(results)
+        return self.results
+
+    def run_sweep(self, shock_type: str, magnitudes: Sequence[float],
+                  steps: int = 1000, shock_time: int = 500,
+                  n_jobs: int = -1) -> Dict[str, Dict]:
+        """
+        Balayage parallèle de la magnitude d'un type de choc
+
+        Chaque magnitude est simulée dans un processus séparé avec une graine
+        dérivée de (shock_type, magnitude), donc reproductible. Utilise joblib
+        si disponible, sinon ProcessPoolExecutor.
+
+        Args:
+            shock_type: 'wealth_loss', 'demand_surge' ou 'supply_shock'
+            magnitudes: Magnitudes à simuler
+            steps: Durée de chaque simulation
+            shock_time: Moment du choc
+            n_jobs: Nombre de processus (-1 = tous les cœurs)
+
+        Returns:
+            Historiques du balayage, indexés par nom de scénario
+        """
+        if shock_type not in _SHOCK_SPECS:
+            raise ValueError(f"Type de choc inconnu : {shock_type} "
+                             f"(attendu : {', '.join(_SHOCK_SPECS)})")
+
+        args = [(self.n_agents, shock_type, float(m), steps, shock_time)
+                for m in magnitudes]
+
+        if JOBLIB_AVAILABLE:
+            res = Parallel(n_jobs=n_jobs)(delayed(_run_one_shock)(*a) for a in args)
+        else:
+            max_workers = None if n_jobs == -1 else n_jobs
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                res = list(executor.map(_run_one_shock, *zip(*args)))
+
+        sweep = dict(res)
+        self.results.update(sweep)
+        return sweep
+
+    def scenario_result(self, name: str) -> ScenarioResult:
+        """
+        Vue typée d'un scénario exécuté
+
+        Args:
+            name: Nom du scénario dans self.results
+
+        Returns:
+            ScenarioResult construit à partir du cache de conversion
+        """
+        theta = self._to_array(name, 'thermometer')
+        gini = self._to_array(name, 'gini_coefficient')
+        return ScenarioResult(
+            name=name,
+            thermometer=theta,
+            indicator=self._to_array(name, 'indicator'),
+            gini_coefficient=gini,
+            gini_final=float(gini[-1]) if gini.size else float('nan'),
+            n_steps=int(theta.size),
+        )
+
+    @staticmethod
+    def _hist_stats(theta: np.ndarray, indicator: np.ndarray) -> Tuple[float, ...]:
+        """
+        Statistiques du rapport comparatif en un minimum de passes
+
+        Moyennes et écarts-types via somme et produit scalaire (pas de
+        tableau centré temporaire) ; 95e percentile de |I| par sélection
+        (np.partition) au lieu d'un tri complet, interpolation linéaire
+        identique à np.percentile ; max |I| lu sur la partie haute.
+        Les séries peuvent être en float32 : les accumulations se font
+        en float64.
+
+        Returns:
+            (θ moyen, σ_θ, I moyen, σ_I, p95 |I|, max |I|)
+        """
+        def mean_std(x: np.ndarray) -> Tuple[float, float]:
+            n = x.size
+            mean = x.sum(dtype=np.float64) / n
+            var = max(0.0, np.einsum('i,i->', x, x, dtype=np.float64) / n - mean * mean)
+            return float(mean), float(np.sqrt(var))
+
+        theta_mean, theta_std = mean_std(theta)
+        ind_mean, ind_std = mean_std(indicator)
+
+        abs_ind = np.abs(indicator)
+        pos = 0.95 * (abs_ind.size - 1)
+        lo = int(pos)
+        hi = min(lo + 1, abs_ind.size - 1)
+        abs_ind.partition([lo, hi])
+        p95 = abs_ind[lo] + (abs_ind[hi] - abs_ind[lo]) * (pos - lo)
+        max_abs = abs_ind[hi:].max()
+
+        return theta_mean, theta_std, ind_mean, ind_std, float(p95), float(max_abs)
+
     def _compute_recovery_time(self, history: Dict, shock_time: int,
                               threshold: float = 0.05) -> int:
         """
@@ -377,63 +745,97 @@ class ScenarioRunner:
         Returns:
             Nombre de pas pour revenir à l'équilibre
         """
-        indicator = np.array(history['indicator'])
-
-        # Cherche le premier moment après le choc où |I| < threshold
-        post_shock = indicator[shock_time:]
+        indicator = self._list_to_array(history['indicator'], REPORT_DTYPE)
 
-        for i, val in enumerate(post_shock):
-            if abs(val) < threshold:
-                return i
+        # Premier moment après le choc où |I| < threshold
+        # (argmax sur un masque booléen renvoie l'indice du premier True)
+        post_shock = np.ascontiguousarray(indicator[shock_time:])
+        hits = np.abs(post_shock) < threshold
+        if hits.any():
+            return int(np.argmax(hits))
 
         return len(post_shock)  # Pas revenu à l'équilibre
 
-    def compare_scenarios(self, shock_time: int = 500):
+    def compare_scenarios(self, shock_time: int = 500,
+                          background: bool = True) -> Optional[Future]:
         """
         Génère des visualisations comparatives de tous les scénarios
 
+        En tâche de fond, le rendu Matplotlib se poursuit pendant que
+        l'appelant enchaîne (rapport, autres scénarios) ; wait_for_plots()
+        attend la fin des rendus.
+
         Args:
             shock_time: Moment du choc (pour les graphiques)
+            background: Rendu dans un thread de fond
+
+        Returns:
+            Future du rendu en tâche de fond, None sinon
         """
         if not self.results:
-            print("ATTENTION: Aucun scénario n'a été exécuté. Lancez d'abord les scénarios.")
-            return
+            logger.warning("ATTENTION: Aucun scénario n'a été exécuté. Lancez d'abord les scénarios.")
+            return None
 
         viz = IRISVisualizer(self.output_dir)
 
-        print("\nGénération des comparaisons visuelles...")
+        logger.info("\nGénération des comparaisons visuelles...")
 
-        # Graphique de comparaison des chocs
-        viz.plot_shock_comparison(self.results, shock_time)
+        # Graphique de comparaison des chocs (copie : self.results peut encore grandir)
+        results = dict(self.results)
+        if not background:
+            viz.plot_shock_comparison(results, shock_time)
+            logger.info("OK: Visualisations comparatives générées")
+            return None
 
-        print("OK: Visualisations comparatives générées")
+        if self._plot_executor is None:
+            self._plot_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="iris-plot")
+        future = self._plot_executor.submit(viz.plot_shock_comparison, results, shock_time)
+        self._plot_futures.append(future)
+        return future
+
+    def wait_for_plots(self) -> None:
+        """
+        Attend les graphiques lancés en tâche de fond
+
+        Les exceptions levées pendant le rendu sont propagées ici.
+        """
+        futures, self._plot_futures = self._plot_futures, []
+        try:
+            for future in futures:
+                future.result()
+        finally:
+            if self._plot_executor is not None:
+                self._plot_executor.shutdown(wait=True)
+                self._plot_executor = None
+        if futures:
+            logger.info("OK: Visualisations comparatives générées")
 
     def generate_comparative_report(self):
         """
         Génère un rapport comparatif de tous les scénarios
         """
         if not self.results:
-            print("ATTENTION: Aucun résultat à rapporter.")
+            logger.warning("ATTENTION: Aucun résultat à rapporter.")
             return
 
-        print("\n" + "="*70)
-        print("RAPPORT COMPARATIF - Résilience du Système IRIS")
-        print("="*70 + "\n")
+        logger.info("\n" + "="*70)
+        logger.info("RAPPORT COMPARATIF - Résilience du Système IRIS")
+        logger.info("="*70 + "\n")
+
+        scenarios = [self.scenario_result(name) for name in self.results]
 
-        for scenario_name, history in self.results.items():
-            theta_array = np.array(history['thermometer'])
-            indicator_array = np.array(history['indicator'])
-            gini_array = np.array(history['gini_coefficient'])
+        for result in scenarios:
+            theta_mean, theta_std, ind_mean, ind_std, ind_p95, max_deviation = \
+                self._hist_stats(result.thermometer, result.indicator)
 
-            print(f"\n{scenario_name.upper()}")
-            print(f"  {'─'*60}")
-            print(f"  Thermomètre moyen : {theta_array.mean():.4f} ± {theta_array.std():.4f}")
-            print(f"  Indicateur moyen : {indicator_array.mean():.4f} ± {indicator_array.std():.4f}")
-            print(f"  Gini final : {gini_array[-1]:.4f}")
-            print(f"  Stabilité (95% déviations) : {np.percentile(np.abs(indicator_array), 95):.4f}")
+            logger.info("\n%s", result.name.upper())
+            logger.info("  %s", '─'*60)
+            logger.info("  Thermomètre moyen : %.4f ± %.4f", theta_mean, theta_std)
+            logger.info("  Indicateur moyen : %.4f ± %.4f", ind_mean, ind_std)
+            logger.info("  Gini final : %.4f", result.gini_final)
+            logger.info("  Stabilité (95%% déviations) : %.4f", ind_p95)
 
             # Évaluation de la résilience
-            max_deviation = np.max(np.abs(indicator_array))
             if max_deviation < 0.1:
                 resilience = "🟢 EXCELLENTE"
             elif max_deviation < 0.2:
@@ -443,9 +845,9 @@ class ScenarioRunner:
             else:
                 resilience = "🔴 FAIBLE"
 
-            print(f"  Résilience : {resilience} (déviation max = {max_deviation:.4f})")
+            logger.info("  Résilience : %s (déviation max = %.4f)", resilience, max_deviation)
 
-        print("\n" + "="*70 + "\n")
+        logger.info("\n" + "="*70 + "\n")
 
     def run_regulation_only(self, steps: int = 1000) -> IRISEconomy:
         """
@@ -484,58 +886,48 @@ class ScenarioRunner:
         Returns:
             Économie IRIS après simulation (mode régulation pure)
         """
-        print("\n" + "="*70)
-        print("SCÉNARIO : REGULATION ONLY - Mécanismes de Régulation Pure")
-        print("="*70)
-        print("\n📌 MODE RÉGULATION PURE (pour illustration théorique)")
-        print("   Modules actifs : V, U, D, θ, κ, η, RU, r_ic, ν_eff")
-        print("   Modules désactivés : démographie, catastrophes, prix, entreprises\n")
+        logger.info("\n" + "="*70)
+        logger.info("SCÉNARIO : REGULATION ONLY - Mécanismes de Régulation Pure")
+        logger.info("="*70)
+        logger.info("\n📌 MODE RÉGULATION PURE (pour illustration théorique)")
+        logger.info("   Modules actifs : V, U, D, θ, κ, η, RU, r_ic, ν_eff")
+        logger.info("   Modules désactivés : démographie, catastrophes, prix, entreprises\n")
 
         # Création de l'économie avec TOUS les modules complexes désactivés
-        economy = IRISEconomy(
-            initial_agents=self.n_agents,
-            gold_factor=1.0,
-            universal_income_rate=0.01,
-            # ═══════════════════════════════════════════════════════════════
-            # DÉSACTIVATION DE TOUS LES MODULES COMPLEXES
-            # ═══════════════════════════════════════════════════════════════
-            enable_demographics=False,           # Pas de naissances/décès
-            enable_catastrophes=False,           # Pas de chocs aléatoires
-            enable_price_discovery=False,        # Pas de prix dynamiques
-            enable_dynamic_business=False,       # Pas de créations/faillites
-            enable_business_combustion=False,    # Pas de production entreprise
-            enable_chambre_relance=False,        # Pas de redistribution CR
+        economy = IRISEconomy.from_preset(
+            'regulation_only', initial_agents=self.n_agents,
+            **self._economy_kwargs(steps)
         )
 
-        print(f"Simulation de {steps} steps (mois) en mode régulation pure...")
+        logger.info("Simulation de %s steps (mois) en mode régulation pure...", steps)
         economy.simulate(steps=steps, n_transactions=20)
 
         self.results['regulation_only'] = economy.history
 
         # Analyse des résultats
-        print(f"\n📈 Résultats (mode régulation pure) :")
-        print(f"  Thermomètre final (θ) : {economy.thermometer():.4f}")
-        print(f"  Indicateur final (I) : {economy.indicator():.4f}")
-        print(f"  Kappa final (κ) : {economy.rad.kappa:.4f}")
-        print(f"  Eta final (η) : {economy.rad.eta:.4f}")
-        print(f"  Gini final : {economy.gini_coefficient():.4f}")
+        theta_final = economy.thermometer()
+        logger.info("\n📈 Résultats (mode régulation pure) :")
+        logger.info("  Thermomètre final (θ) : %.4f", theta_final)
+        logger.info("  Indicateur final (I) : %.4f", theta_final - 1.0)
+        logger.info("  Kappa final (κ) : %.4f", economy.rad.kappa)
+        logger.info("  Eta final (η) : %.4f", economy.rad.eta)
+        logger.info("  Gini final : %.4f", economy.gini_coefficient())
 
         # Vérification de la stabilité
-        theta_history = np.array(economy.history['thermometer'])
+        theta_history = self._list_to_array(economy.history['thermometer'])
         if len(theta_history) > 0:
-            theta_mean = np.mean(theta_history)
-            theta_std = np.std(theta_history)
-            print(f"\n  Stabilité du thermomètre :")
-            print(f"    Moyenne : {theta_mean:.4f}")
-            print(f"    Écart-type : {theta_std:.4f}")
+            theta_mean, theta_std, _ = _summarize(theta_history)
+            logger.info("\n  Stabilité du thermomètre :")
+            logger.info("    Moyenne : %.4f", theta_mean)
+            logger.info("    Écart-type : %.4f", theta_std)
 
             # Convergence vers l'équilibre ?
             if abs(theta_mean - 1.0) < 0.1 and theta_std < 0.2:
-                print(f"    ✓ Le système converge vers l'équilibre (θ ≈ 1)")
+                logger.info("    ✓ Le système converge vers l'équilibre (θ ≈ 1)")
             else:
-                print(f"    ⚠ Le système s'éloigne de l'équilibre")
+                logger.info("    ⚠ Le système s'éloigne de l'équilibre")
 
-        print("\n" + "="*70 + "\n")
+        logger.info("\n" + "="*70 + "\n")
 
         return economy
 
@@ -583,78 +975,69 @@ class ScenarioRunner:
         Returns:
             Économie IRIS après simulation (état stable)
         """
-        print("\n" + "="*70)
-        print("SCÉNARIO 8 : BASELINE STABLE - Équilibre à Long Terme")
-        print("="*70)
-        print("\n📌 OBJECTIF : Démontrer la stabilité naturelle du système IRIS")
-        print("   Modules actifs : Tous (sauf catastrophes)")
-        print("   Paramètres : Par défaut (calibrés pour stabilité)\n")
+        logger.info("\n" + "="*70)
+        logger.info("SCÉNARIO 8 : BASELINE STABLE - Équilibre à Long Terme")
+        logger.info("="*70)
+        logger.info("\n📌 OBJECTIF : Démontrer la stabilité naturelle du système IRIS")
+        logger.info("   Modules actifs : Tous (sauf catastrophes)")
+        logger.info("   Paramètres : Par défaut (calibrés pour stabilité)\n")
 
         # Création de l'économie avec paramètres optimaux pour stabilité
-        economy = IRISEconomy(
-            initial_agents=self.n_agents,
-            gold_factor=1.0,
-            universal_income_rate=0.02,  # 2% RU annuel
-            # ═══════════════════════════════════════════════════════════════
-            # CONFIGURATION POUR STABILITÉ MAXIMALE
-            # ═══════════════════════════════════════════════════════════════
-            enable_demographics=True,             # Démographie réaliste
-            enable_catastrophes=False,            # Pas de chocs externes
-            enable_price_discovery=True,          # Prix dynamiques
-            enable_dynamic_business=True,         # Entreprises évolutives
-            enable_business_combustion=True,      # Production active
-            enable_chambre_relance=True,          # Redistribution
+        economy = IRISEconomy.from_preset(
+            'stable', initial_agents=self.n_agents,
+            **self._economy_kwargs(steps)
         )
 
         # Affichage initial
-        print(f"État initial :")
-        print(f"  Population : {len(economy.agents)} agents")
-        print(f"  V_on initial : {economy.get_V_on():.0f}")
-        print(f"  D total initial : {economy.rad.total_D():.0f}")
-        print(f"  Thermomètre θ : {economy.thermometer():.4f}")
+        logger.info("État initial :")
+        logger.info("  Population : %s agents", economy.population_size)
+        logger.info("  V_on initial : %.0f", economy.get_V_on())
+        logger.info("  D total initial : %.0f", economy.rad.total_D())
+        logger.info("  Thermomètre θ : %.4f", economy.thermometer())
 
         # Simulation longue durée
-        print(f"\nSimulation de {steps} steps ({steps//12} ans)...")
+        logger.info("\nSimulation de %s steps (%s ans)...", steps, steps//12)
         economy.simulate(steps=steps, n_transactions=20)
 
         self.results['baseline_stable'] = economy.history
 
         # Analyse de la stabilité
-        theta_history = np.array(economy.history['thermometer'])
-        indicator_history = np.array(economy.history['indicator'])
-        kappa_history = np.array(economy.history.get('kappa', [1.0] * len(theta_history)))
-
-        theta_mean = np.mean(theta_history)
-        theta_std = np.std(theta_history)
-        indicator_mean = np.mean(indicator_history)
-        indicator_std = np.std(indicator_history)
-
-        print(f"\n📈 Résultats (baseline stable) :")
-        print(f"  ═══════════════════════════════════════════════════════════")
-        print(f"  STABILITÉ THERMODYNAMIQUE :")
-        print(f"    Thermomètre θ moyen : {theta_mean:.4f} (cible = 1.0)")
-        print(f"    Écart-type θ : {theta_std:.4f}")
-        print(f"    Thermomètre θ final : {economy.thermometer():.4f}")
-        print(f"  ═══════════════════════════════════════════════════════════")
-        print(f"  RÉGULATION CONTRACYCLIQUE :")
-        print(f"    Indicateur I moyen : {indicator_mean:.4f} (cible = 0.0)")
-        print(f"    Écart-type I : {indicator_std:.4f}")
-        print(f"    Kappa κ final : {economy.rad.kappa:.4f}")
-        print(f"    Eta η final : {economy.rad.eta:.4f}")
-        print(f"  ═══════════════════════════════════════════════════════════")
-        print(f"  MÉTRIQUES ÉCONOMIQUES :")
-        print(f"    Population finale : {len(economy.agents)} agents")
-        print(f"    V_on final : {economy.get_V_on():.0f}")
-        print(f"    Coefficient Gini : {economy.gini_coefficient():.4f}")
-        print(f"  ═══════════════════════════════════════════════════════════")
+        theta_history = self._list_to_array(economy.history['thermometer'], REPORT_DTYPE)
+        indicator_history = self._list_to_array(economy.history['indicator'], REPORT_DTYPE)
+        if 'kappa' in economy.history:
+            kappa_history = self._list_to_array(economy.history['kappa'], REPORT_DTYPE)
+        else:
+            kappa_history = np.ones_like(theta_history)
+
+        theta_mean, theta_std, _ = _summarize(theta_history)
+        indicator_mean, indicator_std, _ = _summarize(indicator_history, target=0.0)
+
+        logger.info("\n📈 Résultats (baseline stable) :")
+        logger.info("  ═══════════════════════════════════════════════════════════")
+        logger.info("  STABILITÉ THERMODYNAMIQUE :")
+        logger.info("    Thermomètre θ moyen : %.4f (cible = 1.0)", theta_mean)
+        logger.info("    Écart-type θ : %.4f", theta_std)
+        logger.info("    Thermomètre θ final : %.4f", economy.thermometer())
+        logger.info("  ═══════════════════════════════════════════════════════════")
+        logger.info("  RÉGULATION CONTRACYCLIQUE :")
+        logger.info("    Indicateur I moyen : %.4f (cible = 0.0)", indicator_mean)
+        logger.info("    Écart-type I : %.4f", indicator_std)
+        logger.info("    Kappa κ final : %.4f", economy.rad.kappa)
+        logger.info("    Eta η final : %.4f", economy.rad.eta)
+        logger.info("  ═══════════════════════════════════════════════════════════")
+        logger.info("  MÉTRIQUES ÉCONOMIQUES :")
+        logger.info("    Population finale : %s agents", economy.population_size)
+        logger.info("    V_on final : %.0f", economy.get_V_on())
+        logger.info("    Coefficient Gini : %.4f", economy.gini_coefficient())
+        logger.info("  ═══════════════════════════════════════════════════════════")
 
         # Évaluation de la stabilité
         if abs(theta_mean - 1.0) < 0.1 and theta_std < 0.2:
-            print(f"  ✅ SYSTÈME STABLE : θ converge vers l'équilibre")
+            logger.info("  ✅ SYSTÈME STABLE : θ converge vers l'équilibre")
         else:
-            print(f"  ⚠️  SYSTÈME INSTABLE : déviation significative de θ")
+            logger.info("  ⚠️  SYSTÈME INSTABLE : déviation significative de θ")
 
-        print("\n" + "="*70 + "\n")
+        logger.info("\n" + "="*70 + "\n")
 
         return economy
 
@@ -703,27 +1086,17 @@ class ScenarioRunner:
         Returns:
             Économie IRIS après simulation (état post-crise)
         """
-        print("\n" + "="*70)
-        print("SCÉNARIO 9 : CRISIS HIGH VOLATILITY - Stress Test Extrême")
-        print("="*70)
-        print("\n📌 OBJECTIF : Tester les limites de résilience du système IRIS")
-        print("   Conditions : Catastrophes fréquentes, régulation hyper-réactive")
-        print("   Attente : Le RAD maintient la stabilité malgré la volatilité\n")
+        logger.info("\n" + "="*70)
+        logger.info("SCÉNARIO 9 : CRISIS HIGH VOLATILITY - Stress Test Extrême")
+        logger.info("="*70)
+        logger.info("\n📌 OBJECTIF : Tester les limites de résilience du système IRIS")
+        logger.info("   Conditions : Catastrophes fréquentes, régulation hyper-réactive")
+        logger.info("   Attente : Le RAD maintient la stabilité malgré la volatilité\n")
 
         # Création de l'économie avec paramètres de haute volatilité
-        economy = IRISEconomy(
-            initial_agents=self.n_agents,
-            gold_factor=1.0,
-            universal_income_rate=0.02,
-            # ═══════════════════════════════════════════════════════════════
-            # CONFIGURATION HAUTE VOLATILITÉ
-            # ═══════════════════════════════════════════════════════════════
-            enable_demographics=True,
-            enable_catastrophes=True,             # CATASTROPHES ACTIVÉES
-            enable_price_discovery=True,
-            enable_dynamic_business=True,
-            enable_business_combustion=True,
-            enable_chambre_relance=True,
+        economy = IRISEconomy.from_preset(
+            'high_volatility', initial_agents=self.n_agents,
+            **self._economy_kwargs(steps)
         )
 
         # Modification des paramètres RAD pour réactivité élevée
@@ -737,63 +1110,66 @@ class ScenarioRunner:
             economy.catastrophe_manager.base_frequency = 0.20  # 20% vs 5% normal
 
         # Affichage initial
-        print(f"État initial :")
-        print(f"  Population : {len(economy.agents)} agents")
-        print(f"  θ initial : {economy.thermometer():.4f}")
-        print(f"\n⚡ PARAMÈTRES DE VOLATILITÉ :")
-        print(f"  Catastrophes : 20% probabilité/an (4× normale)")
-        print(f"  Régulation RAD : réactivité maximale (κ_smooth=0.3, η_smooth=0.4)")
-        print(f"  Sensibilité : β=α=0.8 (1.6× normale)")
+        logger.info("État initial :")
+        logger.info("  Population : %s agents", economy.population_size)
+        logger.info("  θ initial : %.4f", economy.thermometer())
+        logger.info("\n⚡ PARAMÈTRES DE VOLATILITÉ :")
+        logger.info("  Catastrophes : 20%% probabilité/an (4× normale)")
+        logger.info("  Régulation RAD : réactivité maximale (κ_smooth=0.3, η_smooth=0.4)")
+        logger.info("  Sensibilité : β=α=0.8 (1.6× normale)")
 
         # Simulation sous stress
-        print(f"\nSimulation de {steps} steps ({steps//12} ans) sous stress...")
-        print("⚠️  Attendez-vous à de fortes fluctuations...")
+        logger.info("\nSimulation de %s steps (%s ans) sous stress...", steps, steps//12)
+        logger.info("⚠️  Attendez-vous à de fortes fluctuations...")
 
         economy.simulate(steps=steps, n_transactions=20)
 
         self.results['crisis_high_volatility'] = economy.history
 
         # Analyse de la résilience
-        theta_history = np.array(economy.history['thermometer'])
-        indicator_history = np.array(economy.history['indicator'])
+        theta_history = self._list_to_array(economy.history['thermometer'])
+        indicator_history = self._list_to_array(economy.history['indicator'])
 
-        theta_mean = np.mean(theta_history)
-        theta_std = np.std(theta_history)
-        theta_max_dev = np.max(np.abs(theta_history - 1.0))
-        indicator_max = np.max(np.abs(indicator_history))
+        theta_mean, theta_std, theta_max_dev = _summarize(theta_history)
+        _, _, indicator_max = _summarize(indicator_history, target=0.0)
 
         # Calcul du temps de récupération après chocs
-        large_deviations = np.where(np.abs(indicator_history) > 0.3)[0]
-        n_large_deviations = len(large_deviations)
-
-        print(f"\n📈 Résultats (crisis high volatility) :")
-        print(f"  ═══════════════════════════════════════════════════════════")
-        print(f"  VOLATILITÉ OBSERVÉE :")
-        print(f"    Thermomètre θ moyen : {theta_mean:.4f}")
-        print(f"    Écart-type θ : {theta_std:.4f} (↑ volatilité)")
-        print(f"    Déviation max |θ - 1| : {theta_max_dev:.4f}")
-        print(f"    Indicateur I max : {indicator_max:.4f}")
-        print(f"  ═══════════════════════════════════════════════════════════")
-        print(f"  RÉSILIENCE DU SYSTÈME :")
-        print(f"    Nombre de déviations |I| > 0.3 : {n_large_deviations}")
-        print(f"    Thermomètre final : {economy.thermometer():.4f}")
-        print(f"    Kappa κ final : {economy.rad.kappa:.4f}")
-        print(f"    Eta η final : {economy.rad.eta:.4f}")
-        print(f"  ═══════════════════════════════════════════════════════════")
-        print(f"  ÉTAT FINAL :")
-        print(f"    Population : {len(economy.agents)} agents")
-        print(f"    Gini : {economy.gini_coefficient():.4f}")
-        print(f"  ═══════════════════════════════════════════════════════════")
+        # Comptage direct sur le masque (pas de tableau d'indices np.where),
+        # |I| > 0.3 ⇔ I² > 0.09 évite le temporaire np.abs
+        n_large_deviations = int(np.count_nonzero(np.square(indicator_history) > 0.09))
+
+        theta_final = economy.thermometer()
+        kappa_final = economy.rad.kappa
+        eta_final = economy.rad.eta
+
+        logger.info("\n📈 Résultats (crisis high volatility) :")
+        logger.info("  ═══════════════════════════════════════════════════════════")
+        logger.info("  VOLATILITÉ OBSERVÉE :")
+        logger.info("    Thermomètre θ moyen : %.4f", theta_mean)
+        logger.info("    Écart-type θ : %.4f (↑ volatilité)", theta_std)
+        logger.info("    Déviation max |θ - 1| : %.4f", theta_max_dev)
+        logger.info("    Indicateur I max : %.4f", indicator_max)
+        logger.info("  ═══════════════════════════════════════════════════════════")
+        logger.info("  RÉSILIENCE DU SYSTÈME :")
+        logger.info("    Nombre de déviations |I| > 0.3 : %s", n_large_deviations)
+        logger.info("    Thermomètre final : %.4f", theta_final)
+        logger.info("    Kappa κ final : %.4f", kappa_final)
+        logger.info("    Eta η final : %.4f", eta_final)
+        logger.info("  ═══════════════════════════════════════════════════════════")
+        logger.info("  ÉTAT FINAL :")
+        logger.info("    Population : %s agents", economy.population_size)
+        logger.info("    Gini : %.4f", economy.gini_coefficient())
+        logger.info("  ═══════════════════════════════════════════════════════════")
 
         # Évaluation de la résilience
         if theta_std < 0.5 and abs(theta_mean - 1.0) < 0.2:
-            print(f"  ✅ SYSTÈME RÉSILIENT : Maintient stabilité malgré volatilité")
+            logger.info("  ✅ SYSTÈME RÉSILIENT : Maintient stabilité malgré volatilité")
         elif theta_std < 1.0:
-            print(f"  🟡 SYSTÈME PARTIELLEMENT RÉSILIENT : Fluctuations maîtrisées")
+            logger.info("  🟡 SYSTÈME PARTIELLEMENT RÉSILIENT : Fluctuations maîtrisées")
         else:
-            print(f"  ⚠️  SYSTÈME INSTABLE : Volatilité excessive")
+            logger.info("  ⚠️  SYSTÈME INSTABLE : Volatilité excessive")
 
-        print("\n" + "="*70 + "\n")
+        logger.info("\n" + "="*70 + "\n")
 
         return economy
 
@@ -844,102 +1220,90 @@ class ScenarioRunner:
         Returns:
             Économie IRIS sans régulation (pour comparaison)
         """
-        print("\n" + "="*70)
-        print("SCÉNARIO 10 : NO REGULATION - Témoin Sans RAD")
-        print("="*70)
-        print("\n📌 OBJECTIF : Démontrer l'importance du RAD par contraste")
-        print("   Configuration : κ=η=1 FIXES (pas de régulation)")
-        print("   Attente : Système diverge de l'équilibre θ=1\n")
+        logger.info("\n" + "="*70)
+        logger.info("SCÉNARIO 10 : NO REGULATION - Témoin Sans RAD")
+        logger.info("="*70)
+        logger.info("\n📌 OBJECTIF : Démontrer l'importance du RAD par contraste")
+        logger.info("   Configuration : κ=η=1 FIXES (pas de régulation)")
+        logger.info("   Attente : Système diverge de l'équilibre θ=1\n")
 
         # Création de l'économie (tous modules actifs sauf régulation)
-        economy = IRISEconomy(
-            initial_agents=self.n_agents,
-            gold_factor=1.0,
-            universal_income_rate=0.02,
-            # ═══════════════════════════════════════════════════════════════
-            # CONFIGURATION TÉMOIN (modules actifs, régulation désactivée)
-            # ═══════════════════════════════════════════════════════════════
-            enable_demographics=True,
-            enable_catastrophes=False,            # Pas de chocs pour isoler effet
-            enable_price_discovery=True,
-            enable_dynamic_business=True,
-            enable_business_combustion=True,
-            enable_chambre_relance=True,
+        economy = IRISEconomy.from_preset(
+            'no_regulation', initial_agents=self.n_agents,
+            **self._economy_kwargs(steps)
         )
 
         # FIXATION de κ et η à 1.0 (désactivation régulation)
         economy.rad.kappa = 1.0
         economy.rad.eta = 1.0
 
-        print(f"État initial :")
-        print(f"  Population : {len(economy.agents)} agents")
-        print(f"  θ initial : {economy.thermometer():.4f}")
-        print(f"\n⚠️  RÉGULATION DÉSACTIVÉE :")
-        print(f"  κ (kappa) = 1.0 FIXE (pas de modulation liquidité)")
-        print(f"  η (eta) = 1.0 FIXE (pas de modulation production)")
-        print(f"  Pas de rééquilibrage automatique du thermomètre θ")
-
-        # Simulation SANS régulation (forcer κ=η=1 à chaque step)
-        print(f"\nSimulation de {steps} steps ({steps//12} ans) sans régulation...")
-
-        for step in range(steps):
-            economy.step(n_transactions=20)
-
-            # FORCE κ=η=1 à chaque step (désactive complètement le RAD)
-            economy.rad.kappa = 1.0
-            economy.rad.eta = 1.0
-
-            # Affichage périodique
-            if step % 120 == 0:  # Tous les 10 ans
-                theta = economy.thermometer()
-                indicator = economy.indicator()
-                print(f"  Année {step//12:3d} : θ={theta:.4f}, I={indicator:.4f}")
+        logger.info("État initial :")
+        logger.info("  Population : %s agents", economy.population_size)
+        logger.info("  θ initial : %.4f", economy.thermometer())
+        logger.info("\n⚠️  RÉGULATION DÉSACTIVÉE :")
+        logger.info("  κ (kappa) = 1.0 FIXE (pas de modulation liquidité)")
+        logger.info("  η (eta) = 1.0 FIXE (pas de modulation production)")
+        logger.info("  Pas de rééquilibrage automatique du thermomètre θ")
+
+        # Simulation SANS régulation : le RAD gelé garde κ=η=1, la boucle
+        # n'a plus à les réimposer après chaque step
+        logger.info("\nSimulation de %s steps (%s ans) sans régulation...", steps, steps//12)
+
+        # Affichage après le 1er step puis tous les 120 steps (10 ans)
+        done = 0
+        for tick in range(1, steps + 1, 120):
+            _drive_20(economy, tick - done)
+            done = tick
+            hist = economy.history
+            theta = hist['thermometer'][-1]
+            indicator = hist['indicator'][-1]
+            logger.info("  Année %3d : θ=%.4f, I=%.4f", (tick - 1)//12, theta, indicator)
+        _drive_20(economy, steps - done)
 
         self.results['no_regulation'] = economy.history
 
         # Analyse de la divergence
-        theta_history = np.array(economy.history['thermometer'])
-        indicator_history = np.array(economy.history['indicator'])
+        theta_history = self._list_to_array(economy.history['thermometer'])
+        indicator_history = self._list_to_array(economy.history['indicator'])
 
-        theta_mean = np.mean(theta_history)
-        theta_std = np.std(theta_history)
+        theta_mean, theta_std, _ = _summarize(theta_history)
         theta_final = economy.thermometer()
-        indicator_final = economy.indicator()
+        indicator_final = theta_final - 1.0
 
         # Calcul de la tendance (drift)
         theta_drift = theta_final - theta_history[0]
 
-        print(f"\n📈 Résultats (no regulation) :")
-        print(f"  ═══════════════════════════════════════════════════════════")
-        print(f"  DIVERGENCE THERMODYNAMIQUE :")
-        print(f"    Thermomètre θ moyen : {theta_mean:.4f} (cible = 1.0)")
-        print(f"    Écart-type θ : {theta_std:.4f}")
-        print(f"    Thermomètre θ final : {theta_final:.4f}")
-        print(f"    Dérive (drift) : {theta_drift:+.4f}")
-        print(f"  ═══════════════════════════════════════════════════════════")
-        print(f"  ABSENCE DE RÉGULATION :")
-        print(f"    Indicateur I final : {indicator_final:.4f} (cible = 0.0)")
-        print(f"    Kappa κ : 1.0000 (FIXE)")
-        print(f"    Eta η : 1.0000 (FIXE)")
-        print(f"  ═══════════════════════════════════════════════════════════")
-        print(f"  ÉTAT FINAL :")
-        print(f"    Population : {len(economy.agents)} agents")
-        print(f"    Gini : {economy.gini_coefficient():.4f}")
-        print(f"  ═══════════════════════════════════════════════════════════")
+        logger.info("\n📈 Résultats (no regulation) :")
+        logger.info("  ═══════════════════════════════════════════════════════════")
+        logger.info("  DIVERGENCE THERMODYNAMIQUE :")
+        logger.info("    Thermomètre θ moyen : %.4f (cible = 1.0)", theta_mean)
+        logger.info("    Écart-type θ : %.4f", theta_std)
+        logger.info("    Thermomètre θ final : %.4f", theta_final)
+        logger.info("    Dérive (drift) : %+.4f", theta_drift)
+        logger.info("  ═══════════════════════════════════════════════════════════")
+        logger.info("  ABSENCE DE RÉGULATION :")
+        logger.info("    Indicateur I final : %.4f (cible = 0.0)", indicator_final)
+        logger.info("    Kappa κ : 1.0000 (FIXE)")
+        logger.info("    Eta η : 1.0000 (FIXE)")
+        logger.info("  ═══════════════════════════════════════════════════════════")
+        logger.info("  ÉTAT FINAL :")
+        logger.info("    Population : %s agents", economy.population_size)
+        logger.info("    Gini : %.4f", economy.gini_coefficient())
+        logger.info("  ═══════════════════════════════════════════════════════════")
 
         # Évaluation de la stabilité (normalement mauvaise)
         if abs(theta_final - 1.0) > 0.2:
-            print(f"  ❌ SYSTÈME INSTABLE : θ diverge significativement de 1.0")
-            print(f"  ➜  Démontre l'importance de la régulation RAD")
+            logger.warning("  ❌ SYSTÈME INSTABLE : θ diverge significativement de 1.0")
+            logger.info("  ➜  Démontre l'importance de la régulation RAD")
         elif abs(theta_final - 1.0) > 0.1:
-            print(f"  🟡 SYSTÈME PARTIELLEMENT INSTABLE : Déséquilibre modéré")
+            logger.info("  🟡 SYSTÈME PARTIELLEMENT INSTABLE : Déséquilibre modéré")
         else:
-            print(f"  ⚠️  Résultat inattendu : système reste proche de l'équilibre")
-            print(f"  ➜  Peut indiquer une durée de simulation trop courte")
+            logger.info("  ⚠️  Résultat inattendu : système reste proche de l'équilibre")
+            logger.info("  ➜  Peut indiquer une durée de simulation trop courte")
 
-        print("\n💡 RECOMMANDATION : Comparer avec run_baseline_stable() pour voir")
-        print("   l'effet stabilisateur du RAD (θ oscille autour de 1 vs dérive)")
-        print("\n" + "="*70 + "\n")
+        logger.info("\n💡 RECOMMANDATION : Comparer avec run_baseline_stable() pour voir")
+        logger.info("   l'effet stabilisateur du RAD (θ oscille autour de 1 vs dérive)")
+        logger.info("\n" + "="*70 + "\n")
 
         return economy
 
@@ -966,83 +1330,70 @@ class ScenarioRunner:
         Returns:
             Économie après simulation
         """
-        print("\n" + "="*70)
-        print("SCÉNARIO THERMODYNAMIQUE 1 : SOUS-CHAUFFE (θ < 1)")
-        print("="*70)
-        print("État initial : Sous-régime économique (D < V_on)")
-        print("Objectif : Vérifier que le RAD stimule (κ ↑, η ↑) et θ → 1")
-        print("="*70)
-
-        economy = IRISEconomy(
-            initial_agents=self.n_agents,
-            enable_demographics=True,
-            enable_catastrophes=False,  # Pas de perturbations aléatoires
-            enable_business_combustion=True,
-            enable_dynamic_business=True,
-            enable_chambre_relance=True,
-            seed=42  # Reproductibilité
+        logger.info("\n" + "="*70)
+        logger.info("SCÉNARIO THERMODYNAMIQUE 1 : SOUS-CHAUFFE (θ < 1)")
+        logger.info("="*70)
+        logger.info("État initial : Sous-régime économique (D < V_on)")
+        logger.info("Objectif : Vérifier que le RAD stimule (κ ↑, η ↑) et θ → 1")
+        logger.info("="*70)
+
+        economy = IRISEconomy.from_preset(
+            'thermodynamic', initial_agents=self.n_agents,
+            **self._economy_kwargs(steps, seed=42)  # Reproductibilité
         )
 
-        print(f"\n📊 État initial :")
-        print(f"  θ initial : {economy.thermometer():.4f}")
-        print(f"  κ initial : {economy.rad.kappa:.4f}")
-        print(f"  η initial : {economy.rad.eta:.4f}")
+        logger.info("\n📊 État initial :")
+        logger.info("  θ initial : %.4f", economy.thermometer())
+        logger.info("  κ initial : %.4f", economy.rad.kappa)
+        logger.info("  η initial : %.4f", economy.rad.eta)
 
         # Phase 1 : Équilibre initial (50 steps)
-        print(f"\n⏳ Phase 1 : Équilibre initial (50 mois)...")
-        for _ in range(50):
-            economy.step(n_transactions=10)
+        logger.info("\n⏳ Phase 1 : Équilibre initial (50 mois)...")
+        _drive_10(economy, 50)
 
-        print(f"  θ après phase 1 : {economy.thermometer():.4f}")
+        logger.info("  θ après phase 1 : %.4f", economy.history['thermometer'][-1])
 
         # Phase 2 : CHOC DE SOUS-CHAUFFE - Réduction brutale de D
-        print(f"\n💥 Phase 2 : CHOC - Destruction de 40% de D (création sous-chauffe)...")
+        logger.info("\n💥 Phase 2 : CHOC - Destruction de 40%% de D (création sous-chauffe)...")
         D_before = economy.rad.total_D()
-        economy.rad.D_materielle *= 0.6
-        economy.rad.D_contractuelle *= 0.6
-        economy.rad.D_services *= 0.6
+        economy.rad.scale_D(0.6, _SHOCKED_D_COMPONENTS)
         D_after = economy.rad.total_D()
 
         theta_post_shock = economy.thermometer()
-        print(f"  D avant choc : {D_before:.2f}")
-        print(f"  D après choc : {D_after:.2f} (-40%)")
-        print(f"  θ après choc : {theta_post_shock:.4f} << 1.0 (SOUS-CHAUFFE)")
+        logger.info("  D avant choc : %.2f", D_before)
+        logger.info("  D après choc : %.2f (-40%%)", D_after)
+        logger.info("  θ après choc : %.4f << 1.0 (SOUS-CHAUFFE)", theta_post_shock)
 
         # Phase 3 : Régulation RAD (550 steps restants)
-        print(f"\n⏳ Phase 3 : Régulation RAD ({steps - 50} mois)...")
-        print(f"  Attente : κ ↑ et η ↑ pour stimuler l'économie")
+        logger.info("\n⏳ Phase 3 : Régulation RAD (%s mois)...", steps - 50)
+        logger.info("  Attente : κ ↑ et η ↑ pour stimuler l'économie")
 
-        for i in range(steps - 50):
-            economy.step(n_transactions=10)
-
-            # Affichage tous les 120 steps (10 ans)
-            if (i + 1) % 120 == 0:
-                years = (i + 1) // 12
-                theta = economy.thermometer()
-                kappa = economy.rad.kappa
-                eta = economy.rad.eta
-                print(f"  +{years} ans : θ={theta:.4f}, κ={kappa:.4f}, η={eta:.4f}")
+        # Phase simulée d'un bloc, bilan décennal relu ensuite dans l'historique
+        n_steps = steps - 50
+        start = len(economy.history['thermometer'])
+        _drive_10(economy, n_steps)
+        _log_decades(economy, start, n_steps)
 
         # Résultats finaux
-        print(f"\n📈 RÉSULTATS FINAUX (SOUS-CHAUFFE) :")
+        logger.info("\n📈 RÉSULTATS FINAUX (SOUS-CHAUFFE) :")
         theta_final = economy.thermometer()
         kappa_final = economy.rad.kappa
         eta_final = economy.rad.eta
 
-        print(f"  θ final : {theta_final:.4f} (cible: 1.0)")
-        print(f"  κ final : {kappa_final:.4f} (stimulation: κ > 1.0)")
-        print(f"  η final : {eta_final:.4f} (stimulation: η > 1.0)")
+        logger.info("  θ final : %.4f (cible: 1.0)", theta_final)
+        logger.info("  κ final : %.4f (stimulation: κ > 1.0)", kappa_final)
+        logger.info("  η final : %.4f (stimulation: η > 1.0)", eta_final)
 
         # Validation
         if 0.9 <= theta_final <= 1.1:
-            print(f"  ✓ Régulation réussie : θ revenu à l'équilibre")
+            logger.info("  ✓ Régulation réussie : θ revenu à l'équilibre")
         else:
-            print(f"  ✗ Régulation instable : θ = {theta_final:.4f}")
+            logger.info("  ✗ Régulation instable : θ = %.4f", theta_final)
 
         if kappa_final > 1.0 or eta_final > 1.0:
-            print(f"  ✓ Stimulation active détectée")
+            logger.info("  ✓ Stimulation active détectée")
 
-        print("="*70 + "\n")
+        logger.info("="*70 + "\n")
 
         self.results['underheat'] = economy.history
         return economy
@@ -1071,70 +1422,60 @@ class ScenarioRunner:
         Returns:
             Économie après simulation
         """
-        print("\n" + "="*70)
-        print("SCÉNARIO THERMODYNAMIQUE 2 : NORMAL (θ ≈ 1)")
-        print("="*70)
-        print("État initial : Équilibre thermodynamique (D ≈ V_on)")
-        print("Objectif : Vérifier que le RAD maintient θ ≈ 1 sans dérive")
-        print("="*70)
-
-        economy = IRISEconomy(
-            initial_agents=self.n_agents,
-            enable_demographics=True,
-            enable_catastrophes=False,
-            enable_business_combustion=True,
-            enable_dynamic_business=True,
-            enable_chambre_relance=True,
-            seed=42
+        logger.info("\n" + "="*70)
+        logger.info("SCÉNARIO THERMODYNAMIQUE 2 : NORMAL (θ ≈ 1)")
+        logger.info("="*70)
+        logger.info("État initial : Équilibre thermodynamique (D ≈ V_on)")
+        logger.info("Objectif : Vérifier que le RAD maintient θ ≈ 1 sans dérive")
+        logger.info("="*70)
+
+        economy = IRISEconomy.from_preset(
+            'thermodynamic', initial_agents=self.n_agents,
+            **self._economy_kwargs(steps, seed=42)
         )
 
-        print(f"\n📊 État initial :")
-        print(f"  θ initial : {economy.thermometer():.4f}")
-        print(f"  κ initial : {economy.rad.kappa:.4f}")
-        print(f"  η initial : {economy.rad.eta:.4f}")
-
-        print(f"\n⏳ Simulation en cours ({steps // 12} ans = {steps} mois)...")
-        print(f"  Aucun choc appliqué - évolution naturelle")
+        logger.info("\n📊 État initial :")
+        logger.info("  θ initial : %.4f", economy.thermometer())
+        logger.info("  κ initial : %.4f", economy.rad.kappa)
+        logger.info("  η initial : %.4f", economy.rad.eta)
 
-        for i in range(steps):
-            economy.step(n_transactions=10)
+        logger.info("\n⏳ Simulation en cours (%s ans = %s mois)...", steps // 12, steps)
+        logger.info("  Aucun choc appliqué - évolution naturelle")
 
-            # Affichage tous les 120 steps (10 ans)
-            if (i + 1) % 120 == 0:
-                years = (i + 1) // 12
-                theta = economy.thermometer()
-                kappa = economy.rad.kappa
-                eta = economy.rad.eta
-                print(f"  +{years} ans : θ={theta:.4f}, κ={kappa:.4f}, η={eta:.4f}")
+        # Phase simulée d'un bloc, bilan décennal relu ensuite dans l'historique
+        n_steps = steps
+        start = len(economy.history['thermometer'])
+        _drive_10(economy, n_steps)
+        _log_decades(economy, start, n_steps)
 
         # Résultats finaux
-        print(f"\n📈 RÉSULTATS FINAUX (NORMAL) :")
+        logger.info("\n📈 RÉSULTATS FINAUX (NORMAL) :")
         theta_final = economy.thermometer()
         kappa_final = economy.rad.kappa
         eta_final = economy.rad.eta
 
         # Calcul de la stabilité de θ
-        theta_history = economy.history.get('theta', [])
+        theta_history = economy.history.get('thermometer', [])
         if len(theta_history) > 0:
-            theta_mean = np.mean(theta_history[-120:])  # Moyenne sur dernier an
-            theta_std = np.std(theta_history[-120:])
-            print(f"  θ final : {theta_final:.4f} (cible: 1.0)")
-            print(f"  θ moyen (dernier an) : {theta_mean:.4f}")
-            print(f"  θ écart-type : {theta_std:.4f}")
+            # Moyenne sur les 120 derniers steps
+            theta_mean, theta_std, _ = _summarize(self._list_to_array(theta_history[-120:]))
+            logger.info("  θ final : %.4f (cible: 1.0)", theta_final)
+            logger.info("  θ moyen (dernier an) : %.4f", theta_mean)
+            logger.info("  θ écart-type : %.4f", theta_std)
 
-        print(f"  κ final : {kappa_final:.4f} (équilibre: κ ≈ 1.0)")
-        print(f"  η final : {eta_final:.4f} (équilibre: η ≈ 1.0)")
+        logger.info("  κ final : %.4f (équilibre: κ ≈ 1.0)", kappa_final)
+        logger.info("  η final : %.4f (équilibre: η ≈ 1.0)", eta_final)
 
         # Validation
         if 0.8 <= theta_final <= 1.2:
-            print(f"  ✓ Équilibre maintenu : θ ∈ [0.8, 1.2]")
+            logger.info("  ✓ Équilibre maintenu : θ ∈ [0.8, 1.2]")
         else:
-            print(f"  ✗ Dérive détectée : θ = {theta_final:.4f}")
+            logger.info("  ✗ Dérive détectée : θ = %.4f", theta_final)
 
         if 0.8 <= kappa_final <= 1.2 and 0.8 <= eta_final <= 1.2:
-            print(f"  ✓ Régulation stable : κ, η proches de 1.0")
+            logger.info("  ✓ Régulation stable : κ, η proches de 1.0")
 
-        print("="*70 + "\n")
+        logger.info("="*70 + "\n")
 
         self.results['normal'] = economy.history
         return economy
@@ -1162,151 +1503,152 @@ class ScenarioRunner:
         Returns:
             Économie après simulation
         """
-        print("\n" + "="*70)
-        print("SCÉNARIO THERMODYNAMIQUE 3 : SURCHAUFFE (θ > 1)")
-        print("="*70)
-        print("État initial : Surchauffe économique (D > V_on)")
-        print("Objectif : Vérifier que le RAD freine (κ ↓, η ↓) et θ → 1")
-        print("="*70)
-
-        economy = IRISEconomy(
-            initial_agents=self.n_agents,
-            enable_demographics=True,
-            enable_catastrophes=False,
-            enable_business_combustion=True,
-            enable_dynamic_business=True,
-            enable_chambre_relance=True,
-            seed=42
+        logger.info("\n" + "="*70)
+        logger.info("SCÉNARIO THERMODYNAMIQUE 3 : SURCHAUFFE (θ > 1)")
+        logger.info("="*70)
+        logger.info("État initial : Surchauffe économique (D > V_on)")
+        logger.info("Objectif : Vérifier que le RAD freine (κ ↓, η ↓) et θ → 1")
+        logger.info("="*70)
+
+        economy = IRISEconomy.from_preset(
+            'thermodynamic', initial_agents=self.n_agents,
+            **self._economy_kwargs(steps, seed=42)
         )
 
-        print(f"\n📊 État initial :")
-        print(f"  θ initial : {economy.thermometer():.4f}")
-        print(f"  κ initial : {economy.rad.kappa:.4f}")
-        print(f"  η initial : {economy.rad.eta:.4f}")
+        logger.info("\n📊 État initial :")
+        logger.info("  θ initial : %.4f", economy.thermometer())
+        logger.info("  κ initial : %.4f", economy.rad.kappa)
+        logger.info("  η initial : %.4f", economy.rad.eta)
 
         # Phase 1 : Équilibre initial (50 steps)
-        print(f"\n⏳ Phase 1 : Équilibre initial (50 mois)...")
-        for _ in range(50):
-            economy.step(n_transactions=10)
+        logger.info("\n⏳ Phase 1 : Équilibre initial (50 mois)...")
+        _drive_10(economy, 50)
 
-        print(f"  θ après phase 1 : {economy.thermometer():.4f}")
+        logger.info("  θ après phase 1 : %.4f", economy.history['thermometer'][-1])
 
         # Phase 2 : CHOC DE SURCHAUFFE - Injection brutale de D
-        print(f"\n💥 Phase 2 : CHOC - Injection de +60% de D (création surchauffe)...")
+        logger.info("\n💥 Phase 2 : CHOC - Injection de +60%% de D (création surchauffe)...")
         D_before = economy.rad.total_D()
-        economy.rad.D_materielle *= 1.6
-        economy.rad.D_contractuelle *= 1.6
-        economy.rad.D_services *= 1.6
+        economy.rad.scale_D(1.6, _SHOCKED_D_COMPONENTS)
         D_after = economy.rad.total_D()
 
         theta_post_shock = economy.thermometer()
-        print(f"  D avant choc : {D_before:.2f}")
-        print(f"  D après choc : {D_after:.2f} (+60%)")
-        print(f"  θ après choc : {theta_post_shock:.4f} >> 1.0 (SURCHAUFFE)")
+        logger.info("  D avant choc : %.2f", D_before)
+        logger.info("  D après choc : %.2f (+60%%)", D_after)
+        logger.info("  θ après choc : %.4f >> 1.0 (SURCHAUFFE)", theta_post_shock)
 
         # Phase 3 : Régulation RAD (550 steps restants)
-        print(f"\n⏳ Phase 3 : Régulation RAD ({steps - 50} mois)...")
-        print(f"  Attente : κ ↓ et η ↓ pour freiner l'économie")
-
-        for i in range(steps - 50):
-            economy.step(n_transactions=10)
+        logger.info("\n⏳ Phase 3 : Régulation RAD (%s mois)...", steps - 50)
+        logger.info("  Attente : κ ↓ et η ↓ pour freiner l'économie")
 
-            # Affichage tous les 120 steps (10 ans)
-            if (i + 1) % 120 == 0:
-                years = (i + 1) // 12
-                theta = economy.thermometer()
-                kappa = economy.rad.kappa
-                eta = economy.rad.eta
-                print(f"  +{years} ans : θ={theta:.4f}, κ={kappa:.4f}, η={eta:.4f}")
+        # Phase simulée d'un bloc, bilan décennal relu ensuite dans l'historique
+        n_steps = steps - 50
+        start = len(economy.history['thermometer'])
+        _drive_10(economy, n_steps)
+        _log_decades(economy, start, n_steps)
 
         # Résultats finaux
-        print(f"\n📈 RÉSULTATS FINAUX (SURCHAUFFE) :")
+        logger.info("\n📈 RÉSULTATS FINAUX (SURCHAUFFE) :")
         theta_final = economy.thermometer()
         kappa_final = economy.rad.kappa
         eta_final = economy.rad.eta
 
-        print(f"  θ final : {theta_final:.4f} (cible: 1.0)")
-        print(f"  κ final : {kappa_final:.4f} (freinage: κ < 1.0)")
-        print(f"  η final : {eta_final:.4f} (freinage: η < 1.0)")
+        logger.info("  θ final : %.4f (cible: 1.0)", theta_final)
+        logger.info("  κ final : %.4f (freinage: κ < 1.0)", kappa_final)
+        logger.info("  η final : %.4f (freinage: η < 1.0)", eta_final)
 
         # Validation
         if 0.9 <= theta_final <= 1.1:
-            print(f"  ✓ Régulation réussie : θ revenu à l'équilibre")
+            logger.info("  ✓ Régulation réussie : θ revenu à l'équilibre")
         else:
-            print(f"  ✗ Régulation instable : θ = {theta_final:.4f}")
+            logger.info("  ✗ Régulation instable : θ = %.4f", theta_final)
 
         if kappa_final < 1.0 or eta_final < 1.0:
-            print(f"  ✓ Freinage actif détecté")
+            logger.info("  ✓ Freinage actif détecté")
 
-        print("="*70 + "\n")
+        logger.info("="*70 + "\n")
 
         self.results['overheat'] = economy.history
         return economy
 
 
 def run_full_analysis(n_agents: int = 100, output_dir: str = "results",
-                     steps: int = 1000, shock_time: int = 500, seed: int = None):
+                     steps: int = 1000, shock_time: int = 500, seed: int = None,
+                     sweep: Optional[Dict[str, Sequence[float]]] = None,
+                     n_jobs: int = -1, parallel: bool = True,
+                     export_json: bool = False):
     """
     Execute l'analyse complete avec tous les scenarios
 
+    Les six scenarios sont independants : ils sont repartis sur plusieurs
+    processus via ScenarioRunner.run_all (seuls les historiques reviennent
+    au processus principal).
+
     Args:
         n_agents: Nombre d'agents
         output_dir: Repertoire de sortie
         steps: Nombre de pas de temps pour chaque scenario
         shock_time: Moment du choc pour les scenarios de choc
         seed: Graine aleatoire pour reproductibilite (None = aleatoire)
+        sweep: Balayages optionnels {type de choc: [magnitudes]} (run_sweep)
+        n_jobs: Processus pour les scenarios et balayages (-1 = tous les cœurs)
+        parallel: Execution multi-processus des scenarios
+        export_json: Exporte aussi chaque historique en JSON (lecture humaine),
+                     en plus de l'archive .npz
     """
-    # Fixe la graine si specifiee (pour reproductibilite)
+    # La graine est transmise au runner (générateurs dérivés, sans np.random.seed)
     if seed is not None:
-        np.random.seed(seed)
-        print(f"Graine aleatoire fixee : {seed}")
-
-    runner = ScenarioRunner(n_agents=n_agents, output_dir=output_dir)
-
-    # Scenario 1 : Baseline
-    economy_baseline = runner.run_baseline(steps=steps)
-
-    # Scenario 2 : Choc de richesse modere
-    economy_wealth_loss = runner.run_wealth_loss_shock(
-        steps=steps, shock_time=shock_time, magnitude=0.3
-    )
-
-    # Scenario 3 : Choc de demande important
-    economy_demand = runner.run_demand_surge_shock(
-        steps=steps, shock_time=shock_time, magnitude=0.5
-    )
-
-    # Scenario 4 : Choc d'offre
-    economy_supply = runner.run_supply_shock(
-        steps=steps, shock_time=shock_time, magnitude=2.0
-    )
-
-    # Scenario 5 : Crise systemique
-    economy_crisis = runner.run_systemic_crisis(steps=int(steps * 1.5))
-
-    # Scenario 6 : Systeme sans regulation (temoin)
-    economy_no_reg = runner.run_comparison_no_regulation(
-        steps=steps, shock_time=shock_time, shock_type='wealth_loss', magnitude=0.3
-    )
+        logger.info("Graine aleatoire fixee : %s", seed)
+
+    runner = ScenarioRunner(n_agents=n_agents, output_dir=output_dir, seed=seed)
+
+    scenario_kwargs = {
+        # Scenario 1 : Baseline
+        'run_baseline': {'steps': steps},
+        # Scenario 2 : Choc de richesse modere
+        'run_wealth_loss_shock': {'steps': steps, 'shock_time': shock_time, 'magnitude': 0.3},
+        # Scenario 3 : Choc de demande important
+        'run_demand_surge_shock': {'steps': steps, 'shock_time': shock_time, 'magnitude': 0.5},
+        # Scenario 4 : Choc d'offre
+        'run_supply_shock': {'steps': steps, 'shock_time': shock_time, 'magnitude': 2.0},
+        # Scenario 5 : Crise systemique
+        'run_systemic_crisis': {'steps': int(steps * 1.5)},
+        # Scenario 6 : Systeme sans regulation (temoin)
+        'run_comparison_no_regulation': {'steps': steps, 'shock_time': shock_time,
+                                         'shock_type': 'wealth_loss', 'magnitude': 0.3},
+    }
+    runner.run_all(parallel=parallel, max_workers=None if n_jobs == -1 else n_jobs,
+                   seed=seed, scenarios=tuple(scenario_kwargs),
+                   scenario_kwargs=scenario_kwargs)
+    baseline_history = runner.results['baseline']
+    crisis_history = runner.results['systemic_crisis']
+
+    # Balayages de magnitude (optionnels, en parallèle)
+    for shock_type, magnitudes in (sweep or {}).items():
+        runner.run_sweep(shock_type, magnitudes, steps=steps,
+                         shock_time=shock_time, n_jobs=n_jobs)
 
     # Comparaisons et rapports
     runner.compare_scenarios(shock_time=shock_time)
     runner.generate_comparative_report()
+    runner.wait_for_plots()
 
     # Visualisations individuelles detaillees
     viz = IRISVisualizer(output_dir)
 
-    print("\nGénération des visualisations détaillées...")
-    viz.plot_main_variables(economy_baseline.history, "Scénario_1_Baseline")
-    viz.plot_main_variables(economy_crisis.history, "Scénario_5_Crise_Systémique")
-    viz.plot_regulation_detail(economy_baseline.history)
-    viz.plot_phase_space(economy_baseline.history)
+    logger.info("\nGénération des visualisations détaillées...")
+    viz.plot_main_variables(baseline_history, "Scénario_1_Baseline")
+    viz.plot_main_variables(crisis_history, "Scénario_5_Crise_Systémique")
+    viz.plot_regulation_detail(baseline_history)
+    viz.plot_phase_space(baseline_history)
 
     # Export des données
     for scenario_name, history in runner.results.items():
-        viz.export_data(history, f"data_{scenario_name}")
+        viz.export_data_npz(history, f"data_{scenario_name}")
+        if export_json:
+            viz.export_data(history, f"data_{scenario_name}")
 
-    print("\n✅ ANALYSE COMPLÈTE TERMINÉE")
-    print(f"📁 Résultats disponibles dans : {output_dir}/")
+    logger.info("\n✅ ANALYSE COMPLÈTE TERMINÉE")
+    logger.info("📁 Résultats disponibles dans : %s/", output_dir)
 
     return runner
@@ -9,30 +9,65 @@ Auteur: Arnault Nolan
 Date: 2025
 """
 
+import sys
 from dataclasses import dataclass, field
-from typing import List
-from enum import Enum
+from typing import Dict, List, Optional, Sequence
+from enum import IntEnum
 
+import numpy as np
 
-class AssetType(Enum):
+
+# __slots__ pour Agent et Asset (pas de __dict__ par instance) : l'option
+# slots de dataclass n'existe qu'à partir de Python 3.10
+_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+class _LabeledIntEnum(IntEnum):
+    """
+    Énumération entière qui conserve l'interface des anciennes Enum à libellé
+
+    Les membres sont des entiers (comparaisons et clés de dict rapides), mais
+    .value, str() et format() renvoient le libellé historique ("immobilier",
+    ...) et Enum("immobilier") retrouve toujours le membre.
+    """
+
+    @property
+    def value(self) -> str:
+        return self.name.lower()
+
+    @classmethod
+    def _missing_(cls, value):
+        # Construction depuis le libellé historique (JSON, anciens fichiers)
+        if isinstance(value, str):
+            return cls.__members__.get(value.upper())
+        return None
+
+    def __str__(self) -> str:
+        return self.value
+
+    def __format__(self, format_spec: str) -> str:
+        return format(self.value, format_spec)
+
+
+class AssetType(_LabeledIntEnum):
     """Types d'actifs dans le système IRIS"""
-    IMMOBILIER = "immobilier"
-    MOBILIER = "mobilier"
-    ENTREPRISE = "entreprise"
-    INTELLECTUEL = "intellectuel"
-    SERVICE = "service"
+    IMMOBILIER = 0
+    MOBILIER = 1
+    ENTREPRISE = 2
+    INTELLECTUEL = 3
+    SERVICE = 4
 
 
-class DebtComponent(Enum):
+class DebtComponent(_LabeledIntEnum):
     """Composantes de la dette thermométrique D (§1.1.3)"""
-    MATERIELLE = "materielle"      # Biens et immobilisations
-    SERVICES = "services"          # Flux d'entretien
-    CONTRACTUELLE = "contractuelle"  # Titres à promesse productive
-    ENGAGEMENT = "engagement"      # Staking
-    REGULATRICE = "regulatrice"    # Chambre de Relance
+    MATERIELLE = 0      # Biens et immobilisations
+    SERVICES = 1        # Flux d'entretien
+    CONTRACTUELLE = 2   # Titres à promesse productive
+    ENGAGEMENT = 3      # Staking
+    REGULATRICE = 4     # Chambre de Relance
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class Asset:
     """
     Représente un actif dans le système IRIS
@@ -45,7 +80,7 @@ class Asset:
     id: str
     asset_type: AssetType
     real_value: float
-    V_initial: float = 0.0
+    V_initial: float = -1.0  # sentinelle : V₀ = real_value × auth_factor
     D_initial: float = 0.0
     owner_id: str = ""
     nft_hash: str = ""
@@ -53,12 +88,49 @@ class Asset:
     creation_time: int = 0
 
     def __post_init__(self):
-        if self.V_initial == 0.0:
-            self.V_initial = self.real_value * self.auth_factor
-            self.D_initial = self.V_initial
+        v0 = self.real_value * self.auth_factor if self.V_initial < 0 else self.V_initial
+        self.V_initial = v0
+        self.D_initial = v0 if self.D_initial == 0.0 else self.D_initial
+
+    @classmethod
+    def bulk_create(cls,
+                    ids: Sequence[str],
+                    asset_type: AssetType,
+                    real_values: Sequence[float],
+                    auth_factors: Optional[Sequence[float]] = None,
+                    owner_ids: Optional[Sequence[str]] = None,
+                    creation_time: int = 0) -> List['Asset']:
+        """
+        Crée un lot d'actifs du même type en une passe
+
+        V₀ = real_value × auth_factor est calculé d'un bloc (NumPy) puis
+        transmis au constructeur, avec D₀ = V₀.
+
+        Args:
+            ids: Identifiants des actifs
+            asset_type: Type commun à tous les actifs
+            real_values: Valeurs réelles
+            auth_factors: Facteurs d'authentification (1.0 par défaut)
+            owner_ids: Propriétaires ("" par défaut)
+            creation_time: Pas de création commun
+
+        Returns:
+            Liste d'actifs, dans l'ordre de ids
+        """
+        real = np.asarray(real_values, dtype=float)
+        auth = (np.ones_like(real) if auth_factors is None
+                else np.asarray(auth_factors, dtype=float))
+        v0 = (real * auth).tolist()
+        owners = [""] * len(v0) if owner_ids is None else owner_ids
+
+        return [cls(id=asset_id, asset_type=asset_type, real_value=r,
+                    V_initial=v, D_initial=v, owner_id=owner,
+                    auth_factor=a, creation_time=creation_time)
+                for asset_id, r, a, v, owner
+                in zip(ids, real.tolist(), auth.tolist(), v0, owners)]
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class Agent:
     """
     Représente un agent économique dans le système IRIS
@@ -74,19 +146,42 @@ class Agent:
     assets: List[Asset] = field(default_factory=list)
     contribution_score: float = 0.0
     consumables: float = 0.0
+    # Index id → position dans assets (retrait en O(1))
+    _asset_idx: Dict[str, int] = field(default_factory=dict, init=False,
+                                       repr=False, compare=False)
+
+    def __post_init__(self):
+        self._asset_idx = {asset.id: i for i, asset in enumerate(self.assets)}
 
     def add_asset(self, asset: Asset) -> None:
         """Ajoute un actif à l'agent et met à jour son patrimoine"""
+        self._asset_idx[asset.id] = len(self.assets)
         self.assets.append(asset)
         self.V_balance += asset.V_initial
 
+    def inherit_assets(self, assets: List[Asset]) -> None:
+        """Reprend des actifs sans toucher au patrimoine (transféré à part)"""
+        for asset in assets:
+            self._asset_idx[asset.id] = len(self.assets)
+            self.assets.append(asset)
+
     def remove_asset(self, asset_id: str) -> None:
-        """Retire un actif de l'agent et met à jour son patrimoine"""
-        for i, asset in enumerate(self.assets):
-            if asset.id == asset_id:
-                self.V_balance -= asset.V_initial
-                self.assets.pop(i)
-                break
+        """
+        Retire un actif de l'agent et met à jour son patrimoine
+
+        Le dernier actif prend la place de l'actif retiré (swap-and-pop) :
+        l'ordre de la liste n'est pas conservé.
+        """
+        i = self._asset_idx.pop(asset_id, None)
+        if i is None:
+            return
+
+        asset = self.assets[i]
+        last = self.assets.pop()
+        if i < len(self.assets):
+            self.assets[i] = last
+            self._asset_idx[last.id] = i
+        self.V_balance -= asset.V_initial
 
     def total_wealth(self) -> float:
         """
@@ -33,12 +33,12 @@ Ce module permet tout cela de manière automatisée.
 
 2. SENSITIVITY ANALYSIS
    ---------------------
-   Varie un paramètre clé (ex: eta_alpha) de ±10% autour de sa valeur baseline.
+   Varie un paramètre clé (ex: alpha_eta) de ±10% autour de sa valeur baseline.
    Pour chaque variation, lance N simulations Monte Carlo.
    Calcule l'élasticité: ε = (Δθ/θ) / (Δp/p)
 
    Objectif: Mesurer l'impact des paramètres RAD sur le comportement du système
-   Usage: validator.run_sensitivity_analysis('eta_alpha', baseline=0.5, variation_pct=[-10,0,10])
+   Usage: validator.run_sensitivity_analysis('alpha_eta', baseline_value=0.3, variation_pct=[-10,0,10])
 
 3. STATISTICAL VALIDATION
    -----------------------
@@ -89,9 +89,9 @@ mc_results, ks_results = quick_validation(n_runs=50, steps=100)
 # Utilisation avancée:
 from iris_validation import IRISValidator
 validator = IRISValidator()
-mc = validator.run_monte_carlo(n_runs=100, steps=100, parallel=False)
+mc = validator.run_monte_carlo(n_runs=100, steps=100)
 ks = validator.kolmogorov_smirnov_test(mc)
-sens = validator.run_sensitivity_analysis('eta_alpha', 0.5, [-10,-5,0,5,10], 20, 100)
+sens = validator.run_sensitivity_analysis('alpha_eta', 0.3, [-10,-5,0,5,10], 20, 100)
 
 Auteur: Arnault Nolan
 Email: arnaultnolan@gmail.com
@@ -102,15 +102,111 @@ Version: 1.0
 import numpy as np
 import pandas as pd
 from typing import Dict, List, Tuple, Optional, Callable
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
+from functools import lru_cache
+from itertools import product
+import hashlib
+import inspect
+import mmap
+import os
 import json
+import pickle
 from pathlib import Path
 from scipy import stats
 from concurrent.futures import ProcessPoolExecutor
 import multiprocessing as mp
 
 # Import du modèle IRIS
+from .. import __version__ as IRIS_VERSION
 from .iris_model import IRISEconomy
+from .iris_rad import RADState
+
+# Numba optionnel : sans lui, les statistiques descriptives restent en NumPy
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# orjson optionnel : export JSON plus rapide (tableaux NumPy sérialisés directement)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+def _mc_cache_key(parameter_config: Dict, n_runs: int, steps: int,
+                  initial_agents: int, root_seed: Optional[int]) -> str:
+    """Clé SHA-256 d'une analyse Monte Carlo (configuration + version d'IRIS)"""
+    payload = {
+        'parameter_config': parameter_config,
+        'n_runs': n_runs,
+        'steps': steps,
+        'initial_agents': initial_agents,
+        'root_seed': root_seed,
+        'iris_version': IRIS_VERSION,
+    }
+    encoded = json.dumps(payload, sort_keys=True, default=str).encode()
+    return hashlib.sha256(encoded).hexdigest()
+
+
+def _dump_json(data: Dict, path: Path) -> None:
+    """Écrit `data` en JSON indenté (orjson si disponible, json sinon)"""
+    if ORJSON_AVAILABLE:
+        with open(path, 'wb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY))
+    else:
+        with open(path, 'w') as f:
+            json.dump(data, f, indent=2)
+
+
+def _load_json(path) -> Dict:
+    """
+    Relit un fichier JSON (orjson si disponible, json sinon)
+
+    Avec orjson, le fichier est projeté en mémoire (mmap) et analysé sans
+    copie intermédiaire en bytes ; un fichier vide ne peut pas être projeté
+    et est lu normalement (orjson lève alors l'erreur de décodage).
+    """
+    if ORJSON_AVAILABLE:
+        with open(path, 'rb') as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return orjson.loads(f.read())
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                with memoryview(mapped) as view:
+                    return orjson.loads(view)
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+# Bandeau des affichages console (rapports Monte Carlo, sensibilité, KS)
+_BANNER = "=" * 80
+
+
+# Type des historiques θ/Gini conservés par run (MonteCarloResults)
+HISTORY_DTYPE = np.float32
+
+
+def _widen(matrix: np.ndarray, n_cycles: int) -> np.ndarray:
+    """Élargit une matrice d'historiques à n_cycles colonnes (complétée par NaN)"""
+    wider = np.full((matrix.shape[0], n_cycles), np.nan, dtype=matrix.dtype)
+    wider[:, :matrix.shape[1]] = matrix
+    return wider
+
+
+def _window_std(matrix: np.ndarray, window: int) -> np.ndarray:
+    """
+    Écart-type de chaque ligne sur ses `window` dernières valeurs renseignées
+
+    Calcul vectorisé sur toute la matrice (runs × cycles) : les fenêtres sont
+    alignées sur la fin de chaque historique (lignes complétées par NaN) et
+    couvrent tout l'historique s'il est plus court. Accumulation en float64.
+    """
+    lengths = np.count_nonzero(~np.isnan(matrix), axis=1)
+    cols = lengths[:, None] + np.arange(-window, 0)
+    windows = np.take_along_axis(matrix, np.maximum(cols, 0), axis=1).astype(np.float64)
+    windows[cols < 0] = np.nan
+    return np.nanstd(windows, axis=1)
 
 
 @dataclass
@@ -147,9 +243,23 @@ class MonteCarloResults:
     convergence_rate: float  # % de simulations qui ont convergé vers θ≈1
     oscillation_amplitude: float  # Amplitude moyenne des oscillations
 
-    # Historiques complets (toutes runs)
-    all_theta_histories: List[List[float]] = field(default_factory=list)
-    all_gini_histories: List[List[float]] = field(default_factory=list)
+    # Historiques complets : une ligne par run réussi, une colonne par cycle
+    # (float32, NaN en fin de ligne si un run est plus court)
+    all_theta_histories: np.ndarray = field(default_factory=lambda: np.empty((0, 0), dtype=HISTORY_DTYPE))
+    all_gini_histories: np.ndarray = field(default_factory=lambda: np.empty((0, 0), dtype=HISTORY_DTYPE))
+
+    # θ final de chaque run réussi (float64, pour les tests statistiques)
+    theta_finals: np.ndarray = field(default_factory=lambda: np.empty(0))
+
+    # θ finaux triés, calculés à la première demande (sorted_theta_finals)
+    _sorted_theta_finals: Optional[np.ndarray] = field(default=None, init=False,
+                                                       repr=False, compare=False)
+
+    def sorted_theta_finals(self) -> np.ndarray:
+        """θ finaux triés : le tri est fait une fois et réutilisé par les tests successifs"""
+        if self._sorted_theta_finals is None:
+            self._sorted_theta_finals = np.sort(self.theta_finals)
+        return self._sorted_theta_finals
 
     def to_dict(self) -> Dict:
         """Exporte en dictionnaire"""
@@ -226,6 +336,397 @@ class SensitivityResults:
         }
 
 
+# Fenêtre (derniers cycles) pour l'amplitude des oscillations, et seuil de
+# convergence |θ - 1| d'un run
+OSCILLATION_WINDOW = 50
+CONVERGENCE_TOLERANCE = 0.15
+
+
+# État interne du RAD (composantes de D, capteurs, flux du cycle, compteurs
+# C3) : recalculé par la simulation, ce n'est pas un paramètre à balayer
+RAD_STATE_FIELDS = frozenset({
+    'D_materielle', 'D_services', 'D_contractuelle', 'D_engagement', 'D_regulatrice',
+    'r_t', 'nu_eff', 'tau_eng',
+    'U_burn', 'S_burn', 'U_stake', 'U_total', 'V_on_previous',
+    'C3_crisis_counter', 'C3_cooldown_counter',
+})
+
+# Arguments acceptés par IRISEconomy et paramètres RAD modifiables (champs
+# numériques scalaires hors état interne : ni historiques, ni drapeaux),
+# pour valider les configurations avant de lancer les simulations
+ECONOMY_PARAMETERS = frozenset(inspect.signature(IRISEconomy).parameters)
+RAD_PARAMETERS = frozenset(
+    f.name for f in fields(RADState)
+    if f.type in (float, int, 'float', 'int')
+    and not f.name.startswith('_')
+    and f.name not in RAD_STATE_FIELDS
+)
+
+# Erreurs numériques qui font échouer un run (Monte Carlo ou sensibilité)
+# sans interrompre le balayage
+SIMULATION_ERRORS = (ArithmeticError, RuntimeError, np.linalg.LinAlgError)
+
+
+# Résultat d'un run de l'analyse de sensibilité (run_sensitivity_analysis)
+SENSITIVITY_RUN_DTYPE = np.dtype([('theta', 'f8'), ('gini', 'f8'), ('var', 'f8'), ('ok', '?')])
+
+
+def _collect_sensitivity_runs(results, shape: Tuple[int, int]) -> Tuple[np.ndarray, Dict[int, List[Dict]]]:
+    """
+    Replie les runs de sensibilité dans une matrice structurée variations × runs
+
+    Args:
+        results: Itérable des dicts renvoyés par _run_sensitivity, dans l'ordre
+            des tâches (variation par variation)
+        shape: (nombre de variations, runs par variation)
+
+    Returns:
+        (runs, failures) : matrice SENSITIVITY_RUN_DTYPE (ok=False pour un run
+        échoué) et runs échoués regroupés par indice de variation
+    """
+    runs = np.zeros(shape[0] * shape[1], dtype=SENSITIVITY_RUN_DTYPE)
+    failures: Dict[int, List[Dict]] = {}
+    for i, res in enumerate(results):
+        if res['success']:
+            runs[i] = (res['theta_final'], res['gini_final'], res['theta_variance'], True)
+        else:
+            failures.setdefault(i // shape[1], []).append(res)
+    return runs.reshape(shape), failures
+
+
+@lru_cache(maxsize=None)
+def _t_critical(df: int, confidence: float = 0.95) -> float:
+    """Valeur critique bilatérale de Student (mise en cache par degrés de liberté)"""
+    return float(stats.t.ppf(0.5 + confidence / 2, df))
+
+
+def _summary_stats_numpy(x: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Version NumPy de _summary_stats"""
+    return np.mean(x, axis=1), np.std(x, axis=1, ddof=1)
+
+
+def _summary_stats_loop(x):
+    """
+    Moyenne et écart-type (ddof=1) de chaque ligne de x en une passe
+
+    Algorithme de Welford, une ligne par série (θ, Gini, κ, η finaux).
+    """
+    n_series, n = x.shape
+    means = np.empty(n_series)
+    stds = np.empty(n_series)
+    for s in range(n_series):
+        mean = 0.0
+        m2 = 0.0
+        for i in range(n):
+            delta = x[s, i] - mean
+            mean += delta / (i + 1)
+            m2 += delta * (x[s, i] - mean)
+        means[s] = mean
+        stds[s] = np.sqrt(m2 / (n - 1))
+    return means, stds
+
+
+# Noyau compilé avec Numba, NumPy sinon
+if NUMBA_AVAILABLE:
+    _summary_stats = njit(cache=True, error_model='numpy')(_summary_stats_loop)
+else:
+    _summary_stats = _summary_stats_numpy
+
+
+def _baseline_elasticities_numpy(x: np.ndarray, f: np.ndarray, k: int,
+                                 baselines: np.ndarray) -> np.ndarray:
+    """Version NumPy de _baseline_elasticities (np.gradient sur toute la grille)"""
+    with np.errstate(invalid='ignore', divide='ignore'):
+        elasticities = np.gradient(f, x, axis=1)[:, k] * 100.0 / baselines
+    elasticities[~np.isfinite(elasticities)] = 0.0
+    return elasticities
+
+
+def _baseline_elasticities_loop(x, f, k, baselines):
+    """
+    Élasticités au point k de la grille x (triée, en %) des séries f (une par ligne)
+
+    Pente au point k seul, selon les formules de np.gradient (différence
+    centrée, pas uniforme ou non ; différence d'ordre 1 aux bords), puis
+    élasticité = pente × 100 / baseline. Valeur non finie (série
+    échouée, baseline nulle) : 0.
+    """
+    n = x.shape[0]
+    uniform = True
+    for i in range(2, n):
+        if x[i] - x[i - 1] != x[1] - x[0]:
+            uniform = False
+    elasticities = np.empty(f.shape[0])
+    for s in range(f.shape[0]):
+        if k == 0:
+            slope = (f[s, 1] - f[s, 0]) / (x[1] - x[0])
+        elif k == n - 1:
+            slope = (f[s, n - 1] - f[s, n - 2]) / (x[n - 1] - x[n - 2])
+        elif uniform:
+            slope = (f[s, k + 1] - f[s, k - 1]) / (2.0 * (x[1] - x[0]))
+        else:
+            dx1 = x[k] - x[k - 1]
+            dx2 = x[k + 1] - x[k]
+            a = -dx2 / (dx1 * (dx1 + dx2))
+            b = (dx2 - dx1) / (dx1 * dx2)
+            c = dx1 / (dx2 * (dx1 + dx2))
+            slope = a * f[s, k - 1] + b * f[s, k] + c * f[s, k + 1]
+        elasticity = slope * 100.0 / baselines[s]
+        elasticities[s] = elasticity if np.isfinite(elasticity) else 0.0
+    return elasticities
+
+
+# Noyau compilé avec Numba, NumPy sinon
+if NUMBA_AVAILABLE:
+    _baseline_elasticities = njit(cache=True, error_model='numpy')(_baseline_elasticities_loop)
+else:
+    _baseline_elasticities = _baseline_elasticities_numpy
+
+
+@lru_cache(maxsize=32)
+def _frozen_normal(loc: float, scale: float):
+    """Loi normale figée (mise en cache par (μ, σ) d'un test KS à l'autre)"""
+    return stats.norm(loc=loc, scale=scale)
+
+
+# Taille maximale d'échantillon pour le test de Shapiro-Wilk
+SHAPIRO_MAX_SAMPLES = 5000
+
+# Seuil de p-value KS (cible normale) en dessous duquel la non-normalité est
+# considérée comme acquise : Shapiro-Wilk n'est alors pas exécuté. Valeur
+# heuristique, très en deçà de tout niveau de test usuel (0.05, 0.01)
+KS_HARD_REJECTION_P = 1e-6
+
+
+# Métriques finales d'un run (run_monte_carlo)
+MC_FINALS_DTYPE = np.dtype([('theta', 'f8'), ('gini', 'f8'), ('kappa', 'f8'),
+                            ('eta', 'f8')])
+
+
+def _collect_mc_runs(results, n_runs: int, steps: int,
+                     verbose: bool) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Replie les runs Monte Carlo au fil de leur arrivée
+
+    Chaque résultat est copié dans des tableaux préalloués (métriques finales
+    MC_FINALS_DTYPE, matrices runs × cycles des historiques θ et Gini, NaN
+    au-delà de la fin d'un historique) puis abandonné : la liste complète des
+    résultats n'est jamais matérialisée.
+
+    Args:
+        results: Itérable des dicts renvoyés par _run_mc (dans l'ordre des runs)
+        n_runs: Nombre de runs attendus
+        steps: Nombre de cycles prévu (largeur initiale des matrices)
+        verbose: Affichage d'une ligne par run réussi
+
+    Returns:
+        (finals, theta_histories, gini_histories), restreints aux runs réussis
+    """
+    finals = np.empty(n_runs, dtype=MC_FINALS_DTYPE)
+    theta_histories = np.full((n_runs, steps), np.nan, dtype=HISTORY_DTYPE)
+    gini_histories = np.full((n_runs, steps), np.nan, dtype=HISTORY_DTYPE)
+    n_ok = 0
+    n_cycles = 0
+    for i, res in enumerate(results, 1):
+        if not res['success']:
+            continue
+        if verbose:
+            print(f"  Run {i}/{n_runs}: θ={res['theta_final']:.4f}, "
+                  f"Gini={res['gini_final']:.4f}, "
+                  f"converge={'✓' if abs(res['theta_final'] - 1.0) < CONVERGENCE_TOLERANCE else '✗'}")
+        finals[n_ok] = (res['theta_final'], res['gini_final'], res['kappa_final'], res['eta_final'])
+        theta_history, gini_history = res['theta_history'], res['gini_history']
+        width = max(len(theta_history), len(gini_history))
+        if width > theta_histories.shape[1]:
+            theta_histories = _widen(theta_histories, width)
+            gini_histories = _widen(gini_histories, width)
+        theta_histories[n_ok, :len(theta_history)] = theta_history
+        gini_histories[n_ok, :len(gini_history)] = gini_history
+        n_cycles = max(n_cycles, width)
+        n_ok += 1
+    return finals[:n_ok], theta_histories[:n_ok, :n_cycles], gini_histories[:n_ok, :n_cycles]
+
+
+# Configuration partagée des workers (fixée une fois par _init_worker)
+_WORKER_STATE: Dict = {}
+
+
+def _init_worker(state: Dict) -> None:
+    """
+    Initialiseur de ProcessPoolExecutor : mémorise la configuration du processus
+
+    Si state contient 'economy_config' (analyse de sensibilité), l'économie
+    du worker est construite ici, une fois, puis remise à zéro à chaque run.
+    Seuls les processus du pool remplissent _WORKER_STATE.
+    """
+    _WORKER_STATE.update(state)
+    if 'economy_config' in state:
+        _WORKER_STATE['economy'] = IRISEconomy(**state['economy_config'])
+
+
+def _mc_worker(run_id: int) -> Dict:
+    """Worker de processus : seul run_id transite, la configuration est déjà en place"""
+    return _run_mc(run_id, _WORKER_STATE['parameter_config'], _WORKER_STATE['steps'],
+                   _WORKER_STATE.get('root_seed'))
+
+
+def _mp_context():
+    """Contexte multiprocessing : fork si disponible (Linux), sinon défaut (spawn)"""
+    if 'fork' in mp.get_all_start_methods():
+        return mp.get_context('fork')
+    return None
+
+
+def _run_mc(run_id: int, parameter_config: Dict, steps: int,
+            root_seed: Optional[int] = None) -> Dict:
+    """
+    Exécute une seule simulation Monte Carlo avec seed fixé
+
+    Fonction de module (et non fonction imbriquée) pour rester picklable :
+    ProcessPoolExecutor peut ainsi la distribuer sur plusieurs processus.
+    Chaque appel représente une simulation indépendante avec son propre seed.
+
+    Args:
+        run_id: Identifiant unique de la simulation (0 à N-1)
+        parameter_config: Arguments de IRISEconomy
+        steps: Nombre de cycles
+        root_seed: Graine racine ; si fournie, le run reçoit le flux
+            SeedSequence(root_seed).spawn(n_runs)[run_id], sinon la graine
+            run_id + 1000 (parameter_config ne contient ni seed ni rng)
+
+    Returns:
+        Dict contenant toutes les métriques de cette simulation
+    """
+    try:
+        # Graine propre au run, pour la reproductibilité :
+        # - sans root_seed : seed = run_id + 1000, différent pour chaque run mais
+        #   toujours le même pour un run_id donné (l'offset évite les seeds
+        #   proches de 0)
+        # - avec root_seed : SeedSequence(root_seed, spawn_key=(run_id,)) est le
+        #   run_id-ième enfant de SeedSequence(root_seed).spawn(), flux
+        #   indépendants garantis
+        if root_seed is None:
+            run_rng = {'seed': run_id + 1000}
+        else:
+            run_rng = {'rng': np.random.default_rng(
+                np.random.SeedSequence(root_seed, spawn_key=(run_id,)))}
+
+        # Crée une nouvelle économie IRIS avec la configuration fournie
+        economy = IRISEconomy(**run_rng, **parameter_config)
+
+        # Lance la simulation pour 'steps' cycles
+        # n_transactions=10 signifie 10 transactions par agent par cycle
+        economy.simulate(steps=steps, n_transactions=10)
+
+        kappa_final = economy.rad.kappa          # κ final (coefficient conversion)
+        eta_final = economy.rad.eta              # η final (rendement combustion)
+
+        # Historiques complets (évolution temporelle), convertis directement
+        # en tableaux float32 dans le worker : le parent reçoit un tampon
+        # binaire de 4 octets par cycle au lieu d'une liste de floats Python
+        theta_series = economy.history['thermometer']
+        gini_series = economy.history['gini_coefficient']
+
+        # θ final (= economy.thermometer()) et Gini final, en float64 ;
+        # oscillations et convergence sont calculées ensuite pour tous les runs
+        return {
+            'run_id': run_id,
+            'success': True,
+            'theta_final': float(theta_series[-1]),
+            'gini_final': float(gini_series[-1]),
+            'kappa_final': kappa_final,
+            'eta_final': eta_final,
+            'theta_history': np.asarray(theta_series, dtype=HISTORY_DTYPE),
+            'gini_history': np.asarray(gini_series, dtype=HISTORY_DTYPE)
+        }
+    except SIMULATION_ERRORS as e:
+        # Simulation échouée (erreur numérique) ; toute autre exception est
+        # un bogue et remonte au lieu d'être comptée comme run échoué
+        return {
+            'run_id': run_id,
+            'success': False,
+            'error': str(e)
+        }
+
+
+def _sensitivity_worker(task: Tuple[float, float, int]) -> Dict:
+    """Worker de processus de l'analyse de sensibilité (configuration dans _WORKER_STATE)"""
+    pct, new_value, run_id = task
+    return _run_sensitivity(pct, new_value, run_id, _WORKER_STATE['parameter_name'],
+                            _WORKER_STATE['steps'], _WORKER_STATE['economy'])
+
+
+def _sensitivity_config(initial_agents: int, steps: int) -> Dict:
+    """Arguments de IRISEconomy communs à tous les runs de sensibilité (hors seed)"""
+    return {
+        'initial_agents': initial_agents,
+        'enable_demographics': True,  # Naissances/morts activées
+        'enable_catastrophes': True,  # Événements aléatoires activés
+        'steps_hint': steps,
+    }
+
+
+def _run_sensitivity(variation_pct: float, new_value: float, run_id: int,
+                     parameter_name: str, steps: int, economy: IRISEconomy) -> Dict:
+    """
+    Exécute une simulation de l'analyse de sensibilité avec un paramètre modifié
+
+    L'économie est réutilisée d'un run à l'autre : reset(seed) la ramène à
+    l'état d'une IRISEconomy(seed=seed) neuve sans réallouer historiques et
+    tampons. Elle appartient au worker (construite par _init_worker) ou,
+    en séquentiel, au balayage qui l'a créée.
+
+    Args:
+        variation_pct: Pourcentage de variation (ex: -10, 0, +10)
+        new_value: Nouvelle valeur du paramètre (baseline × (1 + variation_pct/100))
+        run_id: Indice du run pour cette variation
+        parameter_name: Nom du paramètre RAD
+        steps: Nombre de cycles
+        economy: Économie réutilisée (configuration _sensitivity_config)
+
+    Returns:
+        Dict avec θ final, Gini final et variance de θ (ou l'erreur)
+    """
+    try:
+        # Seed reproductible (doit être positif et < 2^32)
+        # Formule complexe pour éviter collisions et garder reproductibilité
+        # abs() pour éviter négatifs, % pour rester sous 2^32
+        seed = abs(int(variation_pct * 1000) + run_id + 5000) % (2**32 - 1)
+
+        # Remise à zéro de l'économie réutilisée avec la graine du run
+        economy.reset(seed=seed)
+
+        # CRITIQUE: Modifie le paramètre RAD dynamiquement
+        # Le nom est validé une fois par run_sensitivity_analysis : écriture
+        # directe, sans hasattr ni passage par setattr à chaque run
+        # Exemple: parameter_name='alpha_eta' ≡ economy.rad.alpha_eta = new_value
+        object.__setattr__(economy.rad, parameter_name, new_value)
+
+        # Lance la simulation
+        economy.simulate(steps=steps, n_transactions=10)
+
+        # Calcule la variance de θ comme mesure de stabilité (50 derniers cycles,
+        # tout l'historique s'il est plus court)
+        # Variance élevée = système instable, variance faible = système stable
+        theta_variance = np.var(economy.history['thermometer'][-OSCILLATION_WINDOW:])
+
+        return {
+            'run_id': run_id,
+            'success': True,
+            'theta_final': economy.thermometer(),      # Thermomètre final
+            'gini_final': economy.gini_coefficient(),  # Gini final
+            'theta_variance': theta_variance
+        }
+    except SIMULATION_ERRORS as e:
+        # Simulation échouée (erreur numérique) ; toute autre exception est
+        # un bogue et remonte au lieu d'être comptée comme run échoué
+        return {
+            'run_id': run_id,
+            'success': False,
+            'error': str(e)
+        }
+
+
 class IRISValidator:
     """
     Validateur académique pour le modèle IRIS
@@ -249,8 +750,12 @@ class IRISValidator:
                        steps: int = 100,
                        initial_agents: int = 100,
                        parameter_config: Optional[Dict] = None,
-                       parallel: bool = False,  # Désactivé par défaut (pickle issues)
-                       verbose: bool = True) -> MonteCarloResults:
+                       parallel: bool = True,
+                       verbose: bool = True,
+                       export_histories: bool = False,
+                       root_seed: Optional[int] = None,
+                       use_cache: bool = False,
+                       force: bool = False) -> MonteCarloResults:
         """
         Exécute une analyse Monte Carlo avec N simulations indépendantes
 
@@ -264,21 +769,42 @@ class IRISValidator:
         3. Calcule statistiques agrégées (moyenne, variance, CI 95%)
         4. Évalue stabilité (convergence, oscillations, crashes)
 
+        PARALLÉLISME:
+        Les runs sont répartis sur des processus (un IRISEconomy par run) et non
+        vectorisés sur un axe « runs » : le modèle est un système multi-agents
+        objet (agents, actifs NFT, démographie, entreprises, catastrophes) dont
+        la population et les événements divergent d'un run à l'autre ; il n'a
+        pas d'état tensoriel (runs × agents) à faire avancer d'un seul pas NumPy.
+        Seule l'agrégation (matrices runs × cycles, statistiques) est vectorisée.
+
         Args:
             n_runs: Nombre de simulations indépendantes (défaut: 100)
             steps: Nombre de cycles par simulation (défaut: 100)
             initial_agents: Nombre d'agents initiaux (défaut: 100)
             parameter_config: Configuration personnalisée des paramètres
-            parallel: Exécution parallèle (défaut: True)
+            parallel: Exécution multi-processus (défaut: True)
             verbose: Affichage des progrès (défaut: True)
+            export_histories: Archive les historiques θ/Gini en float16
+                dans mc_histories.npz (défaut: False)
+            root_seed: Graine racine dont dérivent les flux aléatoires de tous
+                les runs via SeedSequence.spawn (défaut: None, graine
+                run_id + 1000 par run)
+            use_cache: Relit/écrit les résultats dans output_dir/.cache, indexés
+                par la configuration et la version d'IRIS (défaut: False)
+            force: Avec use_cache, relance les simulations et remplace
+                l'entrée du cache (défaut: False)
 
         Returns:
             MonteCarloResults: Résultats statistiques complets
+
+        Raises:
+            ValueError: Si parameter_config contient un argument inconnu d'IRISEconomy,
+                ou 'seed'/'rng' (la graine est fixée par run : root_seed ou run_id + 1000)
         """
         if verbose:
-            print(f"\n{'='*80}")
+            print(f"\n{_BANNER}")
             print(f"MONTE CARLO ANALYSIS - {n_runs} runs × {steps} steps")
-            print(f"{'='*80}\n")
+            print(f"{_BANNER}\n")
 
         # Configuration par défaut si non fournie
         if parameter_config is None:
@@ -288,156 +814,110 @@ class IRISValidator:
                 'enable_catastrophes': True
             }
 
-        # Fonction worker pour exécution parallèle
-        def run_single_simulation(run_id: int) -> Dict:
-            """
-            Exécute une seule simulation avec seed fixé
-
-            Cette fonction est le "worker" qui sera appelé N fois en parallèle ou séquentiellement.
-            Chaque appel représente une simulation indépendante avec son propre seed aléatoire.
-
-            Args:
-                run_id: Identifiant unique de la simulation (0 à N-1)
-
-            Returns:
-                Dict contenant toutes les métriques de cette simulation
-            """
-            try:
-                # Fixe le seed pour reproductibilité
-                # Chaque run_id génère un seed différent mais toujours le même pour ce run_id
-                # L'offset +1000 évite les seeds proches de 0 qui peuvent être problématiques
-                np.random.seed(run_id + 1000)
-
-                # Crée une nouvelle économie IRIS avec la configuration fournie
-                economy = IRISEconomy(**parameter_config)
-
-                # Lance la simulation pour 'steps' cycles
-                # n_transactions=10 signifie 10 transactions par agent par cycle
-                economy.simulate(steps=steps, n_transactions=10)
-
-                # Collecte les métriques finales (à la fin de la simulation)
-                theta_final = economy.thermometer()      # θ = D/V_on (équilibre = 1.0)
-                gini_final = economy.gini_coefficient()  # Coefficient Gini (inégalités)
-                kappa_final = economy.rad.kappa          # κ final (coefficient conversion)
-                eta_final = economy.rad.eta              # η final (rendement combustion)
-
-                # Historiques complets (évolution temporelle)
-                theta_history = economy.history['thermometer']
-                gini_history = economy.history['gini_coefficient']
-
-                # Calcul de la convergence: est-ce que θ est proche de 1.0 ?
-                # On considère convergé si |θ - 1.0| < 15% (critère arbitraire mais raisonnable)
-                convergence = abs(theta_final - 1.0) < 0.15
-
-                # Calcul de l'amplitude des oscillations (mesure de stabilité)
-                # On prend l'écart-type des 50 derniers cycles pour mesurer les fluctuations
-                if len(theta_history) > 10:
-                    oscillation = np.std(theta_history[-50:])  # Écart-type 50 derniers cycles
-                else:
-                    oscillation = np.std(theta_history)  # Si < 50 cycles, prend tout
-
-                return {
-                    'run_id': run_id,
-                    'success': True,
-                    'theta_final': theta_final,
-                    'gini_final': gini_final,
-                    'kappa_final': kappa_final,
-                    'eta_final': eta_final,
-                    'theta_history': theta_history,
-                    'gini_history': gini_history,
-                    'convergence': convergence,
-                    'oscillation': oscillation
-                }
-            except Exception as e:
-                # Simulation a crashé
-                return {
-                    'run_id': run_id,
-                    'success': False,
-                    'error': str(e)
-                }
+        # Validation de la configuration une seule fois, avant de lancer les runs
+        unknown = set(parameter_config) - ECONOMY_PARAMETERS
+        if unknown:
+            raise ValueError(f"Paramètres inconnus pour IRISEconomy : {sorted(unknown)}")
+        # Une graine commune rendrait tous les runs identiques
+        seeded = {'seed', 'rng'} & set(parameter_config)
+        if seeded:
+            raise ValueError(f"{sorted(seeded)} interdit dans parameter_config : chaque run "
+                             f"reçoit sa propre graine (utiliser root_seed)")
+
+        # Cache : même configuration → mêmes runs (graines déterministes)
+        cache_path = None
+        if use_cache:
+            cache_key = _mc_cache_key(parameter_config, n_runs, steps, initial_agents, root_seed)
+            cache_path = self.output_dir / ".cache" / f"{cache_key}.pkl"
+            if cache_path.exists() and not force:
+                with open(cache_path, 'rb') as f:
+                    results_obj = pickle.load(f)
+                if verbose:
+                    print(f"♻️  Résultats Monte Carlo relus depuis le cache: {cache_path}")
+                return results_obj
 
         # ==================================================================================
         # EXÉCUTION DES SIMULATIONS (parallèle ou séquentielle)
         # ==================================================================================
         if parallel and n_runs > 1:
             # Mode PARALLÈLE: utilise plusieurs cœurs CPU pour accélérer
-            # Attention: peut causer des erreurs de pickle avec nested functions
             n_workers = min(mp.cpu_count(), n_runs)  # Limite au nombre de runs ou CPU
             if verbose:
                 print(f"Exécution parallèle sur {n_workers} workers...")
 
-            # ProcessPoolExecutor distribue les runs sur plusieurs processus
-            with ProcessPoolExecutor(max_workers=n_workers) as executor:
-                results = list(executor.map(run_single_simulation, range(n_runs)))
+            # ProcessPoolExecutor distribue les runs sur plusieurs processus :
+            # la configuration est transmise une fois par worker (initializer),
+            # puis seuls les run_id circulent, par lots (chunksize) ; les
+            # résultats sont repliés au fil de l'eau (progrès affiché en direct)
+            chunksize = max(1, n_runs // (4 * n_workers))
+            with ProcessPoolExecutor(max_workers=n_workers, mp_context=_mp_context(),
+                                     initializer=_init_worker,
+                                     initargs=({'parameter_config': parameter_config,
+                                                'steps': steps,
+                                                'root_seed': root_seed},)) as executor:
+                finals, all_theta_histories, all_gini_histories = _collect_mc_runs(
+                    executor.map(_mc_worker, range(n_runs), chunksize=chunksize),
+                    n_runs, steps, verbose)
         else:
-            # Mode SÉQUENTIEL: exécute les simulations une par une
-            # Plus lent mais plus stable et permet le suivi en temps réel
+            # Mode SÉQUENTIEL: exécute les simulations une par une (même worker)
             if verbose:
                 print("Exécution séquentielle...")
-            results = [run_single_simulation(i) for i in range(n_runs)]
-
-            # Affichage du progrès pour chaque simulation
-            if verbose:
-                for i, res in enumerate(results, 1):
-                    if res['success']:
-                        print(f"  Run {i}/{n_runs}: θ={res['theta_final']:.4f}, "
-                              f"Gini={res['gini_final']:.4f}, "
-                              f"converge={'✓' if res['convergence'] else '✗'}")
+            finals, all_theta_histories, all_gini_histories = _collect_mc_runs(
+                (_run_mc(run_id, parameter_config, steps, root_seed) for run_id in range(n_runs)),
+                n_runs, steps, verbose)
 
         # ==================================================================================
         # FILTRAGE ET VALIDATION DES RÉSULTATS
         # ==================================================================================
-        # Filtre les runs réussis (certains peuvent avoir crashé)
-        successful_runs = [r for r in results if r['success']]
-        crash_rate = (n_runs - len(successful_runs)) / n_runs
+        # Seuls les runs réussis ont été conservés (certains peuvent avoir crashé)
+        n_successful = len(finals)
+        crash_rate = (n_runs - n_successful) / n_runs
 
         # Si toutes les simulations ont échoué, on ne peut pas continuer
-        if len(successful_runs) == 0:
+        if n_successful == 0:
             raise RuntimeError("Toutes les simulations ont échoué!")
 
         # ==================================================================================
         # EXTRACTION DES MÉTRIQUES
         # ==================================================================================
-        # Convertit les listes en arrays numpy pour faciliter les calculs statistiques
-        theta_finals = np.array([r['theta_final'] for r in successful_runs])
-        gini_finals = np.array([r['gini_final'] for r in successful_runs])
-        kappa_finals = np.array([r['kappa_final'] for r in successful_runs])
-        eta_finals = np.array([r['eta_final'] for r in successful_runs])
-
-        # Métriques de convergence et stabilité
-        convergences = [r['convergence'] for r in successful_runs]
-        oscillations = np.array([r['oscillation'] for r in successful_runs])
-
-        # Historiques complets pour analyse temporelle
-        all_theta_histories = [r['theta_history'] for r in successful_runs]
-        all_gini_histories = [r['gini_history'] for r in successful_runs]
+        # Un tableau structuré (une ligne par run réussi), dont chaque champ
+        # est lu comme une vue sans copie ; historiques en matrices runs × cycles
+        # (bandes de quantiles par cycle : np.quantile(..., axis=0))
+        theta_finals = finals['theta']
+        gini_finals = finals['gini']
+        kappa_finals = finals['kappa']
+        eta_finals = finals['eta']
+
+        # Métriques de convergence et stabilité, pour tous les runs à la fois :
+        # - convergence : |θ - 1.0| < 15% (critère arbitraire mais raisonnable)
+        # - amplitude des oscillations : écart-type des 50 derniers cycles
+        #   (tout l'historique s'il est plus court)
+        convergences = np.abs(theta_finals - 1.0) < CONVERGENCE_TOLERANCE
+        oscillations = _window_std(all_theta_histories, OSCILLATION_WINDOW)
 
         # ==================================================================================
         # CALCUL DES STATISTIQUES DESCRIPTIVES
         # ==================================================================================
-        # Moyenne et écart-type de θ
-        theta_mean = np.mean(theta_finals)
-        theta_std = np.std(theta_finals, ddof=1)  # ddof=1 pour correction Bessel (échantillon)
+        # Moyennes et écarts-types de θ, Gini, κ et η en un seul appel, sur la
+        # matrice (4 séries × runs) ; ddof=1 pour correction Bessel (échantillon)
+        series = np.ascontiguousarray(np.stack([theta_finals, gini_finals, kappa_finals, eta_finals]))
+        means, stds = _summary_stats(series)
+        theta_mean, gini_mean, kappa_mean, eta_mean = means.tolist()
+        theta_std, gini_std, kappa_std, eta_std = stds.tolist()
+
+        # Min, quartiles et max en un seul appel (une sélection au lieu de 4 passes)
+        theta_min, theta_q25, theta_q75, theta_max = np.quantile(theta_finals, [0.0, 0.25, 0.75, 1.0])
 
         # Intervalle de confiance à 95% en utilisant la distribution t de Student
         # Pourquoi t-distribution ? Car on a un échantillon (pas toute la population)
-        theta_ci_lower, theta_ci_upper = stats.t.interval(
-            0.95,  # Niveau de confiance (95%)
-            len(theta_finals) - 1,  # Degrés de liberté (n-1)
-            loc=theta_mean,  # Centre de la distribution
-            scale=stats.sem(theta_finals)  # Erreur standard de la moyenne
-        )
-
-        gini_mean = np.mean(gini_finals)
-        gini_std = np.std(gini_finals, ddof=1)
+        # IC = moyenne ± t(0.975, n-1) × erreur standard de la moyenne
+        theta_sem = theta_std / np.sqrt(len(theta_finals))
+        theta_margin = _t_critical(len(theta_finals) - 1) * theta_sem
+        theta_ci_lower, theta_ci_upper = theta_mean - theta_margin, theta_mean + theta_margin
 
-        kappa_mean = np.mean(kappa_finals)
-        kappa_std = np.std(kappa_finals, ddof=1)
+        gini_min, gini_max = np.quantile(gini_finals, [0.0, 1.0])
 
-        eta_mean = np.mean(eta_finals)
-        eta_std = np.std(eta_finals, ddof=1)
-
-        convergence_rate = sum(convergences) / len(convergences)
+        convergence_rate = np.count_nonzero(convergences) / len(convergences)
         oscillation_amplitude = np.mean(oscillations)
 
         # Résultats
@@ -447,16 +927,16 @@ class IRISValidator:
             parameter_config=parameter_config,
             theta_mean=theta_mean,
             theta_std=theta_std,
-            theta_min=np.min(theta_finals),
-            theta_max=np.max(theta_finals),
-            theta_q25=np.percentile(theta_finals, 25),
-            theta_q75=np.percentile(theta_finals, 75),
+            theta_min=theta_min,
+            theta_max=theta_max,
+            theta_q25=theta_q25,
+            theta_q75=theta_q75,
             theta_ci_lower=theta_ci_lower,
             theta_ci_upper=theta_ci_upper,
             gini_mean=gini_mean,
             gini_std=gini_std,
-            gini_min=np.min(gini_finals),
-            gini_max=np.max(gini_finals),
+            gini_min=gini_min,
+            gini_max=gini_max,
             kappa_mean=kappa_mean,
             kappa_std=kappa_std,
             eta_mean=eta_mean,
@@ -465,18 +945,19 @@ class IRISValidator:
             convergence_rate=convergence_rate,
             oscillation_amplitude=oscillation_amplitude,
             all_theta_histories=all_theta_histories,
-            all_gini_histories=all_gini_histories
+            all_gini_histories=all_gini_histories,
+            theta_finals=theta_finals.copy()
         )
 
         # Affichage résumé
         if verbose:
-            print(f"\n{'='*80}")
-            print(f"RÉSULTATS MONTE CARLO ({len(successful_runs)}/{n_runs} runs réussis)")
-            print(f"{'='*80}")
+            print(f"\n{_BANNER}")
+            print(f"RÉSULTATS MONTE CARLO ({n_successful}/{n_runs} runs réussis)")
+            print(f"{_BANNER}")
             print(f"\nThermomètre θ:")
             print(f"  - Moyenne : {theta_mean:.4f}")
             print(f"  - Écart-type : {theta_std:.4f}")
-            print(f"  - Min/Max : [{np.min(theta_finals):.4f}, {np.max(theta_finals):.4f}]")
+            print(f"  - Min/Max : [{theta_min:.4f}, {theta_max:.4f}]")
             print(f"  - IC 95% : [{theta_ci_lower:.4f}, {theta_ci_upper:.4f}]")
             print(f"\nGini:")
             print(f"  - Moyenne : {gini_mean:.4f}")
@@ -485,20 +966,39 @@ class IRISValidator:
             print(f"  - Taux convergence : {convergence_rate*100:.1f}%")
             print(f"  - Taux crash : {crash_rate*100:.1f}%")
             print(f"  - Amplitude oscillations : {oscillation_amplitude:.4f}")
-            print(f"{'='*80}\n")
+            print(f"{_BANNER}\n")
 
         # Sauvegarde résultats
-        self._save_monte_carlo_results(results_obj)
+        self._save_monte_carlo_results(results_obj, export_histories)
+        if cache_path is not None:
+            cache_path.parent.mkdir(exist_ok=True)
+            with open(cache_path, 'wb') as f:
+                pickle.dump(results_obj, f, protocol=pickle.HIGHEST_PROTOCOL)
 
         return results_obj
 
-    def _save_monte_carlo_results(self, results: MonteCarloResults) -> None:
-        """Sauvegarde les résultats Monte Carlo"""
+    def _save_monte_carlo_results(self, results: MonteCarloResults,
+                                  export_histories: bool = False) -> None:
+        """
+        Sauvegarde les résultats Monte Carlo
+
+        Les statistiques scalaires vont dans le JSON ; les historiques
+        (runs × cycles) sont archivés à part en float16, précision largement
+        suffisante pour des tracés et 4x plus compacte qu'en float64.
+        """
         output_path = self.output_dir / "monte_carlo_results.json"
-        with open(output_path, 'w') as f:
-            json.dump(results.to_dict(), f, indent=2)
+        _dump_json(results.to_dict(), output_path)
         print(f"✅ Résultats sauvegardés: {output_path}")
 
+        if export_histories:
+            histories_path = self.output_dir / "mc_histories.npz"
+            np.savez_compressed(
+                histories_path,
+                theta=results.all_theta_histories.astype(np.float16),
+                gini=results.all_gini_histories.astype(np.float16),
+            )
+            print(f"✅ Historiques sauvegardés: {histories_path}")
+
     def run_sensitivity_analysis(self,
                                  parameter_name: str,
                                  baseline_value: float,
@@ -506,6 +1006,7 @@ class IRISValidator:
                                  n_runs_per_variation: int = 20,
                                  steps: int = 100,
                                  initial_agents: int = 100,
+                                 parallel: bool = True,
                                  verbose: bool = True) -> SensitivityResults:
         """
         Analyse de sensibilité : variation d'un paramètre clé
@@ -521,137 +1022,81 @@ class IRISValidator:
         4. Calcule l'élasticité : (Δθ/θ) / (Δp/p)
 
         Args:
-            parameter_name: Nom du paramètre RAD (ex: 'eta_alpha', 'kappa_beta', 'eta_smoothing')
+            parameter_name: Nom du paramètre RAD (ex: 'alpha_eta', 'beta_kappa', 'delta_m'), voir RAD_PARAMETERS
             baseline_value: Valeur de référence
             variation_pct: Liste des variations en % (ex: [-10, -5, 0, 5, 10])
             n_runs_per_variation: Nombre de runs Monte Carlo par variation
             steps: Nombre de cycles par simulation
             initial_agents: Nombre d'agents initiaux
+            parallel: Exécution multi-processus de toutes les simulations (défaut: True)
             verbose: Affichage des progrès
 
         Returns:
             SensitivityResults: Résultats de l'analyse de sensibilité
+
+        Raises:
+            ValueError: Si parameter_name n'est pas un paramètre réglable de RADState
         """
+        # Validation du paramètre une seule fois, avant tout le balayage
+        # (paramètres scalaires uniquement : ni méthode, ni historique, ni état)
+        if parameter_name not in RAD_PARAMETERS:
+            raise ValueError(f"Paramètre '{parameter_name}' n'est pas un paramètre réglable "
+                             f"de RADState (attendu : {', '.join(sorted(RAD_PARAMETERS))})")
+
         if verbose:
-            print(f"\n{'='*80}")
+            print(f"\n{_BANNER}")
             print(f"SENSITIVITY ANALYSIS - {parameter_name}")
             print(f"Baseline: {baseline_value}, Variations: {variation_pct}%")
             print(f"{n_runs_per_variation} runs per variation × {steps} steps")
-            print(f"{'='*80}\n")
-
-        theta_impacts = []
-        gini_impacts = []
-        stability_impacts = []
-
-        # Fonction worker pour une variation donnée
-        def run_variation_batch(variation_pct: float, new_value: float) -> Dict:
-            """
-            Exécute n_runs simulations avec un paramètre modifié
-
-            Pour chaque variation du paramètre (ex: -10%, 0%, +10%), cette fonction
-            lance plusieurs simulations Monte Carlo indépendantes et collecte les statistiques.
-
-            Args:
-                variation_pct: Pourcentage de variation (ex: -10, 0, +10)
-                new_value: Nouvelle valeur du paramètre (baseline × (1 + variation_pct/100))
-
-            Returns:
-                Dict avec moyennes de θ, Gini, stabilité et nombre de runs réussis
-            """
-            theta_results = []
-            gini_results = []
-            theta_variances = []
-
-            # Lance n_runs_per_variation simulations avec ce paramètre
-            for run_id in range(n_runs_per_variation):
-                try:
-                    # Seed reproductible (doit être positif et < 2^32)
-                    # Formule complexe pour éviter collisions et garder reproductibilité
-                    # abs() pour éviter négatifs, % pour rester sous 2^32
-                    seed = abs(int(variation_pct * 1000) + run_id + 5000) % (2**32 - 1)
-                    np.random.seed(seed)
-
-                    # Crée une nouvelle économie IRIS
-                    economy = IRISEconomy(
-                        initial_agents=initial_agents,
-                        enable_demographics=True,  # Naissances/morts activées
-                        enable_catastrophes=True    # Événements aléatoires activés
-                    )
-
-                    # CRITIQUE: Modifie le paramètre RAD dynamiquement
-                    # setattr() permet de modifier un attribut par son nom (string)
-                    # Exemple: setattr(economy.rad, 'eta_alpha', 0.55) ≡ economy.rad.eta_alpha = 0.55
-                    if hasattr(economy.rad, parameter_name):
-                        setattr(economy.rad, parameter_name, new_value)
-                    else:
-                        raise ValueError(f"Paramètre '{parameter_name}' n'existe pas dans RADState")
-
-                    # Lance la simulation
-                    economy.simulate(steps=steps, n_transactions=10)
-
-                    # Collecte les métriques finales
-                    theta_final = economy.thermometer()       # Thermomètre final
-                    gini_final = economy.gini_coefficient()   # Gini final
-
-                    # Calcule la variance de θ comme mesure de stabilité
-                    # Variance élevée = système instable, variance faible = système stable
-                    if len(economy.history['thermometer']) > 10:
-                        # Prend les 50 derniers cycles pour mesurer stabilité récente
-                        theta_variance = np.var(economy.history['thermometer'][-50:])
-                    else:
-                        # Si moins de 50 cycles, prend tout
-                        theta_variance = np.var(economy.history['thermometer'])
-
-                    # Stocke les résultats
-                    theta_results.append(theta_final)
-                    gini_results.append(gini_final)
-                    theta_variances.append(theta_variance)
-
-                except Exception as e:
-                    # Simulation échouée, on continue sans cette simulation
-                    if verbose:
-                        print(f"    ⚠ Run {run_id} failed: {e}")
-                    continue
-
-            # Agrégation des résultats de toutes les simulations
-            if len(theta_results) > 0:
-                # Calcule les moyennes sur toutes les simulations réussies
-                theta_mean = np.mean(theta_results)
-                gini_mean = np.mean(gini_results)
-                stability_mean = np.mean(theta_variances)  # Moyenne des variances
-            else:
-                # Aucune simulation n'a réussi, retourne NaN
-                theta_mean = np.nan
-                gini_mean = np.nan
-                stability_mean = np.nan
-
-            return {
-                'theta_mean': theta_mean,
-                'gini_mean': gini_mean,
-                'stability_mean': stability_mean,
-                'n_successful': len(theta_results)
-            }
-
-        # Exécute pour chaque variation
-        for pct in variation_pct:
-            # Calcule nouvelle valeur
-            new_value = baseline_value * (1 + pct/100)
-
+            print(f"{_BANNER}\n")
+
+        # Toutes les simulations (variations × runs) sont soumises d'un bloc au
+        # même pool de processus, puis regroupées par variation
+        new_values = (baseline_value * (1 + np.asarray(variation_pct, dtype=np.float64) / 100)).tolist()
+        tasks = [(pct, new_value, run_id)
+                 for (pct, new_value), run_id in product(zip(variation_pct, new_values),
+                                                         range(n_runs_per_variation))]
+        shape = (len(variation_pct), n_runs_per_variation)
+
+        if parallel and len(tasks) > 1:
+            n_workers = min(mp.cpu_count(), len(tasks))
             if verbose:
-                print(f"Testing {parameter_name}={new_value:.4f} ({pct:+.0f}%)...")
-
-            # Exécute batch de simulations
-            batch_results = run_variation_batch(pct, new_value)
-
-            theta_impacts.append(batch_results['theta_mean'])
-            gini_impacts.append(batch_results['gini_mean'])
-            stability_impacts.append(batch_results['stability_mean'])
+                print(f"Exécution parallèle de {len(tasks)} simulations sur {n_workers} workers...")
+            chunksize = max(1, len(tasks) // (4 * n_workers))
+            state = {'parameter_name': parameter_name,
+                     'steps': steps,
+                     'economy_config': _sensitivity_config(initial_agents, steps)}
+            with ProcessPoolExecutor(max_workers=n_workers, mp_context=_mp_context(),
+                                     initializer=_init_worker,
+                                     initargs=(state,)) as executor:
+                runs, failures = _collect_sensitivity_runs(
+                    executor.map(_sensitivity_worker, tasks, chunksize=chunksize), shape)
+        else:
+            # Économie locale au balayage : libérée à la fin de l'analyse
+            economy = IRISEconomy(**_sensitivity_config(initial_agents, steps))
+            runs, failures = _collect_sensitivity_runs(
+                (_run_sensitivity(pct, new_value, run_id, parameter_name, steps, economy)
+                 for pct, new_value, run_id in tasks), shape)
+            del economy
+
+        # Agrégation par variation : moyennes par ligne sur les runs réussis
+        # (NaN si aucun run de la variation n'a réussi)
+        ok = runs['ok']
+        n_ok = np.count_nonzero(ok, axis=1)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            theta_impacts = (np.where(ok, runs['theta'], 0.0).sum(axis=1) / n_ok).tolist()
+            gini_impacts = (np.where(ok, runs['gini'], 0.0).sum(axis=1) / n_ok).tolist()
+            stability_impacts = (np.where(ok, runs['var'], 0.0).sum(axis=1) / n_ok).tolist()
 
-            if verbose:
-                print(f"  → θ={batch_results['theta_mean']:.4f}, "
-                      f"Gini={batch_results['gini_mean']:.4f}, "
-                      f"σ²_θ={batch_results['stability_mean']:.4f} "
-                      f"({batch_results['n_successful']}/{n_runs_per_variation} runs OK)")
+        if verbose:
+            for i, (pct, new_value) in enumerate(zip(variation_pct, new_values)):
+                print(f"Testing {parameter_name}={new_value:.4f} ({pct:+.0f}%)...")
+                for res in failures.get(i, []):
+                    print(f"    ⚠ Run {res['run_id']} failed: {res['error']}")
+                print(f"  → θ={theta_impacts[i]:.4f}, "
+                      f"Gini={gini_impacts[i]:.4f}, "
+                      f"σ²_θ={stability_impacts[i]:.4f} "
+                      f"({n_ok[i]}/{n_runs_per_variation} runs OK)")
 
         # ==================================================================================
         # CALCUL DES ÉLASTICITÉS
@@ -666,56 +1111,41 @@ class IRISValidator:
         # - ε < 0 : Relation inverse (ex: augmenter α diminue θ)
         # ==================================================================================
 
+        # Indice de chaque variation (première occurrence), construit une fois
+        pct_index: Dict[float, int] = {}
+        for i, pct in enumerate(variation_pct):
+            pct_index.setdefault(pct, i)
+
         # Trouve l'indice de la valeur baseline (variation 0%)
-        theta_baseline_idx = variation_pct.index(0) if 0 in variation_pct else len(variation_pct) // 2
+        theta_baseline_idx = pct_index.get(0, len(variation_pct) // 2)
         theta_baseline = theta_impacts[theta_baseline_idx]
         gini_baseline = gini_impacts[theta_baseline_idx]
 
-        # Élasticité moyenne calculée par différence finie (approximation de la dérivée)
-        if len(variation_pct) >= 3 and not np.isnan(theta_baseline):
-            # Trouve les indices pour calculer la pente (préfère ±5% ou ±10%)
-            # On utilise deux points symétriques autour de baseline pour minimiser le biais
-            if -5 in variation_pct and 5 in variation_pct:
-                idx_minus = variation_pct.index(-5)
-                idx_plus = variation_pct.index(5)
-            elif -10 in variation_pct and 10 in variation_pct:
-                idx_minus = variation_pct.index(-10)
-                idx_plus = variation_pct.index(10)
-            else:
-                # Fallback: utilise les extrêmes
-                idx_minus = 0
-                idx_plus = -1
-
-            # Calcul élasticité θ
-            # Vérifie d'abord que les valeurs ne sont pas nan (simulations échouées)
-            if not np.isnan(theta_impacts[idx_plus]) and not np.isnan(theta_impacts[idx_minus]):
-                # Variation absolue de θ entre les deux points
-                delta_theta = theta_impacts[idx_plus] - theta_impacts[idx_minus]
-                # Variation relative du paramètre (en fraction, pas %)
-                delta_pct = (variation_pct[idx_plus] - variation_pct[idx_minus]) / 100
-
-                # Élasticité = variation relative de θ / variation relative du paramètre
-                # Exemple: si θ varie de 2% quand paramètre varie de 10%, ε = (0.02/θ) / (0.10/p) ≈ 0.2
-                theta_elasticity = (delta_theta / theta_baseline) / delta_pct if (delta_pct != 0 and theta_baseline != 0) else 0.0
-            else:
-                theta_elasticity = 0.0  # Données invalides
-
-            # Calcul élasticité Gini (même logique)
-            if not np.isnan(gini_impacts[idx_plus]) and not np.isnan(gini_impacts[idx_minus]) and gini_baseline != 0:
-                delta_gini = gini_impacts[idx_plus] - gini_impacts[idx_minus]
-                delta_pct = (variation_pct[idx_plus] - variation_pct[idx_minus]) / 100
-                gini_elasticity = (delta_gini / gini_baseline) / delta_pct if delta_pct != 0 else 0.0
-            else:
-                gini_elasticity = 0.0
+        # Élasticité locale au point baseline (_baseline_elasticities) : pente
+        # par différences finies sur la grille triée des variations, ramenée
+        # en variation relative. Sur une grille symétrique, la pente au
+        # baseline est celle des deux voisins ±x%
+        # Exemple: si θ varie de 2% quand paramètre varie de 10%, ε = (0.02/θ) / (0.10/p) ≈ 0.2
+        # Validité centralisée dans le noyau : impact ou baseline NaN (variation
+        # sans run réussi) → élasticité non finie → 0, pour θ comme pour Gini
+        if len(variation_pct) >= 3:
+            pct_arr = np.asarray(variation_pct, dtype=np.float64)
+            order = np.argsort(pct_arr, kind='stable')
+            impacts = np.ascontiguousarray(
+                np.array([theta_impacts, gini_impacts], dtype=np.float64)[:, order])
+            baselines = np.array([theta_baseline, gini_baseline], dtype=np.float64)
+            theta_elasticity, gini_elasticity = _baseline_elasticities(
+                np.ascontiguousarray(pct_arr[order]), impacts,
+                int(np.flatnonzero(order == theta_baseline_idx)[0]), baselines).tolist()
         else:
-            # Pas assez de points ou baseline invalide
+            # Pas assez de points
             theta_elasticity = 0.0
             gini_elasticity = 0.0
 
         results = SensitivityResults(
             parameter_name=parameter_name,
             baseline_value=baseline_value,
-            variations=[baseline_value * (1 + p/100) for p in variation_pct],
+            variations=new_values,
             theta_impacts=theta_impacts,
             theta_elasticity=theta_elasticity,
             gini_impacts=gini_impacts,
@@ -724,12 +1154,12 @@ class IRISValidator:
         )
 
         if verbose:
-            print(f"\n{'='*80}")
+            print(f"\n{_BANNER}")
             print(f"RÉSULTATS SENSITIVITY ANALYSIS")
-            print(f"{'='*80}")
+            print(f"{_BANNER}")
             print(f"\nÉlasticité θ : {theta_elasticity:.4f}")
             print(f"Élasticité Gini : {gini_elasticity:.4f}")
-            print(f"{'='*80}\n")
+            print(f"{_BANNER}\n")
 
         # Sauvegarde
         self._save_sensitivity_results(results)
@@ -739,8 +1169,7 @@ class IRISValidator:
     def _save_sensitivity_results(self, results: SensitivityResults) -> None:
         """Sauvegarde les résultats d'analyse de sensibilité"""
         output_path = self.output_dir / f"sensitivity_{results.parameter_name}.json"
-        with open(output_path, 'w') as f:
-            json.dump(results.to_dict(), f, indent=2)
+        _dump_json(results.to_dict(), output_path)
         print(f"✅ Résultats sauvegardés: {output_path}")
 
     def kolmogorov_smirnov_test(self,
@@ -765,35 +1194,54 @@ class IRISValidator:
         Returns:
             Dict avec résultats du test
         """
-        # Collecte toutes les valeurs finales de θ
-        theta_finals = []
-        for history in monte_carlo_results.all_theta_histories:
-            if len(history) > 0:
-                theta_finals.append(history[-1])
-
-        theta_finals = np.array(theta_finals)
+        # Valeurs finales de θ (une par run réussi) ; à défaut (résultats
+        # construits sans theta_finals), dernière valeur renseignée de chaque
+        # ligne de la matrice des historiques, lue en un seul gather
+        theta_finals = monte_carlo_results.theta_finals
+        if theta_finals.size == 0:
+            histories = monte_carlo_results.all_theta_histories
+            lengths = np.count_nonzero(~np.isnan(histories), axis=1)
+            rows = np.flatnonzero(lengths)
+            theta_finals = histories[rows, lengths[rows] - 1].astype(np.float64)
+            sorted_finals = np.sort(theta_finals)
+        else:
+            # Échantillon trié une fois par jeu de résultats : kstest le retrie
+            # (quasi gratuit sur une entrée déjà triée) à chaque appel
+            sorted_finals = monte_carlo_results.sorted_theta_finals()
 
         # Test KS
         if target_distribution == "normal":
-            # Test contre normale (μ=mean, σ=std)
-            ks_stat, p_value = stats.kstest(
-                theta_finals,
-                lambda x: stats.norm.cdf(x, monte_carlo_results.theta_mean, monte_carlo_results.theta_std)
-            )
+            # Test contre normale (μ=mean, σ=std) : la CDF de la loi figée est
+            # évaluée en un appel vectorisé sur l'échantillon trié
+            target = _frozen_normal(float(monte_carlo_results.theta_mean),
+                                    float(monte_carlo_results.theta_std))
+            ks_stat, p_value = stats.kstest(sorted_finals, target.cdf)
         elif target_distribution == "uniform":
             # Test contre uniforme
             ks_stat, p_value = stats.kstest(
-                theta_finals,
+                sorted_finals,
                 'uniform'
             )
         else:
             raise ValueError(f"Distribution '{target_distribution}' non supportée")
 
-        # Test de normalité (Shapiro-Wilk)
-        if len(theta_finals) <= 5000:  # Shapiro-Wilk limité à 5000 échantillons
-            shapiro_stat, shapiro_p = stats.shapiro(theta_finals)
+        # Test de normalité (Shapiro-Wilk), limité à SHAPIRO_MAX_SAMPLES
+        # échantillons : au-delà, sur un sous-échantillon tiré sans remise
+        # (générateur à graine fixe, résultat reproductible)
+        shapiro_subsampled = len(theta_finals) > SHAPIRO_MAX_SAMPLES
+        if target_distribution == "normal" and p_value < KS_HARD_REJECTION_P:
+            # Le KS contre la normale rejette déjà massivement H0 :
+            # Shapiro-Wilk ne changerait pas la conclusion, on l'omet
+            shapiro_stat, shapiro_p, shapiro_subsampled = None, None, False
+            normality_conclusion = 'NON-NORMAL'
         else:
-            shapiro_stat, shapiro_p = None, None
+            if shapiro_subsampled:
+                shapiro_sample = np.random.default_rng(0).choice(
+                    theta_finals, size=SHAPIRO_MAX_SAMPLES, replace=False)
+            else:
+                shapiro_sample = theta_finals
+            shapiro_stat, shapiro_p = stats.shapiro(shapiro_sample)
+            normality_conclusion = 'NORMAL' if shapiro_p > 0.05 else 'NON-NORMAL'
 
         results = {
             'distribution': target_distribution,
@@ -802,13 +1250,14 @@ class IRISValidator:
             'ks_p_value': p_value,
             'shapiro_statistic': shapiro_stat,
             'shapiro_p_value': shapiro_p,
-            'normality_conclusion': 'NORMAL' if (shapiro_p is not None and shapiro_p > 0.05) else 'NON-NORMAL' if shapiro_p is not None else 'UNKNOWN'
+            'shapiro_subsampled': shapiro_subsampled,
+            'normality_conclusion': normality_conclusion
         }
 
         if verbose:
-            print(f"\n{'='*80}")
+            print(f"\n{_BANNER}")
             print(f"KOLMOGOROV-SMIRNOV TEST")
-            print(f"{'='*80}")
+            print(f"{_BANNER}")
             print(f"\nDistribution cible : {target_distribution}")
             print(f"Nombre d'échantillons : {len(theta_finals)}")
             print(f"\nTest KS:")
@@ -817,18 +1266,22 @@ class IRISValidator:
             print(f"  - Conclusion : {'Accepte H0 (suit la distribution)' if p_value > 0.05 else 'Rejette H0 (ne suit pas la distribution)'}")
 
             if shapiro_stat is not None:
-                print(f"\nTest Shapiro-Wilk (normalité):")
+                print(f"\nTest Shapiro-Wilk (normalité)"
+                      f"{f' sur {SHAPIRO_MAX_SAMPLES} échantillons tirés' if shapiro_subsampled else ''}:")
                 print(f"  - Statistique : {shapiro_stat:.4f}")
                 print(f"  - p-value : {shapiro_p:.4f}")
                 print(f"  - Conclusion : {results['normality_conclusion']}")
-            print(f"{'='*80}\n")
+            else:
+                print(f"\nTest Shapiro-Wilk omis (KS p < {KS_HARD_REJECTION_P:g}) : "
+                      f"{results['normality_conclusion']}")
+            print(f"{_BANNER}\n")
 
         return results
 
     def generate_validation_report(
         self,
         mc_path: str = "validation_results/monte_carlo_results.json",
-        sens_path: str = "validation_results/sensitivity_eta_alpha.json",
+        sens_path: str = "validation_results/sensitivity_alpha_eta.json",
         output_path: str = "validation_results/VALIDATION_IRIS.md"
     ) -> str:
         """
@@ -845,14 +1298,11 @@ class IRISValidator:
         Returns:
             str: Chemin du fichier généré
         """
-        import os
-
         # ==================================================================================
         # CHARGEMENT DES DONNÉES MONTE CARLO
         # ==================================================================================
         try:
-            with open(mc_path, 'r', encoding='utf-8') as f:
-                mc_data = json.load(f)
+            mc_data = _load_json(mc_path)
         except FileNotFoundError:
             raise FileNotFoundError(
                 f"Fichier Monte Carlo non trouvé: {mc_path}\n"
@@ -863,8 +1313,7 @@ class IRISValidator:
         # CHARGEMENT DES DONNÉES DE SENSIBILITÉ
         # ==================================================================================
         try:
-            with open(sens_path, 'r', encoding='utf-8') as f:
-                sens_data = json.load(f)
+            sens_data = _load_json(sens_path)
         except FileNotFoundError:
             raise FileNotFoundError(
                 f"Fichier de sensibilité non trouvé: {sens_path}\n"
@@ -884,6 +1333,15 @@ class IRISValidator:
         eta = mc_data['eta']
         stability = mc_data['stability']
 
+        # Valeurs lues plusieurs fois dans le rapport, extraites une fois
+        initial_agents = param_config.get('initial_agents', 'N/A')
+        enable_demographics = param_config.get('enable_demographics', False)
+        enable_catastrophes = param_config.get('enable_catastrophes', False)
+        theta_mean = theta['mean']
+        crash_rate = stability['crash_rate']
+        convergence_rate = stability['convergence_rate']
+        oscillation_amplitude = stability['oscillation_amplitude']
+
         # ==================================================================================
         # EXTRACTION DES MÉTRIQUES DE SENSIBILITÉ
         # ==================================================================================
@@ -893,6 +1351,8 @@ class IRISValidator:
         theta_sens = sens_data['theta']
         gini_sens = sens_data['gini']
         stability_sens = sens_data.get('stability', {})
+        theta_elasticity = theta_sens['elasticity']
+        gini_elasticity = gini_sens['elasticity']
 
         # ==================================================================================
         # CONSTRUCTION DU RAPPORT MARKDOWN
@@ -915,9 +1375,9 @@ class IRISValidator:
         report_lines.append(f"- **Nombre de runs Monte Carlo** : {n_runs}")
         report_lines.append(f"- **Nombre de pas par run** : {steps_per_run}")
         report_lines.append(f"- **Paramètres de base** :")
-        report_lines.append(f"  - `initial_agents` : {param_config.get('initial_agents', 'N/A')}")
-        report_lines.append(f"  - `enable_demographics` : {param_config.get('enable_demographics', False)}")
-        report_lines.append(f"  - `enable_catastrophes` : {param_config.get('enable_catastrophes', False)}")
+        report_lines.append(f"  - `initial_agents` : {initial_agents}")
+        report_lines.append(f"  - `enable_demographics` : {enable_demographics}")
+        report_lines.append(f"  - `enable_catastrophes` : {enable_catastrophes}")
         report_lines.append("")
 
         # ==================================================================================
@@ -927,7 +1387,7 @@ class IRISValidator:
         report_lines.append("")
         report_lines.append("### Métriques de performance")
         report_lines.append("")
-        report_lines.append(f"- **θ moyen** : `{theta['mean']:.4f}` (± {theta['std']:.4f})")
+        report_lines.append(f"- **θ moyen** : `{theta_mean:.4f}` (± {theta['std']:.4f})")
         report_lines.append(f"- **Intervalle 95% pour θ** : [`{theta['ci_95'][0]:.4f}` ; `{theta['ci_95'][1]:.4f}`]")
         report_lines.append(f"- **Gini moyen** : `{gini['mean']:.4f}` (± {gini['std']:.4f})")
         report_lines.append(f"- **κ moyen** : `{kappa['mean']:.4f}` (± {kappa['std']:.4f})")
@@ -936,13 +1396,13 @@ class IRISValidator:
 
         report_lines.append("### Métriques de stabilité")
         report_lines.append("")
-        report_lines.append(f"- **Taux de crash** : `{stability['crash_rate']:.2%}`")
-        report_lines.append(f"- **Taux de convergence** : `{stability['convergence_rate']:.2%}`")
-        report_lines.append(f"- **Amplitude d'oscillation** : `{stability['oscillation_amplitude']:.4f}`")
+        report_lines.append(f"- **Taux de crash** : `{crash_rate:.2%}`")
+        report_lines.append(f"- **Taux de convergence** : `{convergence_rate:.2%}`")
+        report_lines.append(f"- **Amplitude d'oscillation** : `{oscillation_amplitude:.4f}`")
         report_lines.append("")
 
         # Message automatique si aucun crash
-        if stability['crash_rate'] == 0:
+        if crash_rate == 0:
             report_lines.append("> ✅ **Aucun crash observé sur l'échantillon Monte Carlo.**  ")
             report_lines.append("> Le modèle est numériquement stable dans cette configuration.")
             report_lines.append("")
@@ -957,16 +1417,22 @@ class IRISValidator:
         report_lines.append(f"- **Variations testées** : `{variations}`")
         report_lines.append("")
 
+        # Préfixe de ligne « valeur (écart %) » calculé une fois pour les trois
+        # tableaux ; lignes formatées par gabarit % (un seul format par ligne)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            pct_changes = ((np.asarray(variations, dtype=np.float64) - baseline) / baseline) * 100
+        value_labels = ["- `%s = %.4f` (%+.1f%%)" % (parameter, variation, pct_change)
+                        for variation, pct_change in zip(variations, pct_changes)]
+
         # Impact sur θ
         report_lines.append("### Impact sur θ (thermomètre)")
         report_lines.append("")
         report_lines.append("**θ moyens simulés pour chaque valeur** :")
         report_lines.append("")
-        for i, (variation, impact) in enumerate(zip(variations, theta_sens['impacts'])):
-            pct_change = ((variation - baseline) / baseline) * 100
-            report_lines.append(f"- `{parameter} = {variation:.4f}` ({pct_change:+.1f}%) → θ = `{impact:.4f}`")
+        report_lines.extend("%s → θ = `%.4f`" % row
+                            for row in zip(value_labels, theta_sens['impacts']))
         report_lines.append("")
-        report_lines.append(f"**Élasticité de θ par rapport à {parameter}** : `{theta_sens['elasticity']:.4f}`")
+        report_lines.append(f"**Élasticité de θ par rapport à {parameter}** : `{theta_elasticity:.4f}`")
         report_lines.append("")
 
         # Impact sur Gini
@@ -974,11 +1440,10 @@ class IRISValidator:
         report_lines.append("")
         report_lines.append("**Gini moyens simulés pour chaque valeur** :")
         report_lines.append("")
-        for i, (variation, impact) in enumerate(zip(variations, gini_sens['impacts'])):
-            pct_change = ((variation - baseline) / baseline) * 100
-            report_lines.append(f"- `{parameter} = {variation:.4f}` ({pct_change:+.1f}%) → Gini = `{impact:.4f}`")
+        report_lines.extend("%s → Gini = `%.4f`" % row
+                            for row in zip(value_labels, gini_sens['impacts']))
         report_lines.append("")
-        report_lines.append(f"**Élasticité du Gini par rapport à {parameter}** : `{gini_sens['elasticity']:.4f}`")
+        report_lines.append(f"**Élasticité du Gini par rapport à {parameter}** : `{gini_elasticity:.4f}`")
         report_lines.append("")
 
         # Impact sur stabilité
@@ -989,9 +1454,8 @@ class IRISValidator:
             report_lines.append("")
             report_lines.append("_(Plus la variance est faible, plus le système est stable)_")
             report_lines.append("")
-            for i, (variation, impact) in enumerate(zip(variations, stability_sens['impacts'])):
-                pct_change = ((variation - baseline) / baseline) * 100
-                report_lines.append(f"- `{parameter} = {variation:.4f}` ({pct_change:+.1f}%) → Variance(θ) = `{impact:.6f}`")
+            report_lines.extend("%s → Variance(θ) = `%.6f`" % row
+                                for row in zip(value_labels, stability_sens['impacts']))
             report_lines.append("")
 
         # ==================================================================================
@@ -1003,64 +1467,64 @@ class IRISValidator:
         interpretations = []
 
         # Analyse du crash rate
-        if stability['crash_rate'] == 0:
+        if crash_rate == 0:
             interpretations.append(
                 "✅ **Stabilité numérique** : Le modèle IRIS ne présente aucun crash sur "
                 f"l'échantillon Monte Carlo ({n_runs} runs). Le système converge de manière robuste."
             )
-        elif stability['crash_rate'] < 0.05:
+        elif crash_rate < 0.05:
             interpretations.append(
-                f"⚠️ **Stabilité acceptable** : Taux de crash faible ({stability['crash_rate']:.2%}), "
+                f"⚠️ **Stabilité acceptable** : Taux de crash faible ({crash_rate:.2%}), "
                 "le modèle est globalement stable mais quelques simulations ont échoué."
             )
         else:
             interpretations.append(
-                f"❌ **Problème de stabilité** : Taux de crash élevé ({stability['crash_rate']:.2%}). "
+                f"❌ **Problème de stabilité** : Taux de crash élevé ({crash_rate:.2%}). "
                 "Une investigation des paramètres est recommandée."
             )
 
         # Analyse de θ
-        theta_deviation = abs(theta['mean'] - 1.0)
+        theta_deviation = abs(theta_mean - 1.0)
         if theta_deviation < 0.02:
             interpretations.append(
                 f"✅ **Régulation thermodynamique** : Le thermomètre θ reste très proche de 1.0 "
-                f"(moyenne = {theta['mean']:.4f}), indiquant une régulation thermodynamique efficace."
+                f"(moyenne = {theta_mean:.4f}), indiquant une régulation thermodynamique efficace."
             )
         elif theta_deviation < 0.05:
             interpretations.append(
                 f"⚠️ **Régulation modérée** : Le thermomètre θ s'écarte légèrement de 1.0 "
-                f"(moyenne = {theta['mean']:.4f}). Le système tend vers l'équilibre mais avec un léger biais."
+                f"(moyenne = {theta_mean:.4f}). Le système tend vers l'équilibre mais avec un léger biais."
             )
         else:
             interpretations.append(
                 f"❌ **Déséquilibre thermodynamique** : Le thermomètre θ s'écarte significativement "
-                f"de 1.0 (moyenne = {theta['mean']:.4f}). Vérifier les paramètres RAD."
+                f"de 1.0 (moyenne = {theta_mean:.4f}). Vérifier les paramètres RAD."
             )
 
         # Analyse de la sensibilité (Gini)
-        if abs(gini_sens['elasticity']) < 0.1:
+        if abs(gini_elasticity) < 0.1:
             interpretations.append(
                 f"✅ **Faible sensibilité des inégalités** : L'élasticité du Gini par rapport à "
-                f"`{parameter}` est très faible ({gini_sens['elasticity']:.4f}), indiquant que ce "
+                f"`{parameter}` est très faible ({gini_elasticity:.4f}), indiquant que ce "
                 "paramètre n'a pas d'effet majeur sur les inégalités."
             )
-        elif gini_sens['elasticity'] > 0.1:
+        elif gini_elasticity > 0.1:
             interpretations.append(
                 f"⚠️ **Impact sur les inégalités** : L'analyse de sensibilité suggère que "
                 f"`{parameter}` tend à augmenter les inégalités lorsqu'il augmente "
-                f"(élasticité = {gini_sens['elasticity']:.4f})."
+                f"(élasticité = {gini_elasticity:.4f})."
             )
-        elif gini_sens['elasticity'] < -0.1:
+        elif gini_elasticity < -0.1:
             interpretations.append(
                 f"✅ **Réduction des inégalités** : Augmenter `{parameter}` tend à réduire "
-                f"les inégalités (élasticité = {gini_sens['elasticity']:.4f})."
+                f"les inégalités (élasticité = {gini_elasticity:.4f})."
             )
 
         # Analyse de la sensibilité (θ)
-        if abs(theta_sens['elasticity']) < 0.05:
+        if abs(theta_elasticity) < 0.05:
             interpretations.append(
                 f"✅ **Robustesse de θ** : Le thermomètre θ est peu sensible aux variations de "
-                f"`{parameter}` (élasticité = {theta_sens['elasticity']:.4f}), ce qui est souhaitable "
+                f"`{parameter}` (élasticité = {theta_elasticity:.4f}), ce qui est souhaitable "
                 "pour la stabilité du système."
             )
 
@@ -1078,8 +1542,8 @@ class IRISValidator:
         report_lines.append("")
 
         # Décision globale basée sur les métriques clés
-        is_stable = stability['crash_rate'] < 0.05
-        is_converged = stability['convergence_rate'] > 0.9
+        is_stable = crash_rate < 0.05
+        is_converged = convergence_rate > 0.9
         is_balanced = theta_deviation < 0.05
 
         if is_stable and is_converged and is_balanced:
@@ -1112,10 +1576,9 @@ class IRISValidator:
         # Crée les répertoires si nécessaire
         os.makedirs(os.path.dirname(output_path) if os.path.dirname(output_path) else '.', exist_ok=True)
 
-        # Écriture du rapport
-        report_content = "\n".join(report_lines)
-        with open(output_path, 'w', encoding='utf-8') as f:
-            f.write(report_content)
+        # Écriture du rapport : une seule chaîne encodée en UTF-8, écrite en
+        # binaire (pas de passage par le tampon du TextIOWrapper)
+        Path(output_path).write_bytes("\n".join(report_lines).encode('utf-8'))
 
         print(f"✅ Rapport de validation généré: {output_path}")
 
@@ -1131,9 +1594,9 @@ def quick_validation(n_runs: int = 50, steps: int = 100, verbose: bool = True):
         from iris_validation import quick_validation
         quick_validation(n_runs=50, steps=100)
     """
-    print("\n" + "="*80)
+    print("\n" + _BANNER)
     print(" "*20 + "IRIS VALIDATION RAPIDE")
-    print("="*80 + "\n")
+    print(_BANNER + "\n")
 
     validator = IRISValidator()
 
@@ -1141,7 +1604,6 @@ def quick_validation(n_runs: int = 50, steps: int = 100, verbose: bool = True):
     mc_results = validator.run_monte_carlo(
         n_runs=n_runs,
         steps=steps,
-        parallel=False,  # Séquentiel pour éviter pickle issues
         verbose=verbose
     )
 
@@ -1153,9 +1615,9 @@ def quick_validation(n_runs: int = 50, steps: int = 100, verbose: bool = True):
     )
 
     # Résumé final
-    print("\n" + "="*80)
+    print("\n" + _BANNER)
     print(" "*25 + "RÉSUMÉ VALIDATION")
-    print("="*80)
+    print(_BANNER)
     print(f"\nMonte Carlo ({n_runs} runs):")
     print(f"  θ = {mc_results.theta_mean:.4f} ± {mc_results.theta_std:.4f} (IC 95%: [{mc_results.theta_ci_lower:.4f}, {mc_results.theta_ci_upper:.4f}])")
     print(f"  Convergence : {mc_results.convergence_rate*100:.1f}%")
@@ -1163,7 +1625,7 @@ def quick_validation(n_runs: int = 50, steps: int = 100, verbose: bool = True):
     print(f"\nTests statistiques:")
     print(f"  KS p-value : {ks_results['ks_p_value']:.4f} → {'✓ Normal' if ks_results['ks_p_value'] > 0.05 else '✗ Non-normal'}")
     print(f"  Shapiro-Wilk : {ks_results['normality_conclusion']}")
-    print("="*80 + "\n")
+    print(_BANNER + "\n")
 
     return mc_results, ks_results
 
@@ -1178,9 +1640,9 @@ if __name__ == "__main__":
     Génère automatiquement un rapport de validation Markdown à partir des
     résultats JSON existants dans validation_results/
     """
-    print("\n" + "="*80)
+    print("\n" + _BANNER)
     print(" "*20 + "IRIS VALIDATION REPORT GENERATOR")
-    print("="*80 + "\n")
+    print(_BANNER + "\n")
 
     validator = IRISValidator()
 
@@ -1188,14 +1650,14 @@ if __name__ == "__main__":
         # Génère le rapport de validation
         report_path = validator.generate_validation_report()
 
-        print("\n" + "="*80)
+        print("\n" + _BANNER)
         print(f"✅ Rapport de validation généré avec succès!")
         print(f"📄 Fichier: {report_path}")
-        print("="*80 + "\n")
+        print(_BANNER + "\n")
 
     except FileNotFoundError as e:
         print(f"\n❌ Erreur: {e}")
         print("\n💡 Pour générer les fichiers de résultats, lancez d'abord:")
         print("   - validator.run_monte_carlo()")
-        print("   - validator.run_sensitivity_analysis('eta_alpha', 0.5)")
+        print("   - validator.run_sensitivity_analysis('alpha_eta', 0.3)")
         print("\nOu utilisez la fonction quick_validation() pour tout automatiser.\n")
@@ -11,15 +11,23 @@ Usage:
     python -m iris.simulations.experiment_grid
 
 Résultats:
-    results/grid/<scenario_name>/history.csv  (pour chaque scénario)
-    results/grid/summary.csv                   (résumé global)
+    results/grid/<scenario_name>/history.parquet  (pour chaque scénario)
+    results/grid/summary.parquet                   (résumé global)
+
+    Parquet (compression zstd) si pyarrow est installé, CSV sinon
+    (history.csv, summary.csv).
 """
 
 import os
 import sys
+import io
+import contextlib
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
-from typing import Dict, List, Any, Tuple
+from typing import Dict, List, Any, Optional, Tuple
 from dataclasses import dataclass
+from functools import lru_cache
 import itertools
 import time
 from datetime import datetime
@@ -29,6 +37,7 @@ import pandas as pd
 
 # Import IRIS
 from iris.core import IRISEconomy
+from iris.utils import gini_sorted
 
 # Import visualizer si disponible
 try:
@@ -38,15 +47,31 @@ except ImportError:
     VISUALIZER_AVAILABLE = False
     print("⚠ IRISVisualizer non disponible - visualisations désactivées")
 
+# Parquet si pyarrow est disponible (colonnes binaires typées), sinon CSV
+try:
+    import pyarrow  # noqa: F401
+    PARQUET_AVAILABLE = True
+except ImportError:
+    PARQUET_AVAILABLE = False
+
+# Extension des tableaux de résultats (historiques, résumé global)
+TABLE_SUFFIX = ".parquet" if PARQUET_AVAILABLE else ".csv"
 
-@dataclass
+
+@dataclass(frozen=True)
 class ExperimentConfig:
-    """Configuration d'une expérience unique."""
+    """Configuration d'une expérience unique (immuable, hashable)."""
     initial_agents: int
     enable_catastrophes: bool
     conservation_rate: float
     seed: int
     steps: int
+    # Période de calcul du Gini (cycles) ; valeur reportée entre deux calculs
+    gini_every: int = 12
+
+    def __post_init__(self):
+        if self.gini_every < 1:
+            raise ValueError(f"gini_every doit être >= 1 (reçu : {self.gini_every})")
 
     def to_scenario_name(self) -> str:
         """Génère un nom de scénario lisible."""
@@ -62,16 +87,45 @@ class ExperimentConfig:
             'conservation_rate': self.conservation_rate,
             'seed': self.seed,
             'steps': self.steps,
+            'gini_every': self.gini_every,
             'scenario_name': self.to_scenario_name()
         }
 
 
-def generate_parameter_grid() -> List[ExperimentConfig]:
+# Colonnes de l'historique d'une expérience et leur type (history.parquet).
+# Indicateurs sans dimension (θ, κ, η, Gini) en float32, suffisant pour
+# l'analyse a posteriori ; stocks monétaires en float64 pour conserver la
+# vérification V = D ; comptes d'événements par cycle en int16
+HISTORY_COLUMNS: Dict[str, type] = {
+    'time': np.int32,
+    'thermometer': np.float32,
+    'indicator': np.float32,
+    'kappa': np.float32,
+    'eta': np.float32,
+    'population': np.int32,
+    'total_V': np.float64,
+    'total_U': np.float64,
+    'total_D': np.float64,
+    'V_on': np.float64,
+    'gini_coefficient': np.float32,
+    'catastrophes': np.int16,
+    'births': np.int16,
+    'deaths': np.int16,
+    'C2_activated': np.bool_,
+    'C3_activated': np.bool_,
+}
+
+
+@lru_cache(maxsize=None)
+def generate_parameter_grid() -> Tuple[ExperimentConfig, ...]:
     """
     Génère la grille complète de paramètres à tester.
 
+    La grille est constante : elle est construite une fois puis mise en
+    cache (tuple de configurations immuables, partageable sans copie).
+
     Returns:
-        Liste de configurations d'expériences
+        Configurations d'expériences
     """
     # Définition de la grille
     param_grid = {
@@ -82,18 +136,10 @@ def generate_parameter_grid() -> List[ExperimentConfig]:
         'steps': [600, 1200]  # 50 ans ou 100 ans
     }
 
-    # Génération de toutes les combinaisons
-    keys = param_grid.keys()
-    values = param_grid.values()
-    combinations = list(itertools.product(*values))
-
-    # Conversion en ExperimentConfig
-    configs = []
-    for combo in combinations:
-        config_dict = dict(zip(keys, combo))
-        configs.append(ExperimentConfig(**config_dict))
-
-    return configs
+    # Toutes les combinaisons, passées en positionnel (ordre des clés =
+    # ordre des champs de ExperimentConfig)
+    return tuple(ExperimentConfig(*combo)
+                 for combo in itertools.product(*param_grid.values()))
 
 
 def run_single_experiment(config: ExperimentConfig, output_dir: Path) -> Dict[str, Any]:
@@ -135,25 +181,13 @@ def run_single_experiment(config: ExperimentConfig, output_dir: Path) -> Dict[st
             seed=config.seed
         )
 
-        # Initialisation de l'historique
-        history: Dict[str, List] = {
-            'time': [],
-            'thermometer': [],
-            'indicator': [],
-            'kappa': [],
-            'eta': [],
-            'population': [],
-            'total_V': [],
-            'total_U': [],
-            'total_D': [],
-            'V_on': [],
-            'gini_coefficient': [],
-            'catastrophes': [],
-            'births': [],
-            'deaths': [],
-            'C2_activated': [],
-            'C3_activated': []
+        # Initialisation de l'historique : une colonne NumPy préallouée de
+        # longueur config.steps par série, remplie à l'indice du cycle
+        history: Dict[str, np.ndarray] = {
+            key: np.empty(config.steps, dtype=dtype)
+            for key, dtype in HISTORY_COLUMNS.items()
         }
+        history['time'] = np.arange(config.steps, dtype=HISTORY_COLUMNS['time'])
 
         # Simulation
         print(f"  Simulation en cours...")
@@ -167,13 +201,19 @@ def run_single_experiment(config: ExperimentConfig, output_dir: Path) -> Dict[st
             theta = model.thermometer()
             indicator = model.indicator()
             V_on = model.get_V_on()
-            total_V = sum(a.V_balance for a in model.agents.values())
-            total_U = sum(a.U_balance for a in model.agents.values())
+            # Soldes extraits une fois par cycle en colonnes NumPy (V, U) :
+            # sommes et Gini sont des réductions vectorisées
+            V_balances, U_balances = model.agent_columns()
+            total_V = float(V_balances.sum())
+            total_U = float(U_balances.sum())
             total_D = model.rad.total_D()
             population = len(model.agents)
 
-            # Calcul Gini (inégalité de richesse)
-            gini = calculate_gini_coefficient(model)
+            # Calcul Gini (inégalité de richesse) : tri O(N log N), fait en fin
+            # de chaque période de config.gini_every cycles (ainsi qu'au premier
+            # et au dernier cycle) ; entre deux calculs, la valeur est reportée
+            if t == 0 or (t + 1) % config.gini_every == 0 or t == config.steps - 1:
+                gini = calculate_gini_coefficient(model, V_balances + U_balances)
 
             # Récupération stats du cycle
             catastrophes_this_cycle = getattr(model, '_catastrophes_this_step', 0)
@@ -183,22 +223,21 @@ def run_single_experiment(config: ExperimentConfig, output_dir: Path) -> Dict[st
             C3_activated = getattr(model, '_C3_activated', False)
 
             # Enregistrement
-            history['time'].append(t)
-            history['thermometer'].append(theta)
-            history['indicator'].append(indicator)
-            history['kappa'].append(model.rad.kappa)
-            history['eta'].append(model.rad.eta)
-            history['population'].append(population)
-            history['total_V'].append(total_V)
-            history['total_U'].append(total_U)
-            history['total_D'].append(total_D)
-            history['V_on'].append(V_on)
-            history['gini_coefficient'].append(gini)
-            history['catastrophes'].append(catastrophes_this_cycle)
-            history['births'].append(births_this_cycle)
-            history['deaths'].append(deaths_this_cycle)
-            history['C2_activated'].append(C2_activated)
-            history['C3_activated'].append(C3_activated)
+            history['thermometer'][t] = theta
+            history['indicator'][t] = indicator
+            history['kappa'][t] = model.rad.kappa
+            history['eta'][t] = model.rad.eta
+            history['population'][t] = population
+            history['total_V'][t] = total_V
+            history['total_U'][t] = total_U
+            history['total_D'][t] = total_D
+            history['V_on'][t] = V_on
+            history['gini_coefficient'][t] = gini
+            history['catastrophes'][t] = catastrophes_this_cycle
+            history['births'][t] = births_this_cycle
+            history['deaths'][t] = deaths_this_cycle
+            history['C2_activated'][t] = C2_activated
+            history['C3_activated'][t] = C3_activated
 
             # Affichage progression (tous les 12 mois)
             if (t + 1) % 12 == 0:
@@ -211,14 +250,13 @@ def run_single_experiment(config: ExperimentConfig, output_dir: Path) -> Dict[st
 
         # Sauvegarde de l'historique complet
         df_history = pd.DataFrame(history)
-        history_path = scenario_dir / "history.csv"
-        df_history.to_csv(history_path, index=False)
+        history_path = save_table(df_history, scenario_dir / "history")
         print(f"  ✓ Historique sauvegardé: {history_path}")
 
         # Calcul des résumés numériques
-        theta_values = np.array(history['thermometer'])
-        gini_values = np.array(history['gini_coefficient'])
-        catastrophes_values = np.array(history['catastrophes'])
+        theta_values = history['thermometer']
+        gini_values = history['gini_coefficient']
+        catastrophes_values = history['catastrophes']
 
         summary = {
             # Métadonnées
@@ -228,17 +266,18 @@ def run_single_experiment(config: ExperimentConfig, output_dir: Path) -> Dict[st
             'conservation_rate': config.conservation_rate,
             'seed': config.seed,
             'steps': config.steps,
+            'gini_every': config.gini_every,
 
             # Thermomètre
-            'theta_mean': float(np.mean(theta_values)),
-            'theta_std': float(np.std(theta_values)),
+            'theta_mean': float(np.mean(theta_values, dtype=np.float64)),
+            'theta_std': float(np.std(theta_values, dtype=np.float64)),
             'theta_final': float(theta_values[-1]),
             'theta_min': float(np.min(theta_values)),
             'theta_max': float(np.max(theta_values)),
 
             # Gini
-            'gini_mean': float(np.mean(gini_values)),
-            'gini_std': float(np.std(gini_values)),
+            'gini_mean': float(np.mean(gini_values, dtype=np.float64)),
+            'gini_std': float(np.std(gini_values, dtype=np.float64)),
             'gini_final': float(gini_values[-1]),
 
             # Catastrophes
@@ -246,13 +285,13 @@ def run_single_experiment(config: ExperimentConfig, output_dir: Path) -> Dict[st
             'catastrophes_mean': float(np.mean(catastrophes_values)),
 
             # Population
-            'population_initial': history['population'][0],
-            'population_final': history['population'][-1],
+            'population_initial': int(history['population'][0]),
+            'population_final': int(history['population'][-1]),
             'population_mean': float(np.mean(history['population'])),
 
             # Régulation
-            'kappa_mean': float(np.mean(history['kappa'])),
-            'eta_mean': float(np.mean(history['eta'])),
+            'kappa_mean': float(np.mean(history['kappa'], dtype=np.float64)),
+            'eta_mean': float(np.mean(history['eta'], dtype=np.float64)),
             'C2_activations': int(np.sum(history['C2_activated'])),
             'C3_activations': int(np.sum(history['C3_activated'])),
 
@@ -288,16 +327,59 @@ def run_single_experiment(config: ExperimentConfig, output_dir: Path) -> Dict[st
             'conservation_rate': config.conservation_rate,
             'seed': config.seed,
             'steps': config.steps,
+            'gini_every': config.gini_every,
             'error': str(e)
         }
 
 
-def calculate_gini_coefficient(model: IRISEconomy) -> float:
+def save_table(df: pd.DataFrame, path: Path) -> Path:
+    """
+    Sauvegarde un tableau de résultats en Parquet (zstd) ou, sans pyarrow, en CSV
+
+    Args:
+        df: Tableau à sauvegarder
+        path: Chemin sans extension (TABLE_SUFFIX est ajouté)
+
+    Returns:
+        Chemin du fichier écrit
+    """
+    path = path.with_suffix(TABLE_SUFFIX)
+    if PARQUET_AVAILABLE:
+        df.to_parquet(path, index=False, compression="zstd")
+    else:
+        df.to_csv(path, index=False)
+    return path
+
+
+def _run_one(config: ExperimentConfig, output_dir: Path) -> Tuple[Dict[str, Any], str, str]:
+    """
+    Worker de processus : exécute une expérience et capture sa sortie console
+
+    Les affichages du scénario sont rendus d'un bloc par le processus parent,
+    ce qui évite l'entrelacement des lignes de plusieurs scénarios parallèles.
+    Les erreurs (traceback) sont capturées à part et renvoyées sur stderr.
+
+    Returns:
+        (résumé de l'expérience, sortie standard, sortie d'erreur)
+    """
+    out, err = io.StringIO(), io.StringIO()
+    with contextlib.redirect_stdout(out), contextlib.redirect_stderr(err):
+        summary = run_single_experiment(config, output_dir)
+    return summary, out.getvalue(), err.getvalue()
+
+
+def calculate_gini_coefficient(model: IRISEconomy,
+                               wealth: Optional[np.ndarray] = None) -> float:
     """
     Calcule le coefficient de Gini pour mesurer l'inégalité de richesse.
 
+    Forme triée d'Allison : tri puis une seule passe (gini_sorted, compilé
+    par Numba s'il est installé). Le tableau de richesses est trié sur place.
+
     Args:
         model: Instance IRISEconomy
+        wealth: Richesse (V + U) de chaque agent si déjà extraite, tableau
+            temporaire (défaut : model.total_wealth_array())
 
     Returns:
         Coefficient de Gini (0 = égalité parfaite, 1 = inégalité totale)
@@ -306,29 +388,30 @@ def calculate_gini_coefficient(model: IRISEconomy) -> float:
         return 0.0
 
     # Richesse de chaque agent (V + U)
-    wealth = np.array([agent.V_balance + agent.U_balance for agent in model.agents.values()])
-
-    # Si tout le monde a 0, Gini = 0
-    if np.sum(wealth) == 0:
-        return 0.0
+    if wealth is None:
+        wealth = model.total_wealth_array()
 
-    # Tri croissant
-    sorted_wealth = np.sort(wealth)
-    n = len(sorted_wealth)
+    # Tri croissant, puis 2 × Σ(rang × richesse) / (n × total) - (n+1)/n
+    # (0.0 si tout le monde a 0)
+    wealth.sort()
+    return float(gini_sorted(wealth))
 
-    # Formule du Gini
-    cumsum = np.cumsum(sorted_wealth)
-    gini = (2.0 * np.sum((np.arange(1, n + 1)) * sorted_wealth)) / (n * np.sum(sorted_wealth)) - (n + 1) / n
 
-    return float(gini)
-
-
-def run_all_grid(output_dir: Path = Path("results/grid")) -> pd.DataFrame:
+def run_all_grid(output_dir: Path = Path("results/grid"),
+                 parallel: bool = True,
+                 max_workers: Optional[int] = None) -> pd.DataFrame:
     """
     Lance toutes les expériences de la grille de paramètres.
 
+    Les expériences sont indépendantes (graine, paramètres et répertoire de
+    sortie propres) : en mode parallèle, elles sont réparties sur plusieurs
+    processus (contexte 'spawn', qui évite d'hériter de l'état BLAS/threads
+    du parent). Le résumé conserve l'ordre de la grille.
+
     Args:
         output_dir: Répertoire racine pour les résultats
+        parallel: Exécution multi-processus
+        max_workers: Nombre de processus (défaut : os.cpu_count())
 
     Returns:
         DataFrame avec résumé de tous les scénarios
@@ -349,13 +432,28 @@ def run_all_grid(output_dir: Path = Path("results/grid")) -> pd.DataFrame:
     print(f"{'#'*80}\n")
 
     # Lancement de toutes les expériences
-    summaries = []
+    summaries: List[Optional[Dict[str, Any]]] = [None] * total_experiments
     start_time_global = time.time()
 
-    for i, config in enumerate(configs):
-        print(f"\n[{i+1}/{total_experiments}] ", end="")
-        summary = run_single_experiment(config, output_dir)
-        summaries.append(summary)
+    if parallel and total_experiments > 1:
+        n_workers = min(max_workers or os.cpu_count() or 1, total_experiments)
+        print(f"Exécution parallèle sur {n_workers} processus...")
+        ctx = multiprocessing.get_context('spawn')
+        with ProcessPoolExecutor(max_workers=n_workers, mp_context=ctx) as executor:
+            futures = {executor.submit(_run_one, config, output_dir): i
+                       for i, config in enumerate(configs)}
+            # Progression : compteur incrémenté à chaque expérience terminée
+            for done, future in enumerate(as_completed(futures), start=1):
+                summary, output, errors = future.result()
+                summaries[futures[future]] = summary
+                print(f"\n[{done}/{total_experiments}] ", end="")
+                print(output, end="", flush=True)
+                if errors:
+                    print(errors, end="", file=sys.stderr, flush=True)
+    else:
+        for i, config in enumerate(configs):
+            print(f"\n[{i+1}/{total_experiments}] ", end="")
+            summaries[i] = run_single_experiment(config, output_dir)
 
     elapsed_global = time.time() - start_time_global
 
@@ -363,8 +461,7 @@ def run_all_grid(output_dir: Path = Path("results/grid")) -> pd.DataFrame:
     df_summary = pd.DataFrame(summaries)
 
     # Sauvegarde du résumé global
-    summary_path = output_dir / "summary.csv"
-    df_summary.to_csv(summary_path, index=False)
+    summary_path = save_table(df_summary, output_dir / "summary")
 
     print(f"\n{'='*80}")
     print(f"EXPÉRIENCES TERMINÉES")
@@ -464,7 +561,7 @@ def main():
 
     print("✅ Toutes les expériences sont terminées.")
     print(f"📁 Résultats disponibles dans: {output_dir.absolute()}")
-    print(f"📊 Résumé global: {output_dir / 'summary.csv'}")
+    print(f"📊 Résumé global: {output_dir / ('summary' + TABLE_SUFFIX)}")
 
 
 if __name__ == "__main__":
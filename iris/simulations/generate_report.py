@@ -19,17 +19,20 @@ import numpy as np
 
 def generate_markdown_report(summary_path: Path, output_path: Optional[Path] = None) -> str:
     """
-    Génère un rapport Markdown à partir du fichier summary.csv.
+    Génère un rapport Markdown à partir du fichier summary.parquet ou summary.csv.
 
     Args:
-        summary_path: Chemin vers summary.csv
+        summary_path: Chemin vers summary.parquet ou summary.csv
         output_path: Chemin de sortie (optionnel, par défaut: rapport.md à côté du summary)
 
     Returns:
         Contenu du rapport en Markdown
     """
     # Lecture du summary
-    df = pd.read_csv(summary_path)
+    if summary_path.suffix == ".parquet":
+        df = pd.read_parquet(summary_path)
+    else:
+        df = pd.read_csv(summary_path)
 
     # Chemin de sortie par défaut
     if output_path is None:
@@ -332,10 +335,13 @@ def main():
         sys.exit(1)
 
     results_dir = Path(sys.argv[1])
-    summary_path = results_dir / "summary.csv"
+    # Résumé Parquet de préférence (types conservés), sinon CSV
+    summary_path = results_dir / "summary.parquet"
+    if not summary_path.exists():
+        summary_path = results_dir / "summary.csv"
 
     if not summary_path.exists():
-        print(f"❌ Fichier summary.csv introuvable: {summary_path}")
+        print(f"❌ Aucun fichier summary.parquet ni summary.csv dans {results_dir}")
         sys.exit(1)
 
     print(f"📊 Génération du rapport d'analyse...")
@@ -39,18 +39,24 @@ class IRISPlotAnalysis:
         Initialise l'analyseur de graphiques.
 
         Args:
-            results_dir: Répertoire contenant summary.csv
+            results_dir: Répertoire contenant summary.parquet ou summary.csv
         """
         self.results_dir = Path(results_dir)
-        self.summary_path = self.results_dir / "summary.csv"
+        # Résumé Parquet de préférence (types conservés), sinon CSV
+        self.summary_path = self.results_dir / "summary.parquet"
+        if not self.summary_path.exists():
+            self.summary_path = self.results_dir / "summary.csv"
         self.plots_dir = self.results_dir / "plots"
         self.plots_dir.mkdir(exist_ok=True)
 
         # Chargement des données
         if not self.summary_path.exists():
-            raise FileNotFoundError(f"Fichier summary.csv introuvable: {self.summary_path}")
+            raise FileNotFoundError(f"Aucun fichier summary.parquet ni summary.csv dans {self.results_dir}")
 
-        self.df = pd.read_csv(self.summary_path)
+        if self.summary_path.suffix == ".parquet":
+            self.df = pd.read_parquet(self.summary_path)
+        else:
+            self.df = pd.read_csv(self.summary_path)
         print(f"✓ Chargé {len(self.df)} scénarios depuis {self.summary_path}")
 
     def plot_all(self) -> None:
@@ -0,0 +1,68 @@
+"""
+Tests de réinitialisation et d'historique préalloué d'IRISEconomy
+=================================================================
+
+Vérifie que :
+1. reset(seed) rejoue exactement la trajectoire d'une économie neuve
+2. freeze_regulation laisse κ et η à leur valeur initiale
+3. les tampons d'historique s'agrandissent au-delà de steps_hint
+"""
+
+import numpy as np
+import pytest
+
+from iris.core import IRISEconomy
+
+N_AGENTS = 20
+STEPS = 15
+N_TRANSACTIONS = 5
+
+
+def _economy(**kwargs) -> IRISEconomy:
+    """Petite économie de test (20 agents)"""
+    return IRISEconomy(initial_agents=N_AGENTS, **kwargs)
+
+
+@pytest.mark.unit
+def test_reset_reproduces_fresh_trajectory():
+    """reset(seed) ≡ IRISEconomy(..., seed=seed) neuf"""
+    fresh = _economy(seed=7, steps_hint=STEPS)
+    fresh.simulate(steps=STEPS, n_transactions=N_TRANSACTIONS)
+
+    reused = _economy(seed=1, steps_hint=STEPS)
+    reused.simulate(steps=STEPS, n_transactions=N_TRANSACTIONS)
+    previous_theta = reused.history['thermometer']
+
+    reused.reset(seed=7)
+    reused.simulate(steps=STEPS, n_transactions=N_TRANSACTIONS)
+
+    np.testing.assert_array_equal(np.asarray(reused.history['thermometer']),
+                                  np.asarray(fresh.history['thermometer']))
+    # Tampons réutilisés : l'ancienne vue voit le nouveau run (documenté)
+    assert np.shares_memory(previous_theta, reused.history['thermometer'])
+
+
+@pytest.mark.unit
+def test_freeze_regulation_keeps_kappa_and_eta():
+    """freeze_regulation=True : κ et η ne bougent pas"""
+    economy = _economy(seed=3, freeze_regulation=True)
+    kappa, eta = economy.rad.kappa, economy.rad.eta
+
+    economy.simulate(steps=STEPS, n_transactions=N_TRANSACTIONS)
+
+    assert economy.rad.kappa == kappa
+    assert economy.rad.eta == eta
+
+
+@pytest.mark.unit
+def test_history_grows_past_steps_hint():
+    """Historique plus long que steps_hint : identique à l'historique en listes"""
+    hinted = _economy(seed=5, steps_hint=4)
+    hinted.simulate(steps=STEPS, n_transactions=N_TRANSACTIONS)
+
+    unhinted = _economy(seed=5)
+    unhinted.simulate(steps=STEPS, n_transactions=N_TRANSACTIONS)
+
+    assert len(hinted.history['thermometer']) == STEPS
+    np.testing.assert_array_equal(np.asarray(hinted.history['thermometer']),
+                                  np.asarray(unhinted.history['thermometer']))
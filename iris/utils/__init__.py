@@ -22,6 +22,7 @@ from iris.utils.validation import (
 )
 from iris.utils.math_helpers import (
     safe_gini,
+    gini_sorted,
     safe_std,
     safe_sum,
     check_nan_inf,
@@ -44,6 +45,7 @@ __all__ = [
     "clip_value",
     # Math
     "safe_gini",
+    "gini_sorted",
     "safe_std",
     "safe_sum",
     "check_nan_inf",